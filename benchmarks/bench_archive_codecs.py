@@ -0,0 +1,109 @@
+"""
+Benchmark dos codecs de compactação (ARCHIVE_CODEC).
+
+Compara vazão (MB/s de entrada) e razão de compressão de cada codec
+disponível sobre os PDFs e CSVs gerados pelo pipeline. Sem pastas
+informadas, usa as pastas padrão (config.dirs.pdfs e config.dirs.csv); se
+estiverem vazias, gera dados sintéticos parecidos (PDFs com streams já
+comprimidos e CSVs tabulares).
+
+Uso:
+    python benchmarks/bench_archive_codecs.py [pasta_pdfs] [pasta_csv]
+"""
+
+from dataweaver.scraper.modules import (
+    CodecArchiveCompressor,
+    ParallelZipCompressor,
+    CompressionPolicy,
+    available_codecs,
+)
+from dataweaver.settings import config
+
+from pathlib import Path
+import tempfile
+import shutil
+import random
+import time
+import zlib
+import sys
+import os
+
+
+def build_samples(folder: Path, extension: str, count: int = 8) -> None:
+    """Gera arquivos sintéticos (~2 MB cada) com a extensão informada."""
+    rng = random.Random(42)
+    for i in range(count):
+        if extension == "pdf":
+            # Texto de objetos + streams comprimidos, como em PDFs reais
+            parts = []
+            for j in range(40):
+                parts.append(f"{j} 0 obj << /Length 4096 >> stream\n".encode())
+                parts.append(zlib.compress(rng.randbytes(48_000), 6))
+            data = b"%PDF-1.7\n" + b"\nendstream endobj\n".join(parts)
+        else:
+            rows = [
+                f"{rng.randint(10000, 99999)};PROCEDIMENTO {rng.randint(1, 999)};"
+                f"{rng.choice(['OD', 'AMB', 'HCO', 'HSO'])};{rng.choice(['', 'X'])}\n"
+                for _ in range(50_000)
+            ]
+            data = "".join(rows).encode()
+        (folder / f"amostra_{i}.{extension}").write_bytes(data)
+
+
+def prepare(source: "Path | None", extension: str, workdir: Path) -> Path:
+    """Copia os arquivos reais (ou gera amostras) para uma pasta de trabalho."""
+    folder = workdir / extension
+    folder.mkdir()
+    files = list(source.glob(f"*.{extension}")) if source and source.is_dir() else []
+    for path in files:
+        shutil.copy2(path, folder / path.name)
+    if not files:
+        build_samples(folder, extension)
+    return folder
+
+
+def measure(compressor, folder: Path, name: str, extension: str) -> tuple:
+    """Executa a compactação e retorna (segundos, bytes de saída)."""
+    start = time.perf_counter()
+    compressor.create_zip(name, extension)
+    elapsed = time.perf_counter() - start
+    output = folder / name
+    size = output.stat().st_size
+    output.unlink()
+    return elapsed, size
+
+
+def run(pdfs_dir: "Path | None", csv_dir: "Path | None") -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for extension, source in (("pdf", pdfs_dir), ("csv", csv_dir)):
+            folder = prepare(source, extension, workdir)
+            total = sum(p.stat().st_size for p in folder.glob(f"*.{extension}"))
+            print(f"\n{extension.upper()}: {total / 1024 / 1024:.1f} MB")
+
+            variants = {
+                f"{codec.name}": (
+                    CodecArchiveCompressor(folder, codec),
+                    codec.archive_name("saida.zip"),
+                )
+                for codec in available_codecs()
+            }
+            variants["zip-deflate (paralelo + política)"] = (
+                ParallelZipCompressor(folder, policy=CompressionPolicy()),
+                "saida.zip",
+            )
+            for name, (compressor, archive_name) in variants.items():
+                elapsed, size = measure(compressor, folder, archive_name, extension)
+                print(
+                    f"{name:<36} {total / 1024 / 1024 / elapsed:8.1f} MB/s  "
+                    f"razão {size / total:6.1%}"
+                )
+        print(f"\nCPUs: {os.cpu_count()}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(
+        Path(args[0]) if args else config.dirs.pdfs,
+        Path(args[1]) if len(args) > 1 else config.dirs.csv,
+    )
@@ -0,0 +1,70 @@
+"""
+Benchmark do parsing de páginas de listagem grandes.
+
+Compara o parsing completo com html.parser, o modo parse-only (apenas as tags
+usadas pelas estratégias) e, se instalado, o backend lxml.
+
+Uso:
+    python benchmarks/bench_html_parsing.py [tamanho_em_MB] [repetições]
+"""
+
+from dataweaver.scraper.modules import (
+    HtmlDocumentParser,
+    SinglePassPDFLinkExtractor,
+    AnchorPDFExtractionStrategy,
+    ParagraphPDFExtractionStrategy,
+)
+
+import importlib.util
+import time
+import sys
+
+ROW = (
+    '<tr><td class="col">Item {i}</td><td><span>Atualizado em 01/01/2024</span></td>'
+    '<td><a href="/arquivos/Anexo_{i}.pdf">Anexo {i}</a></td></tr>\n'
+    '<p>Descrição do documento {i} <a href="/arquivos/Outro_{i}.pdf">ver</a></p>\n'
+)
+
+
+def build_page(size_mb: float) -> str:
+    """Gera uma página de listagem com aproximadamente ``size_mb`` megabytes."""
+    rows, i, size = [], 0, 0
+    while size < size_mb * 1024 * 1024:
+        row = ROW.format(i=i)
+        rows.append(row)
+        size += len(row)
+        i += 1
+    return f"<html><body><table>{''.join(rows)}</table></body></html>"
+
+
+def run(size_mb: float = 4.0, repeat: int = 3) -> None:
+    html = build_page(size_mb)
+    extractor = SinglePassPDFLinkExtractor(
+        [AnchorPDFExtractionStrategy("anexo"), ParagraphPDFExtractionStrategy("anexo")]
+    )
+
+    variants = {
+        "html.parser (completo)": HtmlDocumentParser("html.parser"),
+        "html.parser (parse-only)": HtmlDocumentParser(
+            "html.parser", extractor.tag_names
+        ),
+    }
+    if importlib.util.find_spec("lxml") is not None:
+        variants["lxml (completo)"] = HtmlDocumentParser("lxml")
+        variants["lxml (parse-only)"] = HtmlDocumentParser("lxml", extractor.tag_names)
+
+    print(f"Página: {len(html) / 1024 / 1024:.1f} MB, {repeat} repetição(ões)")
+    baseline = None
+    for name, parser in variants.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            links = extractor.extract(parser.parse(html), "https://example.com/")
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"{name:<26} {best:7.2f}s  {baseline / best:5.2f}x  {len(links)} links")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(float(args[0]) if args else 4.0, int(args[1]) if len(args) > 1 else 3)
@@ -1,6 +1,21 @@
 from .table_extractor import TableExtractor
 from .csv_saver import CsvSaver
 from .data_processor import DataProcessor
-from .pdf_extractor import PdfExtractor
+from .pdf_extractor import PdfExtractor, ParallelPdfExtractor
+from .archive_member import ArchiveMember
+from .extraction_cache import ExtractionCache, CachedPdfExtractor
+from .extraction_worker import ExtractionWorker, ExtractionServer, ExtractionClient
 
-__all__ = ["TableExtractor", "CsvSaver", "DataProcessor", "PdfExtractor"]
+__all__ = [
+    "TableExtractor",
+    "CsvSaver",
+    "DataProcessor",
+    "PdfExtractor",
+    "ParallelPdfExtractor",
+    "ArchiveMember",
+    "ExtractionCache",
+    "CachedPdfExtractor",
+    "ExtractionWorker",
+    "ExtractionServer",
+    "ExtractionClient",
+]
@@ -0,0 +1,142 @@
+from dataweaver.scraper.modules.zip_writer import member_data_offset
+
+from typing import TYPE_CHECKING
+import tempfile
+import zipfile
+import shutil
+import mmap
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class ArchiveMember:
+    """Arquivo guardado dentro de um ZIP, lido com acesso aleatório.
+
+    O membro é localizado pelo diretório central, sem percorrer o arquivo:
+        - ``buffer()``: membros STORED são mapeados em memória diretamente do
+          ZIP (sem cópia); membros comprimidos são descomprimidos para um
+          temporário, que então é mapeado.
+        - ``path()``: caminho em disco para ferramentas que exigem um arquivo
+          (ex: tabula/Java); o conteúdo é copiado para um temporário apenas
+          quando este método é chamado.
+
+    Os temporários são removidos em ``close`` (ou ao sair do ``with``); o
+    objeto pode ser reutilizado depois disso.
+    """
+
+    def __init__(
+        self, archive_path: "Path", name: str, spill_dir: "Path | None" = None
+    ) -> None:
+        """Inicializa a referência ao membro.
+
+        Args:
+            archive_path: Caminho do arquivo ZIP
+            name: Nome do membro dentro do ZIP
+            spill_dir: (Opcional) Pasta dos temporários (padrão: a do sistema)
+        """
+        self.archive_path = archive_path
+        self.name = name
+        self.spill_dir = spill_dir
+        self._info: "zipfile.ZipInfo | None" = None
+        self._spill: "str | None" = None
+        self._file = None
+        self._map: "mmap.mmap | None" = None
+        self._view: "memoryview | None" = None
+
+    def __enter__(self) -> "ArchiveMember":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({str(self.archive_path)!r}, {self.name!r})"
+
+    @staticmethod
+    def contains(archive_path: "Path", name: str) -> bool:
+        """Indica se o ZIP existe e contém o membro."""
+        try:
+            with zipfile.ZipFile(archive_path) as archive:
+                archive.getinfo(name)
+                return True
+        except (OSError, KeyError, zipfile.BadZipFile):
+            return False
+
+    @property
+    def info(self) -> zipfile.ZipInfo:
+        """Entrada do diretório central do membro.
+
+        Raises:
+            KeyError: Se o membro não existir no ZIP
+        """
+        if self._info is None:
+            with zipfile.ZipFile(self.archive_path) as archive:
+                self._info = archive.getinfo(self.name)
+        return self._info
+
+    @property
+    def stored(self) -> bool:
+        """True se o membro está sem compressão (pode ser mapeado do próprio ZIP)."""
+        return self.info.compress_type == zipfile.ZIP_STORED
+
+    @property
+    def spilled(self) -> bool:
+        """True se o conteúdo foi copiado para um temporário."""
+        return self._spill is not None
+
+    def buffer(self) -> memoryview:
+        """Retorna o conteúdo do membro como memória mapeada (somente leitura)."""
+        if self._view is None:
+            if self.stored:
+                self._file = open(self.archive_path, "rb")
+                start = member_data_offset(self._file, self.info)
+            else:
+                self._file = open(self.path(), "rb")
+                start = 0
+            if self.info.file_size == 0:
+                self._view = memoryview(b"")
+            else:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._map)[start : start + self.info.file_size]
+        return self._view
+
+    def path(self) -> "Path":
+        """Copia o membro para um temporário (uma única vez) e retorna o caminho."""
+        from pathlib import Path
+
+        if self._spill is None:
+            suffix = os.path.splitext(self.name)[1]
+            fd, spill = tempfile.mkstemp(suffix=suffix, dir=self.spill_dir)
+            try:
+                with os.fdopen(fd, "wb") as output, zipfile.ZipFile(
+                    self.archive_path
+                ) as archive, archive.open(self.info) as source:
+                    # zipfile confere o CRC ao terminar a leitura
+                    shutil.copyfileobj(source, output, 1024 * 1024)
+            except BaseException:
+                os.unlink(spill)
+                raise
+            self._spill = spill
+        return Path(self._spill)
+
+    def close(self) -> None:
+        """Libera o mapeamento e remove os temporários."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # Ainda há fatias do buffer em uso; o mapeamento é liberado pelo GC
+                pass
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._spill is not None:
+            if os.path.exists(self._spill):
+                os.unlink(self._spill)
+            self._spill = None
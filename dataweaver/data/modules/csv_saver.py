@@ -2,8 +2,11 @@ from dataweaver.settings import logger
 from .interfaces import CSVSaverInterface
 
 from typing import TYPE_CHECKING
+import csv
+import os
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pandas import DataFrame
     from pathlib import Path
 
@@ -34,3 +37,72 @@ class CsvSaver(CSVSaverInterface):
         data_frame.to_csv(
             str(self.csv_path), index=False, header=True, encoding="utf-8"
         )
+
+    def save_csv_chunks(self, data_frames: "Iterable[DataFrame]") -> int:
+        """
+        Acrescenta cada DataFrame ao CSV assim que ele chega (streaming).
+
+        As colunas são a união das colunas dos blocos, na ordem em que aparecem
+        (como no ``pd.concat`` do modo sem streaming): colunas ausentes em um
+        bloco ficam vazias e, quando um bloco traz colunas novas, o trecho já
+        gravado é reescrito com o cabeçalho ampliado. O arquivo é escrito em um
+        temporário e só substitui o CSV anterior ao final.
+
+        Parâmetros:
+            data_frames: Blocos a serem gravados, em ordem.
+
+        Retorna:
+            Número de linhas gravadas (0 se não houver blocos; o CSV não é criado).
+        """
+        logger.info("Convertendo tabelas para CSV por blocos...")
+
+        tmp_path = self.csv_path.with_name(f"{self.csv_path.name}.tmp")
+        columns = None
+        rows = 0
+        file = open(tmp_path, "w", encoding="utf-8", newline="")
+        try:
+            for data_frame in data_frames:
+                header = columns is None
+                if header:
+                    columns = list(data_frame.columns)
+                else:
+                    extra = [c for c in data_frame.columns if c not in columns]
+                    if extra:
+                        logger.info(f"Novas colunas no bloco {extra}; ampliando o CSV.")
+                        file.close()
+                        self._add_columns(tmp_path, extra)
+                        columns += extra
+                        file = open(tmp_path, "a", encoding="utf-8", newline="")
+                    data_frame = data_frame.reindex(columns=columns)
+                data_frame.to_csv(file, index=False, header=header)
+                rows += len(data_frame)
+            file.close()
+        except BaseException:
+            file.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if columns is None:
+            tmp_path.unlink(missing_ok=True)
+            return 0
+        os.replace(tmp_path, self.csv_path)
+        return rows
+
+    @staticmethod
+    def _add_columns(path: "Path", extra: list) -> None:
+        """Reescreve o CSV parcial com colunas a mais (vazias nas linhas já gravadas).
+
+        A cópia é feita linha a linha, sem carregar o arquivo em memória.
+        """
+        rewritten = path.with_name(f"{path.name}.cols")
+        with open(path, encoding="utf-8", newline="") as source, open(
+            rewritten, "w", encoding="utf-8", newline=""
+        ) as target:
+            reader = csv.reader(source)
+            writer = csv.writer(target, lineterminator=os.linesep)
+            header = next(reader)
+            writer.writerow(header + [str(column) for column in extra])
+            for row in reader:
+                # Linha vazia: bloco de uma coluna sem valor
+                writer.writerow((row or [""] * len(header)) + [""] * len(extra))
+        os.replace(rewritten, path)
@@ -2,7 +2,12 @@ from dataweaver.errors import TableProcessingError
 from dataweaver.settings import logger
 from .interfaces import DataProcessorInterface
 
+from typing import TYPE_CHECKING
 import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 
 class DataProcessor(DataProcessorInterface):
@@ -11,10 +16,22 @@ class DataProcessor(DataProcessorInterface):
 
     Esta classe realiza o processamento de dados extraídos de tabelas, incluindo a concatenação
     das tabelas e a renomeação das colunas conforme um dicionário de abreviações fornecido.
+
+    A normalização trabalha sobre os valores distintos de cada coluna (categorias), e não
+    célula a célula:
+    - Abreviações são expandidas nos nomes das colunas e nos valores.
+    - Colunas-marcador (ex: "OD", preenchida apenas com "OD") mantêm os valores originais
+      (marcador ou vazio) e viram categóricas.
+    - Colunas de texto com poucos valores distintos viram categóricas; as demais, `string`.
+      O tipo de cada coluna é decidido no primeiro bloco e mantido nos seguintes.
     """
 
+    # Proporção máxima de valores distintos para uma coluna virar categórica
+    CATEGORY_RATIO = 0.5
+
     def __init__(self, abbreviation_dict: dict) -> None:
         self.abbreviation_dict = abbreviation_dict
+        self._dtypes: dict = {}
 
     def process_data(self, tables: list[pd.DataFrame]) -> pd.DataFrame:
         """
@@ -39,7 +56,95 @@ class DataProcessor(DataProcessorInterface):
         try:
             logger.info("Concatenando tabelas...")
             final_df = pd.concat(tables, axis=0)
-            return final_df
         except Exception as e:
             logger.error(f"ERRO na concatenação: {e}")
             raise TableProcessingError(f"Erro ao concatenar tabelas: {e}")
+
+        logger.info("Normalizando colunas...")
+        self._dtypes = {}
+        return self.normalize(final_df)
+
+    def process_chunks(
+        self, chunks: "Iterable[list[pd.DataFrame]]"
+    ) -> "Iterator[pd.DataFrame]":
+        """
+        Processa as tabelas bloco a bloco (streaming), sem concatenar o documento inteiro.
+
+        Parâmetros:
+            chunks: Blocos de tabelas, na ordem das páginas.
+
+        Retorna:
+            Um DataFrame por bloco não vazio.
+
+        Lança:
+            TableProcessingError: Se ocorrer erro durante a concatenação de um bloco.
+        """
+        logger.info("Processando tabelas por blocos...")
+        self._dtypes = {}
+        for tables in chunks:
+            tables = [table for table in tables if not table.empty]
+            if not tables:
+                continue
+            try:
+                chunk_df = pd.concat(tables, axis=0)
+            except Exception as e:
+                logger.error(f"ERRO na concatenação: {e}")
+                raise TableProcessingError(f"Erro ao concatenar tabelas: {e}")
+            yield self.normalize(chunk_df)
+
+    def normalize(self, data_frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Expande as abreviações e converte as colunas de texto para tipos compactos.
+
+        O tipo escolhido para cada coluna é registrado e reaproveitado nas chamadas
+        seguintes, de modo que todos os blocos de um documento tenham os mesmos tipos.
+
+        Parâmetros:
+            data_frame: DataFrame concatenado.
+
+        Retorna:
+            pd.DataFrame: DataFrame com as colunas renomeadas e normalizadas.
+        """
+        original_columns = list(data_frame.columns)
+        result = data_frame.rename(columns=self._expand)
+        for position, name in enumerate(original_columns):
+            column = result.iloc[:, position]
+            if column.dtype == object:
+                result.isetitem(position, self._normalize_column(column, name))
+        return result
+
+    def _expand(self, value: object) -> object:
+        if isinstance(value, str):
+            value = value.strip()
+            return self.abbreviation_dict.get(value, value)
+        return value
+
+    def _normalize_column(self, column: pd.Series, name: object) -> pd.Series:
+        """Normaliza uma coluna de texto operando apenas sobre os valores distintos."""
+        categorical = column.astype("category")
+        categories = categorical.cat.categories
+        if not all(isinstance(value, str) for value in categories):
+            return column  # coluna com tipos mistos: mantida como está
+
+        # Colunas-marcador mantêm o próprio valor; nas demais, expande cada valor
+        # distinto. Vazio vira ausente.
+        is_marker = name in self.abbreviation_dict and {
+            value.strip() for value in categories
+        } <= {name, ""}
+        clean = str.strip if is_marker else self._expand
+        expanded = pd.Index([clean(value) or np.nan for value in categories])
+        inverse, new_categories = pd.factorize(expanded)
+        codes = np.append(inverse, -1)[categorical.cat.codes.to_numpy()]
+        values = pd.Series(
+            pd.Categorical.from_codes(codes, categories=new_categories),
+            index=column.index,
+            name=column.name,
+        )
+
+        dtype = self._dtypes.get(column.name)
+        if dtype is None:
+            present = int((codes >= 0).sum())
+            compact = present and len(new_categories) / present <= self.CATEGORY_RATIO
+            dtype = "category" if is_marker or compact else "string"
+            self._dtypes[column.name] = dtype
+        return values if dtype == "category" else values.astype("string")
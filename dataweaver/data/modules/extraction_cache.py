@@ -0,0 +1,266 @@
+from .interfaces import PDFExtractorInterface
+from .archive_member import ArchiveMember
+from .extraction_worker import TABULA_OPTIONS
+from .page_ranges import parse_page_range, format_page_range
+from dataweaver.settings import logger
+from dataweaver.utils import file_sha256
+
+from typing import TYPE_CHECKING
+import importlib.util
+import tempfile
+import hashlib
+import pickle
+import shutil
+import json
+import time
+import os
+
+import pandas as pd
+import tabula
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pandas import DataFrame
+    from pathlib import Path
+    from .pdf_extractor import PdfExtractor
+
+# Versão do formato/extrator: alterar invalida as entradas existentes
+EXTRACTOR_VERSION = f"tabula-py {tabula.__version__}; cache 2"
+
+
+def parquet_available() -> bool:
+    """Indica se há um motor Parquet (pyarrow ou fastparquet) instalado."""
+    return any(
+        importlib.util.find_spec(module) is not None
+        for module in ("pyarrow", "fastparquet")
+    )
+
+
+def content_sha256(source: "Path | ArchiveMember") -> str:
+    """SHA-256 do PDF; membros de ZIP são lidos do mapeamento, sem cópia."""
+    if isinstance(source, ArchiveMember):
+        return hashlib.sha256(source.buffer()).hexdigest()
+    return file_sha256(source)
+
+
+class ExtractionCache:
+    """Cache persistente das tabelas extraídas, com despejo LRU por tamanho.
+
+    Cada entrada é uma pasta ``root/<chave>`` com um arquivo por tabela, em
+    Parquet (pyarrow, incluído em requirements.txt) ou em pickle quando não
+    há motor Parquet ou a tabela não é aceita pelo formato. A data de
+    modificação da pasta registra o último uso.
+    """
+
+    def __init__(self, root: "Path", max_bytes: int = 0) -> None:
+        """Inicializa o cache.
+
+        Args:
+            root: Diretório das entradas
+            max_bytes: Espaço máximo ocupado (0 = sem limite)
+        """
+        self.root = root
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def key(sha256: str, pages: str, options: dict) -> str:
+        """Chave da entrada: hash do PDF + páginas + opções do tabula + versão."""
+        try:
+            pages = format_page_range(parse_page_range(pages))
+        except ValueError:
+            pages = str(pages).strip().lower()
+        payload = json.dumps(
+            [sha256, pages, options, EXTRACTOR_VERSION], sort_keys=True
+        ).encode()
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> "list[DataFrame] | None":
+        """Lê as tabelas da entrada, ou None se não houver (ou estiver corrompida)."""
+        tables = self.iter_tables(key)
+        if tables is None:
+            return None
+        try:
+            return list(tables)
+        except Exception:
+            return None
+
+    def iter_tables(self, key: str) -> "Iterator[DataFrame] | None":
+        """Lê as tabelas da entrada uma a uma, ou None se não houver.
+
+        Um arquivo ilegível descarta a entrada inteira e a exceção é propagada
+        na iteração, para que o chamador refaça a extração.
+        """
+        entry = self.root / key
+        if not entry.is_dir():
+            return None
+        os.utime(entry)
+        return self._iter_entry(key, sorted(entry.iterdir()))
+
+    def _iter_entry(self, key: str, paths: list["Path"]) -> "Iterator[DataFrame]":
+        for path in paths:
+            try:
+                table = self._read(path)
+            except Exception as e:
+                logger.warning(f"Entrada do cache de extração descartada ({e}): {key}")
+                shutil.rmtree(self.root / key, ignore_errors=True)
+                raise
+            yield table
+
+    def put(self, key: str, tables: list["DataFrame"]) -> None:
+        """Grava as tabelas da entrada e aplica o limite de espaço."""
+        writer = self.open_entry(key)
+        try:
+            writer.add(tables)
+        except BaseException:
+            writer.abort()
+            raise
+        writer.commit()
+
+    def open_entry(self, key: str) -> "CacheEntryWriter":
+        """Inicia uma entrada gravada aos poucos (extração em streaming)."""
+        return CacheEntryWriter(self, key)
+
+    def evict(self, max_bytes: "int | None" = None) -> list[str]:
+        """Remove as entradas menos usadas até caber no orçamento.
+
+        Returns:
+            Chaves removidas
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        if not budget or not self.root.is_dir():
+            return []
+        entries = [
+            (entry.stat().st_mtime, entry, self._size(entry))
+            for entry in self.root.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        ]
+        total = sum(size for _, _, size in entries)
+        removed = []
+        for _, entry, size in sorted(entries, key=lambda item: item[0]):
+            if total <= budget:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed.append(entry.name)
+        return removed
+
+    @staticmethod
+    def _read(path: "Path") -> "DataFrame":
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path)
+        with open(path, "rb") as file:
+            return pickle.load(file)
+
+    @staticmethod
+    def _size(entry: "Path") -> int:
+        return sum(path.stat().st_size for path in entry.iterdir())
+
+
+class CacheEntryWriter:
+    """Grava as tabelas de uma entrada conforme chegam, publicando-a em ``commit``.
+
+    Cada tabela vira um arquivo (Parquet, ou pickle se o Parquet não estiver
+    disponível ou não aceitar as colunas) em uma pasta temporária, renomeada
+    para a pasta da entrada ao final.
+    """
+
+    def __init__(self, cache: ExtractionCache, key: str) -> None:
+        self.cache = cache
+        self.key = key
+        self.count = 0
+        cache.root.mkdir(parents=True, exist_ok=True)
+        self._tmp = tempfile.mkdtemp(dir=cache.root, prefix=".tmp-")
+
+    def add(self, tables: list["DataFrame"]) -> None:
+        """Acrescenta tabelas à entrada."""
+        for table in tables:
+            name = os.path.join(self._tmp, f"{self.count:05d}")
+            try:
+                if not parquet_available():
+                    raise ImportError("Parquet indisponível")
+                table.to_parquet(f"{name}.parquet")
+            except Exception:
+                # Colunas repetidas/não textuais não são aceitas pelo Parquet
+                if os.path.exists(f"{name}.parquet"):
+                    os.unlink(f"{name}.parquet")
+                with open(f"{name}.pkl", "wb") as file:
+                    pickle.dump(table, file, protocol=pickle.HIGHEST_PROTOCOL)
+            self.count += 1
+
+    def commit(self) -> None:
+        """Publica a entrada e aplica o limite de espaço do cache."""
+        target = self.cache.root / self.key
+        shutil.rmtree(target, ignore_errors=True)
+        os.replace(self._tmp, target)
+        self.cache.evict()
+
+    def abort(self) -> None:
+        """Descarta a entrada incompleta."""
+        shutil.rmtree(self._tmp, ignore_errors=True)
+
+
+class CachedPdfExtractor(PDFExtractorInterface):
+    """Decorator que consulta o ExtractionCache antes de extrair.
+
+    Em um acerto, as tabelas são lidas do disco sem iniciar a JVM.
+    """
+
+    def __init__(self, extractor: "PdfExtractor", cache: ExtractionCache) -> None:
+        self.extractor = extractor
+        self.cache = cache
+
+    @property
+    def pdf_path(self) -> "Path | ArchiveMember":
+        return self.extractor.pdf_path
+
+    def extract_tables(self, pages: str) -> list["DataFrame"]:
+        """Retorna as tabelas do cache ou extrai e grava o resultado."""
+        start = time.perf_counter()
+        key = self.cache.key(content_sha256(self.pdf_path), pages, TABULA_OPTIONS)
+        tables = self.cache.get(key)
+        if tables is not None:
+            elapsed = (time.perf_counter() - start) * 1000
+            logger.info(f"Tabelas lidas do cache de extração em {elapsed:.0f} ms.")
+            return tables
+
+        tables = self.extractor.extract_tables(pages)
+        if tables:
+            self.cache.put(key, tables)
+        return tables
+
+    def iter_tables(self, pages: str) -> "Iterator[list[DataFrame]]":
+        """Versão em streaming: no acerto, lê uma tabela por vez; na falta,
+        grava cada bloco no cache conforme ele é extraído.
+
+        Se uma entrada se revelar corrompida no meio da leitura, ela é
+        descartada e a extração é refeita, pulando as tabelas já entregues.
+        """
+        key = self.cache.key(content_sha256(self.pdf_path), pages, TABULA_OPTIONS)
+        served = 0
+        cached = self.cache.iter_tables(key)
+        while cached is not None:
+            try:
+                table = next(cached)
+            except StopIteration:
+                logger.info("Tabelas lidas do cache de extração.")
+                return
+            except Exception:
+                break  # Entrada descartada pelo cache: extrai de novo
+            served += 1
+            yield [table]
+
+        writer = self.cache.open_entry(key)
+        try:
+            for tables in self.extractor.iter_tables(pages):
+                writer.add(tables)
+                skip = min(served, len(tables))
+                served -= skip
+                if tables[skip:]:
+                    yield tables[skip:]
+        except BaseException:
+            writer.abort()
+            raise
+        if writer.count:
+            writer.commit()
+        else:
+            writer.abort()
@@ -0,0 +1,94 @@
+from dataweaver.settings import logger
+
+from typing import TYPE_CHECKING
+import tempfile
+import pickle
+import shutil
+import json
+import os
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from pathlib import Path
+
+
+def _atomic_write(path: "Path", data: bytes) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ExtractionCheckpoint:
+    """Progresso da extração por blocos de páginas, gravado bloco a bloco.
+
+    Cada bloco concluído é salvo em ``folder/chunk_<páginas>.pkl`` e
+    registrado no ``manifest.json`` pela sua própria seleção de páginas; uma
+    nova execução com o mesmo PDF e as mesmas páginas reaproveita os blocos
+    já gravados e extrai apenas os pendentes. Ao final, ``clear`` remove a pasta.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(self, folder: "Path") -> None:
+        """Abre (ou cria) o checkpoint.
+
+        Args:
+            folder: Pasta do checkpoint (uma por PDF/páginas/opções do tabula)
+        """
+        self.folder = folder
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.done = self._read_manifest()
+
+    def load(self, pages: str) -> "list[DataFrame] | None":
+        """Tabelas de um bloco concluído, ou None se pendente ou ilegível.
+
+        Um bloco ilegível (ex: gravação interrompida) é descartado do
+        checkpoint para ser extraído de novo.
+        """
+        if pages not in self.done:
+            return None
+        try:
+            with open(self._chunk_path(pages), "rb") as file:
+                return pickle.load(file)
+        except Exception as e:
+            logger.warning(f"Bloco {pages} descartado do checkpoint: {e}")
+            self.done.discard(pages)
+            self._chunk_path(pages).unlink(missing_ok=True)
+            self._write_manifest()
+            return None
+
+    def save(self, pages: str, tables: list["DataFrame"]) -> None:
+        """Grava as tabelas de um bloco e o registra no manifesto."""
+        data = pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL)
+        _atomic_write(self._chunk_path(pages), data)
+        self.done.add(pages)
+        self._write_manifest()
+
+    def clear(self) -> None:
+        """Remove o checkpoint (extração concluída)."""
+        shutil.rmtree(self.folder, ignore_errors=True)
+        self.done = set()
+
+    def _chunk_path(self, pages: str) -> "Path":
+        return self.folder / f"chunk_{pages}.pkl"
+
+    def _write_manifest(self) -> None:
+        manifest = {"done": sorted(self.done)}
+        _atomic_write(self.folder / self.MANIFEST, json.dumps(manifest).encode())
+
+    def _read_manifest(self) -> set[str]:
+        try:
+            manifest = json.loads((self.folder / self.MANIFEST).read_text())
+            done = manifest.get("done", [])
+        except (OSError, ValueError, AttributeError):
+            return set()
+        return {
+            pages
+            for pages in done
+            if isinstance(pages, str) and self._chunk_path(pages).exists()
+        }
@@ -0,0 +1,362 @@
+"""
+Serviço de extração com JVM aquecida.
+
+O tabula executa em Java: a cada processo Python, a inicialização da JVM e o
+carregamento das classes custam mais do que a extração de documentos pequenos.
+Este módulo mantém um processo trabalhador que importa o tabula uma única vez
+(JVM via jpype, mantida carregada entre as tarefas) e recebe tarefas por um
+socket local (``multiprocessing.connection``).
+
+Uso:
+    python -m dataweaver.data.modules.extraction_worker
+"""
+
+from dataweaver.errors import ExtractionError
+from dataweaver.settings import config, logger
+
+from multiprocessing.connection import Listener, Client
+from multiprocessing import AuthenticationError
+from typing import TYPE_CHECKING, Callable
+import multiprocessing
+import ipaddress
+import secrets
+import os
+
+if TYPE_CHECKING:
+    from multiprocessing.connection import Connection
+    from pandas import DataFrame
+    from pathlib import Path
+
+
+# Opções do tabula usadas em todas as extrações (fazem parte da chave do cache)
+TABULA_OPTIONS = {"multiple_tables": True, "lattice": True}
+
+# Valor de exemplo do .env-example, tratado como chave não configurada
+PLACEHOLDER_KEY = "CHANGE-ME"
+
+
+def read_tables(pdf_path: str, pages: str) -> list["DataFrame"]:
+    """Extrai as tabelas com o tabula no processo atual (JVM via jpype)."""
+    import tabula
+
+    return tabula.read_pdf(pdf_path, pages=pages, **TABULA_OPTIONS)
+
+
+def parse_address(address: str) -> "str | tuple[str, int]":
+    """Converte ``host:porta`` em tupla; outros valores são caminhos de socket Unix."""
+    host, sep, port = address.rpartition(":")
+    if sep and host and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def process_memory_mb(pid: int) -> "float | None":
+    """Memória residente (MB) de um processo, ou None se indisponível (não-Linux)."""
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return None
+
+
+def _serve_jobs(conn: "Connection", handler: Callable) -> None:
+    """Laço do processo trabalhador: executa as tarefas recebidas até receber None."""
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        try:
+            conn.send(("ok", handler(*job)))
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}"))
+
+
+class ExtractionWorker:
+    """Processo trabalhador reciclado após N tarefas ou acima de um limite de memória.
+
+    A JVM do tabula acumula memória entre documentos; reiniciar o processo de
+    tempos em tempos limita esse crescimento sem pagar a inicialização a cada
+    extração.
+    """
+
+    def __init__(
+        self,
+        max_jobs: int = 50,
+        max_memory_mb: int = 0,
+        handler: Callable = read_tables,
+    ) -> None:
+        """Inicializa o trabalhador (o processo é criado na primeira tarefa).
+
+        Args:
+            max_jobs: Tarefas por processo antes de reciclar (0 = sem limite)
+            max_memory_mb: Memória residente que provoca a reciclagem (0 = sem limite)
+            handler: Função executada no processo para cada tarefa
+        """
+        self.max_jobs = max_jobs
+        self.max_memory_mb = max_memory_mb
+        self.handler = handler
+        self.jobs = 0
+        self.recycled = 0
+        self._process: "multiprocessing.Process | None" = None
+        self._conn: "Connection | None" = None
+
+    @property
+    def pid(self) -> "int | None":
+        return self._process.pid if self._process is not None else None
+
+    def submit(self, *args) -> object:
+        """Executa uma tarefa no processo trabalhador.
+
+        Raises:
+            ExtractionError: Se a tarefa falhar ou o processo terminar inesperadamente
+        """
+        if self._process is None:
+            self._start()
+        try:
+            self._conn.send(args)
+            status, result = self._conn.recv()
+        except (EOFError, OSError) as e:
+            self._stop(graceful=False)
+            raise ExtractionError(f"O processo de extração terminou: {e}") from e
+
+        self.jobs += 1
+        if self._should_recycle():
+            logger.info(
+                f"Reciclando o processo de extração após {self.jobs} tarefa(s)."
+            )
+            self._stop()
+            self.recycled += 1
+        if status == "error":
+            raise ExtractionError(result)
+        return result
+
+    def close(self) -> None:
+        """Encerra o processo trabalhador."""
+        self._stop()
+
+    def _should_recycle(self) -> bool:
+        if self.max_jobs and self.jobs >= self.max_jobs:
+            return True
+        if self.max_memory_mb:
+            memory = process_memory_mb(self.pid)
+            return memory is not None and memory > self.max_memory_mb
+        return False
+
+    def _start(self) -> None:
+        self._conn, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(
+            target=_serve_jobs, args=(child, self.handler), daemon=True
+        )
+        self._process.start()
+        child.close()
+        self.jobs = 0
+
+    def _stop(self, graceful: bool = True) -> None:
+        if self._process is None:
+            return
+        if graceful:
+            try:
+                self._conn.send(None)
+            except OSError:
+                pass
+            self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+            self._process.join()
+        self._conn.close()
+        self._process = self._conn = None
+
+
+class ExtractionServer:
+    """Atende tarefas de extração recebidas por ``multiprocessing.connection``.
+
+    As conexões são atendidas uma de cada vez pelo mesmo trabalhador, que
+    mantém a JVM carregada entre as execuções do pipeline.
+    """
+
+    def __init__(
+        self, address: "str | tuple[str, int]", authkey: bytes, worker: ExtractionWorker
+    ) -> None:
+        """Inicializa o serviço.
+
+        Raises:
+            ValueError: Sem chave (o Listener aceitaria conexões sem autenticação)
+        """
+        if not authkey:
+            raise ValueError("O serviço de extração exige uma chave de autenticação.")
+        self.address = address
+        self.authkey = authkey
+        self.worker = worker
+
+    def serve_forever(self) -> None:
+        """Atende conexões até receber ``shutdown``."""
+        with Listener(self.address, authkey=self.authkey) as listener:
+            logger.info(f"Serviço de extração ouvindo em {listener.address}.")
+            try:
+                while True:
+                    try:
+                        conn = listener.accept()
+                    except (OSError, EOFError, AuthenticationError) as e:
+                        logger.warning(f"Conexão recusada: {e}")
+                        continue
+                    with conn:
+                        try:
+                            if not self._handle(conn):
+                                break
+                        except (OSError, EOFError) as e:
+                            # Cliente desconectado no meio da tarefa: segue atendendo
+                            logger.warning(f"Conexão encerrada pelo cliente: {e}")
+            finally:
+                self.worker.close()
+        logger.info("Serviço de extração encerrado.")
+
+    def _handle(self, conn: "Connection") -> bool:
+        """Processa uma requisição; retorna False para encerrar o serviço."""
+        try:
+            request = conn.recv()
+        except EOFError:
+            return True
+        except Exception as e:
+            self._reply(conn, ("error", f"Requisição ilegível: {e}"))
+            return True
+        if request == "shutdown":
+            self._reply(conn, ("ok", None))
+            return False
+        if request == "ping":
+            self._reply(conn, ("ok", self.worker.pid))
+            return True
+        if not isinstance(request, tuple) or len(request) != 2:
+            self._reply(conn, ("error", f"Requisição inválida: {request!r:.80}"))
+            return True
+        try:
+            reply = ("ok", self.worker.submit(*request))
+        except ExtractionError as e:
+            reply = ("error", str(e))
+        self._reply(conn, reply)
+        return True
+
+    @staticmethod
+    def _reply(conn: "Connection", reply: tuple) -> None:
+        """Envia a resposta; um cliente que já desconectou é apenas registrado."""
+        try:
+            conn.send(reply)
+        except (OSError, EOFError) as e:
+            logger.warning(f"Cliente desconectou antes da resposta: {e}")
+
+
+class ExtractionClient:
+    """Cliente do ExtractionServer."""
+
+    def __init__(self, address: "str | tuple[str, int]", authkey: bytes) -> None:
+        self.address = address
+        self.authkey = authkey
+
+    def extract(self, pdf_path: "Path | str", pages: str) -> list["DataFrame"]:
+        """Envia a extração ao serviço.
+
+        Raises:
+            ConnectionError: Se o serviço não estiver em execução
+            ExtractionError: Se a extração falhar no serviço
+        """
+        return self._request((str(pdf_path), pages))
+
+    def available(self) -> bool:
+        """Indica se o serviço está respondendo."""
+        try:
+            self._request("ping")
+            return True
+        except ConnectionError:
+            return False
+
+    def shutdown(self) -> None:
+        """Solicita o encerramento do serviço."""
+        self._request("shutdown")
+
+    def _request(self, request: object) -> object:
+        try:
+            with Client(self.address, authkey=self.authkey) as conn:
+                conn.send(request)
+                status, result = conn.recv()
+        except (OSError, EOFError, AuthenticationError) as e:
+            raise ConnectionError(f"Serviço de extração indisponível: {e}") from e
+        if status == "error":
+            raise ExtractionError(result)
+        return result
+
+
+def is_loopback(host: str) -> bool:
+    """Indica se o host é a interface local (``localhost``, 127.0.0.0/8 ou ::1)."""
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def worker_address() -> "str | tuple[str, int]":
+    """Endereço do serviço (TABULA_WORKER_ADDRESS; padrão: socket na pasta de cache).
+
+    As tarefas são desserializadas com pickle pelo serviço, então endereços
+    TCP só são aceitos na interface local.
+
+    Raises:
+        ValueError: Se o endereço TCP não for local
+    """
+    address = config.data.worker_address or str(config.dirs.cache / "tabula.sock")
+    address = parse_address(address)
+    if isinstance(address, tuple) and not is_loopback(address[0]):
+        raise ValueError(
+            f"TABULA_WORKER_ADDRESS deve ser local (localhost/127.0.0.1): {address[0]}"
+        )
+    return address
+
+
+def worker_authkey() -> bytes:
+    """Chave de autenticação do serviço.
+
+    Usa TABULA_WORKER_KEY quando configurada; caso contrário, uma chave
+    aleatória gravada em ``tabula.key`` na pasta de cache (permissão 0600),
+    criada na primeira chamada e compartilhada pelo serviço e pelos clientes.
+    """
+    key = config.data.worker_key
+    if key and key != PLACEHOLDER_KEY:
+        return key.encode()
+
+    key_file = config.dirs.cache / "tabula.key"
+    key_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        fd = os.open(key_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        return key_file.read_bytes().strip()
+    with os.fdopen(fd, "w") as file:
+        file.write(secrets.token_hex(32))
+    logger.info(f"Chave do serviço de extração gerada em {key_file}.")
+    return key_file.read_bytes().strip()
+
+
+def create_extraction_client() -> "ExtractionClient | None":
+    """Cliente do serviço de extração, se habilitado (TABULA_WORKER)."""
+    if not config.data.worker_enabled:
+        return None
+    return ExtractionClient(worker_address(), worker_authkey())
+
+
+def main() -> None:
+    address = worker_address()
+    if isinstance(address, str) and os.path.exists(address):
+        os.unlink(address)  # socket deixado por uma execução anterior
+    worker = ExtractionWorker(
+        config.data.worker_max_jobs, config.data.worker_max_memory_mb
+    )
+    ExtractionServer(address, worker_authkey(), worker).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pandas import DataFrame
 
 
@@ -23,6 +24,17 @@ class PDFExtractorInterface(ABC):
         """
         pass
 
+    def iter_tables(self, pages: str) -> "Iterator[list[DataFrame]]":
+        """
+        Extrai as tabelas em blocos de páginas, entregando cada bloco assim que fica pronto.
+
+        A implementação padrão entrega todas as tabelas em um único bloco.
+
+        Parâmetros:
+        pages (str): As páginas ou intervalo de páginas do PDF de onde as tabelas serão extraídas.
+        """
+        yield self.extract_tables(pages)
+
 
 class DataProcessorInterface(ABC):
     """
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+import math
+import os
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+def parse_page_range(pages: str) -> list[int]:
+    """Converte uma seleção de páginas do tabula (ex: ``"3-181"``, ``"1,4-6"``) em lista.
+
+    Raises:
+        ValueError: Se a seleção não for numérica (ex: ``"all"``) ou for inválida
+    """
+    result: list[int] = []
+    for part in str(pages).split(","):
+        start, sep, end = part.strip().partition("-")
+        first, last = int(start), int(end) if sep else int(start)
+        if first < 1 or last < first:
+            raise ValueError(f"Intervalo de páginas inválido: {part}")
+        result.extend(range(first, last + 1))
+    return sorted(set(result))
+
+
+def format_page_range(pages: "Iterable[int]") -> str:
+    """Formata páginas no padrão do tabula, agrupando sequências (ex: ``"3-5,7"``)."""
+    parts: list[str] = []
+    ordered = sorted(set(pages))
+    start = previous = None
+    for page in ordered + [None]:
+        if start is not None and page == previous + 1:
+            previous = page
+            continue
+        if start is not None:
+            parts.append(str(start) if start == previous else f"{start}-{previous}")
+        start = previous = page
+    return ",".join(parts)
+
+
+def plan_chunks(
+    pages: list[int], max_workers: int = 0, chunk_size: int = 0, min_chunk: int = 4
+) -> tuple[int, list[list[int]]]:
+    """Divide as páginas em blocos e define quantos processos usar.
+
+    Sem tamanho de bloco informado, gera cerca de 4 blocos por processo (as
+    páginas têm custos diferentes e blocos menores equilibram a carga), mas
+    nunca menos de ``min_chunk`` páginas por bloco, para amortizar o custo
+    fixo de cada chamada ao tabula.
+
+    Args:
+        pages: Páginas a extrair, em ordem
+        max_workers: Processos desejados (0 = número de CPUs)
+        chunk_size: Páginas por bloco (0 = automático)
+        min_chunk: Menor bloco gerado automaticamente
+
+    Returns:
+        (processos, blocos de páginas em ordem)
+    """
+    workers = max(1, max_workers or os.cpu_count() or 1)
+    if chunk_size <= 0:
+        chunk_size = max(min_chunk, math.ceil(len(pages) / (workers * 4)))
+    chunks = [pages[i : i + chunk_size] for i in range(0, len(pages), chunk_size)]
+    return max(1, min(workers, len(chunks))), chunks
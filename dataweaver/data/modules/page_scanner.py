@@ -0,0 +1,236 @@
+from .archive_member import ArchiveMember
+from .page_ranges import format_page_range
+from dataweaver.settings import logger
+from dataweaver.utils import file_sha256
+
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING
+import importlib.util
+import json
+import re
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Intervalo do Anexo I (RN 465/2021) usado quando a varredura não é possível
+FALLBACK_PAGES = "3-181"
+
+# Versão da contagem: alterar invalida os índices em cache
+INDEX_VERSION = 3
+
+# Strings hexadecimais e nomes do content stream (podem conter texto parecido com
+# operadores); as strings literais ``(...)`` são removidas antes, por strip_literals
+_STRINGS = re.compile(rb"<[0-9A-Fa-f\s]*>|/[^\s/\[\]()<>]+")
+_TOKEN_SPLIT = re.compile(rb"[\s\[\]]+")
+_TEXT_OPERATORS = {b"Tj", b"TJ", b"'", b'"'}
+_RULING_OPERATORS = {b"re", b"l"}
+# Delimitadores dentro de uma string literal, XObjects desenhados (``/Fm1 Do``) e
+# aninhamento máximo de formulários
+_LITERAL_DELIMITERS = re.compile(rb"\\.|[()]", re.DOTALL)
+_DRAWN_XOBJECT = re.compile(rb"/([^\s/\[\]()<>{}%]+)\s+Do(?![^\s\[\]()<>/{}%])")
+_MAX_FORM_DEPTH = 8
+
+
+def pypdf_available() -> bool:
+    """Indica se o leitor de PDF opcional (pypdf) está instalado."""
+    return importlib.util.find_spec("pypdf") is not None
+
+
+def strip_literals(content: bytes) -> bytes:
+    """Substitui as strings literais ``(...)`` de um content stream por espaços.
+
+    Strings literais podem conter parênteses balanceados (``(Tabela (I))``)
+    e escapados (``\\)``), por isso a profundidade é acompanhada; uma string
+    sem fechamento vai até o fim do conteúdo.
+    """
+    parts = []
+    position = 0
+    while True:
+        start = content.find(b"(", position)
+        if start < 0:
+            parts.append(content[position:])
+            return b"".join(parts)
+        parts += [content[position:start], b" "]
+        depth, position = 0, len(content)
+        for match in _LITERAL_DELIMITERS.finditer(content, start):
+            if match.group() == b"(":
+                depth += 1
+            elif match.group() == b")":
+                depth -= 1
+                if depth == 0:
+                    position = match.end()
+                    break
+
+
+def count_operators(content: bytes) -> tuple[int, int]:
+    """Conta operadores de texto e de linhas/retângulos em um content stream.
+
+    Returns:
+        (operadores de texto, linhas de grade)
+    """
+    tokens = _TOKEN_SPLIT.split(_STRINGS.sub(b" ", strip_literals(content)))
+    text_ops = sum(1 for token in tokens if token in _TEXT_OPERATORS)
+    rulings = sum(1 for token in tokens if token in _RULING_OPERATORS)
+    return text_ops, rulings
+
+
+def drawn_xobjects(content: bytes) -> list[str]:
+    """Nomes dos XObjects desenhados com ``Do`` em um content stream."""
+    content = strip_literals(content)
+    return [name.decode("latin-1") for name in _DRAWN_XOBJECT.findall(content)]
+
+
+def count_stream_operators(
+    content: bytes, resources, depth: int = 0, stack: tuple = ()
+) -> tuple[int, int]:
+    """Conta os operadores de um content stream e dos Form XObjects que ele desenha.
+
+    Tabelas podem ser desenhadas dentro de formulários (``/Fm1 Do``), cujo
+    conteúdo não aparece no content stream da página; cada formulário é
+    contado uma vez por ``Do``, com os próprios recursos (ou os herdados).
+
+    Args:
+        content: Content stream já decodificado
+        resources: Dicionário de recursos do pypdf (ou None)
+        depth: Nível de aninhamento atual
+        stack: Formulários em desenho (evita ciclos)
+    """
+    text_ops, rulings = count_operators(content)
+    if resources is None or depth >= _MAX_FORM_DEPTH:
+        return text_ops, rulings
+    xobjects = resources.get_object().get("/XObject")
+    if xobjects is None:
+        return text_ops, rulings
+    xobjects = xobjects.get_object()
+    for name in drawn_xobjects(content):
+        reference = xobjects.get(f"/{name}")
+        if reference is None:
+            continue
+        form = reference.get_object()
+        key = getattr(reference, "idnum", id(form))
+        if form.get("/Subtype") != "/Form" or key in stack:
+            continue
+        form_text, form_rulings = count_stream_operators(
+            form.get_data(),
+            form.get("/Resources", resources),
+            depth + 1,
+            (*stack, key),
+        )
+        text_ops += form_text
+        rulings += form_rulings
+    return text_ops, rulings
+
+
+@dataclass(frozen=True)
+class PageStats:
+    """Indicadores de uma página do PDF."""
+
+    number: int  # Número da página (a partir de 1)
+    text_ops: int  # Operadores de texto (densidade de texto)
+    rulings: int  # Linhas e retângulos desenhados (grades de tabelas)
+
+
+@dataclass(frozen=True)
+class PageIndex:
+    """Índice por página de um PDF, identificado pelo hash do conteúdo."""
+
+    sha256: str
+    page_count: int
+    pages: tuple[PageStats, ...]
+
+    def table_pages(self, min_rulings: int) -> list[int]:
+        """Páginas com grade suficiente para o modo lattice do tabula."""
+        return [
+            page.number
+            for page in self.pages
+            if page.rulings >= min_rulings and page.text_ops > 0
+        ]
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageIndex":
+        pages = tuple(PageStats(**page) for page in data["pages"])
+        return cls(data["sha256"], data["page_count"], pages)
+
+
+class PageScanner:
+    """Varredura rápida (sem JVM) das páginas que contêm tabelas.
+
+    Com o pypdf, lê o content stream de cada página (e os Form XObjects
+    desenhados por ele) e conta operadores de texto e de desenho de
+    linhas/retângulos. O tabula em modo lattice só
+    encontra tabelas delimitadas por linhas, então páginas sem grade (capa,
+    sumário, apêndices em texto corrido) podem ser ignoradas. O índice é
+    guardado em cache pelo hash do PDF.
+    """
+
+    def __init__(self, cache_dir: "Path", min_rulings: int = 8) -> None:
+        """Inicializa o scanner.
+
+        Args:
+            cache_dir: Pasta dos índices em cache (um JSON por PDF)
+            min_rulings: Linhas/retângulos mínimos para considerar a página uma tabela
+        """
+        self.cache_dir = cache_dir
+        self.min_rulings = min_rulings
+
+    def select_pages(
+        self, pdf_path: "Path | ArchiveMember", fallback: str = FALLBACK_PAGES
+    ) -> str:
+        """Seleção de páginas para o tabula (ex: ``"3-181"``).
+
+        Usa ``fallback`` se o pypdf não estiver instalado, se o PDF não puder
+        ser lido ou se nenhuma página com tabela for encontrada.
+        """
+        if not pypdf_available():
+            logger.warning(
+                f"pypdf não está instalado; usando as páginas {fallback} para extração."
+            )
+            return fallback
+        try:
+            index = self.scan(pdf_path)
+        except Exception as e:
+            logger.warning(f"Falha na varredura de páginas ({e}); usando {fallback}.")
+            return fallback
+
+        pages = index.table_pages(self.min_rulings)
+        if not pages:
+            logger.warning(f"Nenhuma página com tabela detectada; usando {fallback}.")
+            return fallback
+        selection = format_page_range(pages)
+        logger.info(
+            f"{len(pages)} de {index.page_count} página(s) com tabelas: {selection}"
+        )
+        return selection
+
+    def scan(self, pdf_path: "Path | ArchiveMember") -> PageIndex:
+        """Monta (ou lê do cache) o índice de páginas do PDF."""
+        if isinstance(pdf_path, ArchiveMember):
+            pdf_path = pdf_path.path()
+        sha256 = file_sha256(pdf_path)
+        cache_file = self.cache_dir / f"{sha256}-v{INDEX_VERSION}.json"
+        if cache_file.exists():
+            try:
+                return PageIndex.from_dict(json.loads(cache_file.read_text()))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Índice de páginas inválido descartado: {cache_file}")
+
+        index = self._build_index(pdf_path, sha256)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(index.to_dict()))
+        return index
+
+    @staticmethod
+    def _build_index(pdf_path: "Path", sha256: str) -> PageIndex:
+        from pypdf import PdfReader
+
+        reader = PdfReader(pdf_path)
+        pages = []
+        for number, page in enumerate(reader.pages, start=1):
+            contents = page.get_contents()
+            data = contents.get_data() if contents is not None else b""
+            counts = count_stream_operators(data, page.get("/Resources"))
+            pages.append(PageStats(number, *counts))
+        return PageIndex(sha256, len(pages), tuple(pages))
@@ -1,11 +1,22 @@
 from .interfaces import PDFExtractorInterface
+from .archive_member import ArchiveMember
+from .extraction_worker import read_tables, TABULA_OPTIONS
+from .page_ranges import parse_page_range, format_page_range, plan_chunks
+from .extraction_cache import ExtractionCache, content_sha256
+from .extraction_checkpoint import ExtractionCheckpoint
+from dataweaver.settings import logger
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from collections import deque
+from typing import TYPE_CHECKING, Callable
+import multiprocessing
 import tabula
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pandas import DataFrame
     from pathlib import Path
+    from .extraction_worker import ExtractionClient
 
 
 class PdfExtractor(PDFExtractorInterface):
@@ -13,10 +24,26 @@ class PdfExtractor(PDFExtractorInterface):
     Implementação concreta da interface PDFExtractorInterface.
 
     Esta classe utiliza a biblioteca `tabula` para extrair tabelas de arquivos PDF.
+    O PDF pode ser um arquivo solto ou um membro de um ZIP (`ArchiveMember`); neste
+    caso o tabula recebe a cópia temporária criada por `ArchiveMember.path()`.
+
+    Com um `ExtractionClient`, a extração é enviada ao serviço que mantém a JVM
+    aquecida; se o serviço não estiver em execução, o tabula é usado no próprio
+    processo.
+
+    Em streaming (`iter_tables`), as páginas são extraídas em blocos de
+    `chunk_size` páginas, um de cada vez.
     """
 
-    def __init__(self, pdf_path: "Path") -> None:
+    def __init__(
+        self,
+        pdf_path: "Path | ArchiveMember",
+        client: "ExtractionClient | None" = None,
+        chunk_size: int = 0,
+    ) -> None:
         self.pdf_path = pdf_path
+        self.client = client
+        self.chunk_size = chunk_size
 
     def extract_tables(self, pages: str) -> list["DataFrame"]:
         """
@@ -28,6 +55,238 @@ class PdfExtractor(PDFExtractorInterface):
             pages: Identificação das páginas a serem processadas (exemplo: 'all', '1', '1-3', etc.).
         """
 
-        return tabula.read_pdf(
-            str(self.pdf_path), pages=pages, multiple_tables=True, lattice=True
-        )
+        source = self._source()
+
+        if self.client is not None:
+            try:
+                return self.client.extract(source, pages)
+            except ConnectionError as e:
+                logger.warning(f"{e}. Extraindo no processo atual.")
+
+        return tabula.read_pdf(str(source), pages=pages, **TABULA_OPTIONS)
+
+    def iter_tables(self, pages: str) -> "Iterator[list[DataFrame]]":
+        """Extrai as tabelas bloco a bloco (seleções não numéricas em um único bloco)."""
+        try:
+            page_list = parse_page_range(pages)
+        except ValueError:
+            yield self.extract_tables(pages)
+            return
+        _, chunks = plan_chunks(page_list, 1, self.chunk_size)
+        for chunk in chunks:
+            yield self.extract_tables(format_page_range(chunk))
+
+    def _source(self) -> "Path":
+        """Caminho em disco do PDF (membros de ZIP são copiados para um temporário)."""
+        if isinstance(self.pdf_path, ArchiveMember):
+            return self.pdf_path.path()
+        return self.pdf_path
+
+
+class ParallelPdfExtractor(PdfExtractor):
+    """Extrai um único PDF em blocos de páginas distribuídos entre processos.
+
+    Cada processo do pool inicia sua própria JVM uma única vez e a reaproveita
+    nos blocos seguintes. As tabelas são devolvidas na ordem das páginas,
+    independentemente da ordem em que os blocos terminam. Seleções não
+    numéricas (ex: ``"all"``) são extraídas sem divisão.
+
+    Com ``checkpoint_dir``, cada bloco concluído é gravado em disco assim que
+    termina; se a execução for interrompida, a próxima retoma a partir dos
+    blocos pendentes. Sem tamanho de bloco informado, os blocos passam a ter
+    ``CHECKPOINT_CHUNK_PAGES`` páginas, para que a divisão (e o checkpoint)
+    não dependa do número de CPUs da máquina que retoma a extração.
+
+    Com um ``ExtractionClient``, os blocos são enviados um a um ao serviço
+    que mantém a JVM aquecida (sem pool de processos), continuando sujeitos
+    ao checkpoint; se o serviço não responder, ``handler`` extrai o bloco no
+    próprio processo.
+    """
+
+    # Páginas por bloco com checkpoint e EXTRACT_CHUNK_PAGES=0
+    CHECKPOINT_CHUNK_PAGES = 8
+
+    def __init__(
+        self,
+        pdf_path: "Path | ArchiveMember",
+        max_workers: int = 0,
+        chunk_size: int = 0,
+        handler: Callable = read_tables,
+        checkpoint_dir: "Path | None" = None,
+        client: "ExtractionClient | None" = None,
+    ) -> None:
+        """Inicializa o extrator.
+
+        Args:
+            pdf_path: PDF de origem
+            max_workers: Processos simultâneos (0 = número de CPUs)
+            chunk_size: Páginas por bloco (0 = automático pelo número de páginas)
+            handler: Função que extrai um bloco ``(caminho, páginas)`` no processo
+            checkpoint_dir: (Opcional) Pasta dos checkpoints por bloco
+            client: (Opcional) Serviço de extração; implica um único processo
+        """
+        super().__init__(pdf_path, client, chunk_size)
+        self.max_workers = max_workers
+        self.handler = handler
+        self.checkpoint_dir = checkpoint_dir
+
+    def extract_tables(self, pages: str) -> list["DataFrame"]:
+        """Extrai as tabelas das páginas informadas, em paralelo por blocos."""
+        try:
+            page_list = parse_page_range(pages)
+        except ValueError:
+            return super().extract_tables(pages)
+
+        workers, chunks = self._plan(page_list)
+        if workers == 1 and self.checkpoint_dir is None:
+            return super().extract_tables(pages)
+        return [
+            table
+            for tables in self._iter_chunks(pages, chunks, workers)
+            for table in tables
+        ]
+
+    def iter_tables(self, pages: str) -> "Iterator[list[DataFrame]]":
+        """Entrega as tabelas de cada bloco, na ordem das páginas, assim que
+        o bloco e todos os anteriores estiverem prontos."""
+        try:
+            page_list = parse_page_range(pages)
+        except ValueError:
+            yield super().extract_tables(pages)
+            return
+
+        workers, chunks = self._plan(page_list)
+        yield from self._iter_chunks(pages, chunks, workers)
+
+    def _plan(self, page_list: list[int]) -> tuple[int, list[list[int]]]:
+        chunk_size = self.chunk_size
+        if not chunk_size and self.checkpoint_dir is not None:
+            chunk_size = self.CHECKPOINT_CHUNK_PAGES
+        max_workers = 1 if self.client is not None else self.max_workers
+        return plan_chunks(page_list, max_workers, chunk_size)
+
+    def _iter_chunks(
+        self, pages: str, chunks: list[list[int]], workers: int
+    ) -> "Iterator[list[DataFrame]]":
+        """Extrai os blocos (retomando do checkpoint) e os entrega em ordem.
+
+        No máximo ``2 * workers`` blocos ficam em andamento ou aguardando os
+        anteriores, o que limita a memória usada pelos resultados.
+        """
+        ranges = [format_page_range(chunk) for chunk in chunks]
+        checkpoint = self._open_checkpoint(pages)
+        done = set()
+        if checkpoint is not None:
+            done = {
+                index for index, chunk in enumerate(ranges) if chunk in checkpoint.done
+            }
+        if done:
+            logger.info(
+                f"Retomando a extração: {len(done)} de {len(ranges)} bloco(s) "
+                "já concluído(s)."
+            )
+        pending = {index for index in range(len(ranges)) if index not in done}
+        workers = min(workers, len(pending))
+        source = str(self._source())
+
+        def completed(index: int, tables: list["DataFrame"]) -> None:
+            if checkpoint is not None:
+                checkpoint.save(ranges[index], tables)
+
+        if workers <= 1:
+            for index in range(len(ranges)):
+                tables = checkpoint.load(ranges[index]) if index in done else None
+                if tables is None:
+                    tables = self._extract_chunk(source, ranges[index])
+                    completed(index, tables)
+                yield tables
+        else:
+            logger.info(
+                f"Extraindo {sum(map(len, chunks))} página(s) em {len(pending)} "
+                f"bloco(s) com {workers} processo(s)..."
+            )
+            # spawn: processos novos, sem herdar uma JVM já iniciada neste processo
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(workers, mp_context=context) as executor:
+                yield from self._run_pool(
+                    executor, source, ranges, pending, workers, checkpoint, completed
+                )
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    def _run_pool(
+        self,
+        executor: ProcessPoolExecutor,
+        source: str,
+        ranges: list[str],
+        pending: set[int],
+        workers: int,
+        checkpoint: "ExtractionCheckpoint | None",
+        completed: Callable,
+    ) -> "Iterator[list[DataFrame]]":
+        queue = deque(sorted(pending))
+        running: dict = {}
+        ready: dict[int, list["DataFrame"]] = {}
+        errors: list[Exception] = []
+        next_index = 0
+
+        while next_index < len(ranges):
+            # O próximo bloco a entregar é sempre submetido, mesmo com a janela cheia
+            while (
+                queue
+                and not errors
+                and (len(running) + len(ready) < 2 * workers or queue[0] == next_index)
+            ):
+                index = queue.popleft()
+                running[executor.submit(self.handler, source, ranges[index])] = index
+
+            # Entrega os blocos contíguos já disponíveis (extraídos ou do checkpoint)
+            while next_index < len(ranges):
+                if next_index in ready:
+                    tables = ready.pop(next_index)
+                elif next_index in pending:
+                    break
+                else:
+                    tables = checkpoint.load(ranges[next_index])
+                    if tables is None:
+                        # Bloco ilegível no checkpoint: extrai de novo
+                        pending.add(next_index)
+                        queue.appendleft(next_index)
+                        break
+                yield tables
+                next_index += 1
+
+            if next_index >= len(ranges):
+                break
+            if not running:
+                if errors:
+                    raise errors[0]
+                continue
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                index = running.pop(future)
+                try:
+                    tables = future.result()
+                except Exception as e:
+                    # Continua gravando os blocos que ainda terminarem
+                    errors.append(e)
+                    continue
+                completed(index, tables)
+                ready[index] = tables
+
+    def _extract_chunk(self, source: str, pages: str) -> list["DataFrame"]:
+        """Extrai um bloco no serviço (se houver) ou com ``handler``."""
+        if self.client is not None:
+            try:
+                return self.client.extract(source, pages)
+            except ConnectionError as e:
+                logger.warning(f"{e}. Extraindo no processo atual.")
+        return self.handler(source, pages)
+
+    def _open_checkpoint(self, pages: str) -> "ExtractionCheckpoint | None":
+        """Checkpoint do PDF + seleção de páginas + opções (não da divisão em blocos)."""
+        if self.checkpoint_dir is None:
+            return None
+        key = ExtractionCache.key(content_sha256(self.pdf_path), pages, TABULA_OPTIONS)
+        return ExtractionCheckpoint(self.checkpoint_dir / key)
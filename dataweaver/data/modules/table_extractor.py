@@ -6,11 +6,15 @@ from dataweaver.scraper.modules import (
     ZipCompressor,
     ValidationZipCompressor,
     LoggingZipCompressor,
+    CompressionPolicy,
 )
 from dataweaver.errors import ExtractionError
-from dataweaver.settings import logger
-from .interfaces import TableExtractorInterface
-from .pdf_extractor import PdfExtractor
+from dataweaver.settings import config, logger
+from .interfaces import TableExtractorInterface, PDFExtractorInterface
+from .pdf_extractor import PdfExtractor, ParallelPdfExtractor
+from .extraction_worker import create_extraction_client
+from .page_scanner import PageScanner
+from .extraction_cache import ExtractionCache, CachedPdfExtractor
 from .data_processor import DataProcessor
 from .csv_saver import CsvSaver
 
@@ -52,15 +56,82 @@ class TableExtractor(TableExtractorInterface):
         self.file_extension = file_extension
         self.abbreviation_dict = abbreviation_dict
 
-        self.pdf_extractor = PdfExtractor(pdf_path)
+        self.pdf_extractor = self._create_pdf_extractor(pdf_path)
         self.data_processor = DataProcessor(abbreviation_dict)
         self.csv_saver = CsvSaver(csv_path)
 
         # ZipCompressor com Decorators
         self.zip_compressor = ValidationZipCompressor(
-            LoggingZipCompressor(ZipCompressor(self.zip_path.parent))
+            LoggingZipCompressor(
+                ZipCompressor(
+                    self.zip_path.parent, CompressionPolicy.from_config(config.archive)
+                )
+            )
         )
 
+    @staticmethod
+    def _create_pdf_extractor(pdf_path: "Path") -> "PDFExtractorInterface":
+        """Escolhe o extrator: serviço com JVM aquecida, pool de processos ou
+        sequencial, consultando antes o cache de extração (EXTRACT_CACHE).
+
+        Com o serviço (TABULA_WORKER), os blocos são extraídos um a um por ele,
+        mantendo o checkpoint (EXTRACT_CHECKPOINT); EXTRACT_WORKERS não se aplica.
+        """
+        client = create_extraction_client()
+        checkpoint_dir = None
+        if config.data.checkpoint_enabled:
+            checkpoint_dir = config.dirs.cache / "checkpoints"
+        if client is not None and config.data.extract_workers > 1:
+            logger.warning(
+                "TABULA_WORKER ativo: EXTRACT_WORKERS é ignorado; "
+                "o serviço extrai um bloco de cada vez."
+            )
+        if checkpoint_dir is None and (
+            client is not None or config.data.extract_workers == 1
+        ):
+            extractor = PdfExtractor(pdf_path, client, config.data.extract_chunk_pages)
+        elif client is not None:
+            extractor = ParallelPdfExtractor(
+                pdf_path,
+                1,
+                config.data.extract_chunk_pages,
+                checkpoint_dir=checkpoint_dir,
+                client=client,
+            )
+        else:
+            extractor = ParallelPdfExtractor(
+                pdf_path,
+                config.data.extract_workers,
+                config.data.extract_chunk_pages,
+                checkpoint_dir=checkpoint_dir,
+            )
+        if not config.data.cache_enabled:
+            return extractor
+        cache = ExtractionCache(
+            config.dirs.cache / "extraction", config.data.cache_max_mb * 1024 * 1024
+        )
+        return CachedPdfExtractor(extractor, cache)
+
+    def _select_pages(self) -> str:
+        """Páginas a extrair: EXTRACT_PAGES ou, com "auto", a varredura do PDF."""
+        if config.data.extract_pages.strip().lower() != "auto":
+            return config.data.extract_pages
+        scanner = PageScanner(
+            config.dirs.cache / "page_index", config.data.page_scan_min_rulings
+        )
+        return scanner.select_pages(self.pdf_path)
+
+    def _run_streaming(self) -> None:
+        """Extrai, processa e grava cada bloco de páginas antes do próximo
+        (EXTRACT_STREAMING): a memória fica limitada ao tamanho do bloco."""
+        chunks = self.pdf_extractor.iter_tables(pages=self._select_pages())
+        frames = self.data_processor.process_chunks(chunks)
+        rows = self.csv_saver.save_csv_chunks(frames)
+        if not rows:
+            logger.error("Nenhuma tabela encontrada durante a extração.")
+            raise ExtractionError("A extração do PDF não retornou nenhuma tabela.")
+        logger.info(f"Arquivo CSV salvo ({rows} linha(s)).")
+
     def run(self) -> None:
         """
         Executa o processo completo de extração e processamento de tabelas do PDF.
@@ -72,17 +143,20 @@ class TableExtractor(TableExtractorInterface):
         3. Salvamento dos dados em formato CSV.
         4. Compactação do arquivo CSV gerado.
         """
-        tables = self.pdf_extractor.extract_tables(pages="3-181")
-        if not tables:
-            logger.error("Nenhuma tabela encontrada durante a extração.")
-            raise ExtractionError("A extração do PDF não retornou nenhuma tabela.")
+        if config.data.streaming:
+            self._run_streaming()
+        else:
+            tables = self.pdf_extractor.extract_tables(pages=self._select_pages())
+            if not tables:
+                logger.error("Nenhuma tabela encontrada durante a extração.")
+                raise ExtractionError("A extração do PDF não retornou nenhuma tabela.")
 
-        logger.info(f"Tabela extraída com sucesso.")
+            logger.info(f"Tabela extraída com sucesso.")
 
-        table_df = self.data_processor.process_data(tables)
+            table_df = self.data_processor.process_data(tables)
 
-        self.csv_saver.save_csv(table_df)
-        logger.info("Arquivo CSV salvo.")
+            self.csv_saver.save_csv(table_df)
+            logger.info("Arquivo CSV salvo.")
 
         self.zip_compressor.create_zip(self.zip_path, self.file_extension)
         logger.info(f"Tabela salva e compactada!")
@@ -1,5 +1,11 @@
 from .table_process_error import TableProcessingError
 from .extract_table_error import ExtractionError
 from .extract_pdf_link_error import LinkPDFExtractionError
+from .incomplete_download_error import IncompleteDownloadError
 
-__all__ = ["TableProcessingError", "ExtractionError", "LinkPDFExtractionError"]
+__all__ = [
+    "TableProcessingError",
+    "ExtractionError",
+    "LinkPDFExtractionError",
+    "IncompleteDownloadError",
+]
@@ -0,0 +1,4 @@
+class IncompleteDownloadError(Exception):
+    """Exceção lançada quando um download termina com tamanho ou versão inesperados."""
+
+    pass
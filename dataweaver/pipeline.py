@@ -2,9 +2,13 @@
 Pipeline DataWeaver - Fluxo Completo de Processamento
 """
 
-from .scraper.modules import DefaultPDFServiceFactory
-from .data.modules import TableExtractor
-from .utils import ensure_directory_exists, PDFRemove
+from .scraper.modules import (
+    DefaultPDFServiceFactory,
+    AsyncPDFServiceFactory,
+    get_archive_codec,
+)
+from .data.modules import TableExtractor, ArchiveMember
+from .utils import ensure_directory_exists, PDFRemove, PDFStore
 from .settings import config, logger
 
 
@@ -15,18 +19,28 @@ class PDFProcessor:
         self.pdfs_dir = config.dirs.pdfs
         self.zip_name = config.scraper.zip_name
         self.key_filter = config.scraper.filter
-        self.url = config.scraper.url
+        self.urls = config.scraper.urls
+        self.max_workers = config.scraper.max_workers
+        self.use_async = config.scraper.use_async
         self.pdf_extension = "pdf"
 
     def run(self) -> None:
         """Executa o processo completo de coleta e compactação de PDFs"""
         logger.info("Iniciando o serviço de processamento de PDFs...")
 
-        factory = DefaultPDFServiceFactory(self.pdfs_dir, self.key_filter)
+        factory_class = (
+            AsyncPDFServiceFactory if self.use_async else DefaultPDFServiceFactory
+        )
+        factory = factory_class(
+            self.pdfs_dir, self.key_filter, self.max_workers, config.dirs.cache
+        )
         service = factory.create_service(self.zip_name, self.pdf_extension)
 
         logger.info("Executando o processo de coleta e compactação dos PDFs...")
-        service.process(self.url)
+        if len(self.urls) > 1:
+            service.process_many(self.urls)
+        else:
+            service.process(self.urls[0])
         logger.info("Processamento de PDFs concluído!")
 
 
@@ -42,9 +56,33 @@ class CSVExtractor:
         ensure_directory_exists(self.csv_dir)
 
     def set_pdf_file(self, pdf_filename: str) -> None:
-        """Configura o arquivo PDF a ser processado"""
+        """Configura o arquivo PDF a ser processado.
+
+        Se o PDF solto já foi removido (CleanupManager), ele é lido diretamente
+        do arquivo gerado pelo PDFProcessor (nome conforme ARCHIVE_CODEC), sem
+        novo download. Apenas contêineres ZIP permitem essa leitura.
+        """
         self.pdf_file = config.dirs.pdfs / pdf_filename
         self.csv_file = self.csv_dir / f"{pdf_filename.rsplit('.', 1)[0]}.csv"
+        if self.pdf_file.exists():
+            return
+
+        try:
+            codec = get_archive_codec(config.archive.codec)
+        except ValueError as e:
+            logger.warning(
+                f"{pdf_filename} não encontrado; arquivo de PDFs ignorado: {e}"
+            )
+            return
+        archive = config.dirs.pdfs / codec.archive_name(config.scraper.zip_name)
+        if codec.container != "zip":
+            logger.warning(
+                f"{pdf_filename} não encontrado e {archive.name} ({codec.name}) "
+                f"não permite ler membros diretamente; use um codec zip-*."
+            )
+        elif ArchiveMember.contains(archive, pdf_filename):
+            logger.info(f"Usando {pdf_filename} de dentro de {archive.name}.")
+            self.pdf_file = ArchiveMember(archive, pdf_filename, config.dirs.cache)
 
     def run(self) -> None:
         """Executa a extração de dados da tabela do PDF"""
@@ -59,7 +97,11 @@ class CSVExtractor:
             self.csv_extension,
             self.abbreviations,
         )
-        extractor.run()
+        try:
+            extractor.run()
+        finally:
+            if isinstance(self.pdf_file, ArchiveMember):
+                self.pdf_file.close()
 
 
 class CleanupManager:
@@ -67,9 +109,30 @@ class CleanupManager:
 
     def __init__(self) -> None:
         self.pdfs_dir = config.dirs.pdfs
+        self.store_dir = config.dirs.cache / "pdf_store"
+        self.store_enabled = config.scraper.store_enabled
+        self.store_max_bytes = config.scraper.store_max_mb * 1024 * 1024
 
     def run(self) -> None:
-        """Executa a limpeza dos arquivos PDF temporários"""
-        logger.info("Limpando arquivos temporários...")
-        pdf_remove = PDFRemove(self.pdfs_dir)
-        pdf_remove.remove_pdfs()
+        """Executa a limpeza dos arquivos PDF temporários.
+
+        Com o armazenamento de PDFs ativo (PDF_STORE), os PDFs são guardados
+        no armazenamento (limitado a PDF_STORE_MAX_MB, removendo os menos usados
+        recentemente) e a pasta de PDFs é esvaziada: a próxima execução restaura
+        apenas os arquivos ainda publicados. Sem ele, todos os PDFs são apagados.
+        """
+        if not self.store_enabled:
+            logger.info("Limpando arquivos temporários...")
+            pdf_remove = PDFRemove(self.pdfs_dir)
+            pdf_remove.remove_pdfs()
+            return
+
+        logger.info("Aplicando o limite de espaço do armazenamento de PDFs...")
+        store = PDFStore(self.store_dir, self.pdfs_dir, self.store_max_bytes)
+        store.sync()
+        removed = store.evict()
+        store.clear_folder()
+        logger.info(
+            f"{len(removed)} arquivo(s) removido(s); "
+            f"{store.total_size / 1024 / 1024:.1f} MB mantidos para a próxima execução."
+        )
@@ -1,30 +1,83 @@
-from .factories import DefaultPDFServiceFactory
+from .factories import DefaultPDFServiceFactory, AsyncPDFServiceFactory
 from .zip_compressor import (
     ZipCompressor,
+    ParallelZipCompressor,
+    CodecArchiveCompressor,
     ValidationZipCompressor,
     LoggingZipCompressor,
     ZipCompressorDecorator,
 )
-from .pdf_processor import PDFProcessingService
+from .compression_policy import CompressionPolicy, CompressionDecision
+from .archive_sink import ZipArchiveSink
+from .archive_codecs import (
+    ArchiveCodec,
+    register_codec,
+    get_archive_codec,
+    available_codecs,
+)
+from .zip_writer import RawZipWriter, ZipMember, deflate_file
+from .pdf_processor import PDFProcessingService, DownloadSummary
 from .pdf_scraper import (
     PDFLinkExtractor,
+    SinglePassPDFLinkExtractor,
     RequestsHttpClient,
     AnchorPDFExtractionStrategy,
     ParagraphPDFExtractionStrategy,
     RequestsPDFScraper,
 )
 from .file_manager import FileDownloader, FileManager, FileSaver
+from .streaming_pdf_scraper import StreamingPDFScraper, StreamingPDFLinkParser
+from .crawler import CrawlingPDFScraper, CrawlFrontier, canonicalize_url
+from .http_session import PooledHttpSession
+from .rate_control import RetryPolicy, AdaptiveConcurrencyLimiter
+from .http_cache import HttpValidatorCache
+from .html_parsing import HtmlDocumentParser, resolve_html_parser
+from .async_http_session import AsyncHttpSession
+from .async_pdf_scraper import AiohttpHttpClient, AsyncPDFScraper
+from .async_file_manager import AsyncFileManager
+from .async_pdf_processor import AsyncPDFProcessingService
 
 __all__ = [
     "DefaultPDFServiceFactory",
+    "AsyncPDFServiceFactory",
     "ZipCompressor",
+    "ParallelZipCompressor",
+    "CodecArchiveCompressor",
+    "ArchiveCodec",
+    "register_codec",
+    "get_archive_codec",
+    "available_codecs",
+    "RawZipWriter",
+    "ZipArchiveSink",
+    "CompressionPolicy",
+    "CompressionDecision",
+    "ZipMember",
+    "deflate_file",
     "ValidationZipCompressor",
     "LoggingZipCompressor",
     "PDFProcessingService",
+    "DownloadSummary",
     "PDFLinkExtractor",
+    "SinglePassPDFLinkExtractor",
     "FileDownloader",
     "FileManager",
     "FileSaver",
+    "StreamingPDFScraper",
+    "StreamingPDFLinkParser",
+    "CrawlingPDFScraper",
+    "CrawlFrontier",
+    "canonicalize_url",
+    "PooledHttpSession",
+    "RetryPolicy",
+    "AdaptiveConcurrencyLimiter",
+    "HttpValidatorCache",
+    "HtmlDocumentParser",
+    "resolve_html_parser",
+    "AsyncHttpSession",
+    "AiohttpHttpClient",
+    "AsyncPDFScraper",
+    "AsyncFileManager",
+    "AsyncPDFProcessingService",
     "RequestsHttpClient",
     "AnchorPDFExtractionStrategy",
     "ParagraphPDFExtractionStrategy",
@@ -0,0 +1,136 @@
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+import importlib.util
+import tarfile
+import zipfile
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+# Código do método Zstandard no formato ZIP (APPNOTE 4.4.5)
+ZIP_ZSTANDARD = getattr(zipfile, "ZIP_ZSTANDARD", 93)
+
+
+def module_available(name: str) -> bool:
+    """Indica se um módulo (inclusive submódulos) pode ser importado."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+@dataclass(frozen=True)
+class ArchiveCodec:
+    """Formato de arquivo compactado: contêiner (zip/tar) + algoritmo.
+
+    Attributes:
+        name: Nome usado na configuração (ARCHIVE_CODEC)
+        extension: Extensão dos arquivos gerados (ex: ``.tar.xz``)
+        container: ``zip`` ou ``tar``
+        compression: Método do zipfile (zip) ou sufixo do modo do tarfile (tar)
+        level_option: Argumento do nível de compressão no tarfile (tar)
+        requires: Módulos necessários (ex: ``compression.zstd``, Python 3.14+)
+    """
+
+    name: str
+    extension: str
+    container: str
+    compression: "int | str"
+    level_option: "str | None" = None
+    requires: tuple[str, ...] = field(default_factory=tuple)
+
+    def available(self) -> bool:
+        """Indica se o codec pode ser usado neste interpretador."""
+        if self.container == "zip" and self.compression == ZIP_ZSTANDARD:
+            if not hasattr(zipfile, "ZIP_ZSTANDARD"):
+                return False
+        return all(module_available(module) for module in self.requires)
+
+    def archive_name(self, name: str) -> str:
+        """Ajusta o nome do arquivo para a extensão do codec.
+
+        Um sufixo ``.zip`` é trocado pela extensão do codec (ex:
+        ``pdfs.zip`` -> ``pdfs.tar.xz``); outros nomes são mantidos.
+        """
+        name = str(name)
+        if name.endswith(".zip") and not name.endswith(self.extension):
+            return f"{name[: -len('.zip')]}{self.extension}"
+        return name
+
+    def write(
+        self,
+        archive_path: "Path",
+        files: "Iterable[Path]",
+        base: "Path",
+        level: "int | None" = None,
+    ) -> None:
+        """Grava os arquivos no formato do codec.
+
+        Args:
+            archive_path: Arquivo de saída
+            files: Arquivos a incluir
+            base: Diretório usado para o nome relativo dos membros
+            level: (Opcional) Nível de compressão
+        """
+        if self.container == "zip":
+            with zipfile.ZipFile(
+                archive_path, "w", self.compression, compresslevel=level
+            ) as archive:
+                for path in files:
+                    archive.write(path, path.relative_to(base).as_posix())
+            return
+
+        options = {}
+        if level is not None and self.level_option:
+            options[self.level_option] = level
+        with tarfile.open(archive_path, f"w:{self.compression}", **options) as archive:
+            for path in files:
+                archive.add(path, path.relative_to(base).as_posix())
+
+
+ARCHIVE_CODECS: dict[str, ArchiveCodec] = {}
+
+
+def register_codec(codec: ArchiveCodec) -> ArchiveCodec:
+    """Registra (ou substitui) um codec pelo nome."""
+    ARCHIVE_CODECS[codec.name] = codec
+    return codec
+
+
+def get_archive_codec(name: str) -> ArchiveCodec:
+    """Obtém um codec registrado e disponível.
+
+    Raises:
+        ValueError: Se o codec não existir ou não estiver disponível
+    """
+    codec = ARCHIVE_CODECS.get(name)
+    if codec is None:
+        raise ValueError(
+            f"Codec de compactação desconhecido: {name} "
+            f"(opções: {', '.join(sorted(ARCHIVE_CODECS))})"
+        )
+    if not codec.available():
+        raise ValueError(f"Codec de compactação indisponível neste ambiente: {name}")
+    return codec
+
+
+def available_codecs() -> list[ArchiveCodec]:
+    """Codecs registrados que podem ser usados neste interpretador."""
+    return [codec for codec in ARCHIVE_CODECS.values() if codec.available()]
+
+
+register_codec(ArchiveCodec("zip-deflate", ".zip", "zip", zipfile.ZIP_DEFLATED))
+register_codec(ArchiveCodec("zip-lzma", ".zip", "zip", zipfile.ZIP_LZMA))
+register_codec(
+    ArchiveCodec(
+        "zip-zstd", ".zip", "zip", ZIP_ZSTANDARD, requires=("compression.zstd",)
+    )
+)
+register_codec(ArchiveCodec("tar-gz", ".tar.gz", "tar", "gz", "compresslevel"))
+register_codec(ArchiveCodec("tar-xz", ".tar.xz", "tar", "xz", "preset"))
+register_codec(
+    ArchiveCodec(
+        "tar-zst", ".tar.zst", "tar", "zst", "level", requires=("compression.zstd",)
+    )
+)
@@ -0,0 +1,122 @@
+from .interfaces import ArchiveSinkInterface
+from .zip_writer import RawZipWriter, compress_file
+from dataweaver.settings import logger
+
+from typing import TYPE_CHECKING
+import threading
+import tempfile
+import zipfile
+import fnmatch
+import zlib
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from .compression_policy import CompressionPolicy
+
+
+class ZipArchiveSink(ArchiveSinkInterface):
+    """ZIP alimentado pelos downloads conforme terminam.
+
+    Cada arquivo concluído é comprimido na própria thread de download (zlib
+    libera o GIL) e acrescentado ao ZIP aberto sob um lock, enquanto os
+    demais downloads continuam; ao final basta escrever o diretório central.
+    O ZIP é montado em um temporário e só substitui o anterior em ``close``.
+
+    Arquivos soltos são mantidos apenas quando casam com ``keep_patterns``
+    (ex: o PDF usado pela extração de tabelas); os demais são removidos
+    depois de entrarem no ZIP.
+    """
+
+    def __init__(
+        self,
+        folder: "Path",
+        policy: "CompressionPolicy | None" = None,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        keep_patterns: "list[str] | None" = None,
+    ) -> None:
+        """Inicializa o destino.
+
+        Args:
+            folder: Pasta dos arquivos baixados e do ZIP gerado
+            policy: (Opcional) Política STORED/DEFLATE por arquivo
+            level: Nível DEFLATE quando não há política
+            keep_patterns: Padrões (fnmatch) dos arquivos soltos a manter;
+                           None mantém todos
+        """
+        self.folder = folder
+        self.policy = policy
+        self.level = level
+        self.keep_patterns = keep_patterns
+        self.added: list[str] = []
+        self._lock = threading.Lock()
+        self._writer: "RawZipWriter | None" = None
+        self._output = None
+        self._tmp_name: "str | None" = None
+        self._zip_path: "Path | None" = None
+
+    def open(self, archive_name: str) -> None:
+        """Cria o ZIP temporário.
+
+        Raises:
+            ValueError: Se o nome não terminar com .zip
+        """
+        if not str(archive_name).endswith(".zip"):
+            raise ValueError("O nome do arquivo deve terminar com .zip")
+        self.abort()
+        self._zip_path = self.folder / archive_name
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.folder, suffix=".tmp")
+        self._output = os.fdopen(fd, "wb")
+        self._writer = RawZipWriter(self._output)
+        self.added = []
+
+    def add(self, path: "Path") -> None:
+        """Comprime o arquivo e o acrescenta ao ZIP.
+
+        Raises:
+            RuntimeError: Se o ZIP não foi aberto
+        """
+        if self._writer is None:
+            raise RuntimeError("Arquivo compactado não foi aberto")
+        arcname = path.name
+        method, level = zipfile.ZIP_DEFLATED, self.level
+        if self.policy is not None:
+            decision = self.policy.decide(path)
+            method, level = decision.method, decision.level
+        member, data = compress_file(path, arcname, method, level)
+        with data:
+            with self._lock:
+                if arcname in self.added:
+                    logger.warning(f"Ignorando arquivo repetido no ZIP: {arcname}")
+                    return
+                self._writer.write_member(member, data)
+                self.added.append(arcname)
+        logger.debug(f"Adicionado: {arcname}")
+
+        if not self._keep(arcname):
+            path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Escreve o diretório central e publica o ZIP."""
+        if self._writer is None:
+            raise RuntimeError("Arquivo compactado não foi aberto")
+        with self._lock:
+            self._writer.close()
+            self._output.close()
+            os.replace(self._tmp_name, self._zip_path)
+            self._writer = self._output = self._tmp_name = None
+        logger.info(f"{len(self.added)} arquivo(s) compactado(s) durante os downloads.")
+
+    def abort(self) -> None:
+        """Descarta o ZIP temporário, se houver."""
+        with self._lock:
+            if self._output is not None:
+                self._output.close()
+            if self._tmp_name is not None and os.path.exists(self._tmp_name):
+                os.unlink(self._tmp_name)
+            self._writer = self._output = self._tmp_name = None
+
+    def _keep(self, filename: str) -> bool:
+        if self.keep_patterns is None:
+            return True
+        return any(fnmatch.fnmatch(filename, pattern) for pattern in self.keep_patterns)
@@ -0,0 +1,106 @@
+from .interfaces import AsyncFileManagerInterface
+from .async_http_session import AsyncHttpSession
+from .file_manager import AtomicFileWriter, CHUNK_SIZE
+from dataweaver.settings import logger
+
+from typing import TYPE_CHECKING
+import asyncio
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from .http_cache import HttpValidatorCache
+    from dataweaver.utils.interfaces import PDFStoreInterface
+
+
+class AsyncFileManager(AsyncFileManagerInterface):
+    """Baixa arquivos de forma assíncrona gravando-os em disco por blocos.
+
+    Usa o mesmo AtomicFileWriter do FileManager síncrono: o corpo da resposta
+    é escrito em um temporário e renomeado ao final, com tamanho e hash
+    calculados durante a escrita. Toda operação de disco (escrita dos blocos,
+    fsync, cache e armazenamento de PDFs) roda em uma thread auxiliar, para
+    que os demais downloads do event loop não esperem pelo disco.
+
+    Padrões de Projeto/SOLID:
+        Facade - combina download e armazenamento em uma única chamada
+        Injeção de Dependência - recebe a sessão assíncrona compartilhada
+    """
+
+    def __init__(
+        self,
+        folder: "Path",
+        session: AsyncHttpSession = None,
+        chunk_size: int = CHUNK_SIZE,
+        cache: "HttpValidatorCache" = None,
+        store: "PDFStoreInterface" = None,
+    ) -> None:
+        """Inicializa o gerenciador de arquivos.
+
+        Args:
+            folder: Diretório alvo para arquivos salvos.
+            session: (Opcional) Sessão assíncrona compartilhada.
+            chunk_size: Tamanho dos blocos lidos da rede.
+            cache: (Opcional) Cache de validadores para GET condicional.
+            store: (Opcional) Armazenamento por conteúdo; restaura cópias
+                   locais antes do download e registra os arquivos baixados.
+        """
+        self.folder = folder
+        self.session = session or AsyncHttpSession()
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.store = store
+
+    async def save_file(self, url: str) -> "Path":
+        """Baixa e salva um arquivo a partir de uma URL.
+
+        Args:
+            url: URL completa do arquivo para download/salvamento.
+
+        Returns:
+            Caminho do arquivo local (baixado ou reaproveitado após 304).
+
+        Raises:
+            Exception: Propaga quaisquer erros de download/salvamento.
+        """
+        filename = os.path.basename(url)
+        path = self.folder / filename
+        restored = False
+        try:
+            if self.store is not None:
+                # Recria a cópia local guardada para que o GET condicional a reaproveite
+                restored = await asyncio.to_thread(self.store.restore, filename)
+            headers = {"Accept-Encoding": "identity"}
+            if self.cache is not None:
+                headers.update(self.cache.conditional_headers(url, path))
+
+            async with self.session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    logger.info(
+                        f"Arquivo não modificado, download ignorado: {filename[:30]}..."
+                    )
+                    return path
+                response.raise_for_status()
+                writer = await asyncio.to_thread(AtomicFileWriter, path)
+                with writer:
+                    async for chunk in response.content.iter_chunked(self.chunk_size):
+                        await asyncio.to_thread(writer.write, chunk)
+                    saved = await asyncio.to_thread(writer.commit)
+
+            if self.cache is not None:
+                await asyncio.to_thread(
+                    self.cache.update, url, response.headers, saved.size, saved.sha256
+                )
+            if self.store is not None:
+                await asyncio.to_thread(self.store.add, saved.path, saved.sha256)
+            logger.info(
+                f"Arquivo baixado com sucesso: {saved.path.name[:30]}... "
+                f"({saved.size} bytes)"
+            )
+            return saved.path
+        except Exception as e:
+            if restored:
+                # A cópia guardada não foi confirmada pelo servidor: fica fora do ZIP
+                path.unlink(missing_ok=True)
+            logger.error(f"Erro ao baixar/salvar {filename[:30]}...: {str(e)}")
+            raise
@@ -0,0 +1,139 @@
+from dataweaver.settings import logger
+from .rate_control import RetryPolicy
+
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+import asyncio
+import aiohttp
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from dataweaver.settings.config import HttpConfig
+
+
+class AsyncHttpSession:
+    """Sessão aiohttp compartilhada pelos componentes assíncronos.
+
+    Equivalente assíncrono de PooledHttpSession: um único pool de conexões
+    (TCPConnector) para o cliente HTTP e o gerenciador de arquivos. A
+    ``aiohttp.ClientSession`` só pode ser criada dentro de um event loop, por
+    isso é aberta sob demanda na primeira requisição.
+
+    Padrão de Projeto:
+        Proxy - adia a criação da sessão real até o primeiro uso
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        keep_alive: bool = True,
+        retry_policy: "RetryPolicy | None" = None,
+    ) -> None:
+        """Inicializa a configuração da sessão.
+
+        Args:
+            pool_size: Conexões simultâneas por host
+            connect_timeout: Timeout para estabelecer a conexão (segundos)
+            read_timeout: Timeout de leitura entre blocos recebidos (segundos)
+            keep_alive: Se False, fecha a conexão após cada requisição
+            retry_policy: (Opcional) Política de novas tentativas para 429/5xx
+                          e falhas de conexão
+        """
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.keep_alive = keep_alive
+        self.retry_policy = retry_policy
+        self._session: "aiohttp.ClientSession | None" = None
+
+    @classmethod
+    def from_config(
+        cls, http_config: "HttpConfig", min_pool_size: int = 1
+    ) -> "AsyncHttpSession":
+        """Cria a sessão a partir de ``config.http``.
+
+        Args:
+            http_config: Configuração HTTP da aplicação
+            min_pool_size: Tamanho mínimo do pool (ex: número de workers de download)
+        """
+        return cls(
+            pool_size=max(http_config.pool_size, min_pool_size),
+            connect_timeout=http_config.connect_timeout,
+            read_timeout=http_config.read_timeout,
+            keep_alive=http_config.keep_alive,
+            retry_policy=RetryPolicy(
+                http_config.max_retries,
+                http_config.backoff_base,
+                http_config.backoff_max,
+            ),
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Retorna a ClientSession, criando-a no event loop corrente."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_size,
+                limit_per_host=self.pool_size,
+                force_close=not self.keep_alive,
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.connect_timeout, sock_read=self.read_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs) -> "AsyncIterator[aiohttp.ClientResponse]":
+        """Executa uma requisição GET (usar com ``async with``).
+
+        Com uma RetryPolicy, respostas 429/5xx e falhas de conexão são
+        repetidas após o backoff (ou o Retry-After) sem bloquear o event loop.
+        """
+        attempt = 0
+        while True:
+            try:
+                response = await self.session.get(url, **kwargs)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if not self._can_retry(attempt):
+                    raise
+                logger.warning(
+                    f"Falha de conexão em {url[:50]}..., nova tentativa "
+                    f"({attempt + 1}/{self.retry_policy.max_retries}): {e}"
+                )
+                await asyncio.sleep(self.retry_policy.delay(attempt))
+                attempt += 1
+                continue
+
+            if (
+                self._can_retry(attempt)
+                and response.status in self.retry_policy.retry_statuses
+            ):
+                retry_after = response.headers.get("Retry-After")
+                response.release()
+                logger.warning(
+                    f"HTTP {response.status} em {url[:50]}..., nova tentativa "
+                    f"({attempt + 1}/{self.retry_policy.max_retries})"
+                )
+                await asyncio.sleep(self.retry_policy.delay(attempt, retry_after))
+                attempt += 1
+                continue
+
+            try:
+                yield response
+            finally:
+                response.release()
+            return
+
+    def _can_retry(self, attempt: int) -> bool:
+        return self.retry_policy is not None and self.retry_policy.should_retry(
+            "GET", attempt
+        )
+
+    async def close(self) -> None:
+        """Fecha a sessão e libera as conexões do pool."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
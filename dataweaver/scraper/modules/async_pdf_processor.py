@@ -0,0 +1,191 @@
+"""
+Pipeline Scraper assíncrono - várias páginas e downloads em um único event loop
+"""
+
+from .interfaces import PDFProcessingServiceInterface
+from .zip_compressor import ValidationZipCompressor, LoggingZipCompressor
+from .pdf_processor import DownloadSummary
+from .crawler import canonicalize_url
+from dataweaver.settings import logger
+
+from typing import TYPE_CHECKING
+import asyncio
+
+if TYPE_CHECKING:
+    from .interfaces import (
+        AsyncPDFScraperInterface,
+        AsyncFileManagerInterface,
+        ZipCompressorInterface,
+        ArchiveSinkInterface,
+    )
+    from .async_http_session import AsyncHttpSession
+
+
+class AsyncPDFProcessingService(PDFProcessingServiceInterface):
+    """Versão assíncrona do PDFProcessingService.
+
+    Busca várias páginas e baixa os PDFs encontrados no mesmo event loop,
+    limitando as transferências simultâneas com um ``asyncio.Semaphore``.
+    Os downloads de uma página começam assim que seus links são extraídos,
+    sem esperar as demais páginas. Com um ArchiveSinkInterface, cada arquivo
+    é compactado (em uma thread auxiliar) assim que seu download termina.
+
+    Padrão de Projeto/SOLID:
+        Facade - mesma interface síncrona ``process`` do serviço padrão
+        Dependency Injection - recebe dependências via construtor
+    """
+
+    def __init__(
+        self,
+        zip_name: str,
+        file_extension: str,
+        scraper: "AsyncPDFScraperInterface",
+        file_manager: "AsyncFileManagerInterface",
+        zip_compressor: "ZipCompressorInterface",
+        max_workers: int = 1,
+        http_session: "AsyncHttpSession" = None,
+        archive_sink: "ArchiveSinkInterface | None" = None,
+    ) -> None:
+        """Inicializa o serviço com seus componentes.
+
+        Args:
+            zip_name: Nome do arquivo ZIP de saída
+            file_extension: Extensão do arquivo alvo (pdf)
+            scraper: Scraper assíncrono de links PDF
+            file_manager: Gerenciador assíncrono de downloads
+            zip_compressor: Será automaticamente decorado com
+                            Validation + Logging decorators
+            max_workers: Número máximo de requisições simultâneas
+            http_session: (Opcional) Sessão compartilhada, fechada ao fim de ``process``
+            archive_sink: (Opcional) Recebe cada arquivo assim que é baixado;
+                          substitui a compactação ao final
+        """
+        self.zip_name = zip_name
+        self.file_extension = file_extension
+        self.scraper = scraper
+        self.file_manager = file_manager
+        self.max_workers = max(1, max_workers)
+        self.http_session = http_session
+        self.archive_sink = archive_sink
+        self.summary: "DownloadSummary | None" = None
+
+        # Uso de Decorators
+        self.zip_compressor = ValidationZipCompressor(
+            LoggingZipCompressor(zip_compressor)
+        )
+
+    def process(self, url: str) -> None:
+        """Executa o pipeline para uma página em um event loop próprio.
+
+        Args:
+            url: URL da página contendo os PDFs
+        """
+        asyncio.run(self._run([url]))
+
+    def process_many(self, urls: list[str]) -> None:
+        """Executa o pipeline para várias páginas em um único event loop.
+
+        Args:
+            urls: URLs das páginas contendo os PDFs
+        """
+        asyncio.run(self._run(urls))
+
+    async def _run(self, urls: list[str]) -> None:
+        try:
+            await self.process_async(urls)
+        finally:
+            if self.http_session is not None:
+                await self.http_session.close()
+
+    async def process_async(self, urls: list[str]) -> DownloadSummary:
+        """Busca as páginas, baixa os PDFs e compacta o resultado.
+
+        Fluxo:
+            1. Extrai os links de todas as páginas (sem repetições) concorrentemente
+            2. Agenda o download de cada link novo (sem duplicatas entre páginas)
+            3. Compacta todos os arquivos baixados em um único ZIP
+
+        Args:
+            urls: URLs das páginas contendo os PDFs
+
+        Returns:
+            DownloadSummary com os sucessos e falhas ordenados por URL
+
+        Raises:
+            Exception: Falhas na extração de links são críticas e propagadas
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        results: dict[str, "str | None"] = {}
+        downloads: list[asyncio.Task] = []
+
+        async def download(link: str) -> None:
+            async with semaphore:
+                results[link] = await self._download(link)
+
+        async def scrape(url: str) -> None:
+            async with semaphore:
+                links = await self.scraper.get_pdf_links(url)
+            for link in links:
+                if link not in results:
+                    results[link] = None
+                    downloads.append(asyncio.create_task(download(link)))
+
+        pages: dict[str, str] = {}
+        for url in urls:
+            pages.setdefault(canonicalize_url(url), url)
+
+        try:
+            logger.info(f"Iniciando busca por PDFs em {len(pages)} página(s)...")
+            if self.archive_sink is not None:
+                await asyncio.to_thread(self.archive_sink.open, self.zip_name)
+            await asyncio.gather(*(scrape(url) for url in pages.values()))
+
+            if not results:
+                logger.warning("Nenhum PDF encontrado na página.")
+                await self._abort_archive()
+                self.summary = DownloadSummary()
+                return self.summary
+
+            logger.info(f"Iniciando download de {len(results)} PDFs...")
+            await asyncio.gather(*downloads)
+            self.summary = DownloadSummary.from_results(results)
+            logger.info(
+                f"Downloads concluídos: {len(self.summary.succeeded)} sucesso(s), "
+                f"{len(self.summary.failed)} falha(s)."
+            )
+
+            if self.archive_sink is not None:
+                logger.info("Finalizando o arquivo compactado...")
+                await asyncio.to_thread(self.archive_sink.close)
+            else:
+                logger.info("Compactando arquivos...")
+                await asyncio.to_thread(
+                    self.zip_compressor.create_zip, self.zip_name, self.file_extension
+                )
+            return self.summary
+
+        except Exception as e:
+            for task in downloads:
+                task.cancel()
+            await self._abort_archive()
+            logger.critical(f"Falha crítica no processamento: {str(e)}")
+            raise
+
+    async def _abort_archive(self) -> None:
+        if self.archive_sink is not None:
+            await asyncio.to_thread(self.archive_sink.abort)
+
+    async def _download(self, link: str) -> "str | None":
+        """Baixa um único arquivo isolando a falha dos demais.
+
+        Returns:
+            None em caso de sucesso ou a mensagem de erro
+        """
+        try:
+            path = await self.file_manager.save_file(link)
+            if self.archive_sink is not None:
+                await asyncio.to_thread(self.archive_sink.add, path)
+            return None
+        except Exception as e:
+            logger.error(f"Falha no download: {link} - Erro: {str(e)}")
+            return str(e)
@@ -0,0 +1,82 @@
+from dataweaver.settings import logger
+from dataweaver.errors import LinkPDFExtractionError
+from .interfaces import (
+    AsyncPDFScraperInterface,
+    AsyncHttpClientInterface,
+    PDFExtractionStrategy,
+)
+from .async_http_session import AsyncHttpSession
+from .html_parsing import HtmlDocumentParser
+
+import asyncio
+import aiohttp
+
+
+class AiohttpHttpClient(AsyncHttpClientInterface):
+    """Implementação assíncrona de cliente HTTP usando aiohttp.
+
+    Padrão de Projeto:
+        Adapter - adapta a interface do aiohttp para AsyncHttpClientInterface
+    """
+
+    def __init__(self, session: AsyncHttpSession = None) -> None:
+        """Inicializa o cliente.
+
+        Args:
+            session: (Opcional) Sessão assíncrona compartilhada.
+        """
+        self.session = session or AsyncHttpSession()
+
+    async def fetch_html(self, url: str) -> str:
+        """Obtém o conteúdo HTML de uma URL.
+
+        Args:
+            url: Endereço para requisição GET
+
+        Returns:
+            String com o conteúdo HTML
+
+        Raises:
+            aiohttp.ClientError: Em falhas de rede/status HTTP de erro
+        """
+        try:
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                return await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Falha na requisição para {url[:50]}...: {e}")
+            raise
+
+
+class AsyncPDFScraper(AsyncPDFScraperInterface):
+    """Scraper assíncrono que reutiliza as estratégias de extração síncronas.
+
+    O parsing do HTML é CPU-bound e roda em uma thread auxiliar para não
+    bloquear o event loop enquanto outras transferências estão em andamento.
+
+    Padrão de Projeto:
+        Strategy - delega a extração de links para PDFExtractionStrategy
+    """
+
+    def __init__(
+        self,
+        http_client: AsyncHttpClientInterface,
+        extractor: PDFExtractionStrategy,
+        document_parser: HtmlDocumentParser = None,
+    ) -> None:
+        self.http_client = http_client
+        self.extractor = extractor
+        self.document_parser = document_parser or HtmlDocumentParser()
+
+    async def get_pdf_links(self, url: str) -> list[str]:
+        """Obtém links de PDFs de uma página web."""
+        try:
+            html = await self.http_client.fetch_html(url)
+            return await asyncio.to_thread(self._extract, html, url)
+        except Exception:
+            logger.error("Erro ao extrair PDFs")
+            raise LinkPDFExtractionError(f"Erro ao processar a URL: {url}")
+
+    def _extract(self, html: str, url: str) -> list[str]:
+        soup = self.document_parser.parse(html)
+        return list(self.extractor.extract(soup, url))
@@ -0,0 +1,116 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+import zipfile
+import zlib
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from dataweaver.settings.config import ArchiveConfig
+
+# Nível usado apenas para estimar a compressibilidade da amostra
+SAMPLE_LEVEL = 1
+
+
+@dataclass(frozen=True)
+class CompressionDecision:
+    """Escolha de compressão de um membro do ZIP e o motivo."""
+
+    method: int  # zipfile.ZIP_STORED ou zipfile.ZIP_DEFLATED
+    level: "int | None"  # Nível DEFLATE (None para STORED)
+    ratio: float  # Tamanho comprimido / original estimado pela amostra
+    reason: str  # Justificativa registrada no log
+
+    @property
+    def stored(self) -> bool:
+        return self.method == zipfile.ZIP_STORED
+
+
+class CompressionPolicy:
+    """Decide, por arquivo, entre guardar sem compressão (STORED) ou DEFLATE.
+
+    Lê alguns blocos do arquivo (o primeiro e outros distribuídos ao longo do
+    conteúdo), comprime a amostra com um nível rápido e estima a razão
+    comprimido/original:
+        - razão >= ``store_threshold``: STORED (ex: PDFs, já comprimidos
+          internamente; comprimir de novo gasta CPU sem reduzir o tamanho)
+        - razão >= ``fast_threshold``: DEFLATE no nível 1 (ganho moderado)
+        - abaixo disso: DEFLATE no nível configurado (ex: CSVs)
+    """
+
+    def __init__(
+        self,
+        store_threshold: float = 0.9,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        fast_threshold: float = 0.5,
+        block_size: int = 64 * 1024,
+        sample_blocks: int = 4,
+    ) -> None:
+        """Inicializa a política.
+
+        Args:
+            store_threshold: Razão estimada a partir da qual o arquivo não é comprimido
+            level: Nível DEFLATE dos arquivos bem compressíveis
+            fast_threshold: Razão a partir da qual usa o nível mais rápido
+            block_size: Tamanho de cada bloco da amostra (bytes)
+            sample_blocks: Número de blocos amostrados por arquivo
+        """
+        self.store_threshold = store_threshold
+        self.level = level
+        self.fast_threshold = min(fast_threshold, store_threshold)
+        self.block_size = max(1, block_size)
+        self.sample_blocks = max(1, sample_blocks)
+
+    @classmethod
+    def from_config(cls, archive: "ArchiveConfig") -> "CompressionPolicy | None":
+        """Cria a política a partir da configuração (None se ZIP_POLICY=false)."""
+        if not archive.policy_enabled:
+            return None
+        return cls(
+            store_threshold=archive.store_threshold,
+            level=archive.level,
+            block_size=archive.sample_kb * 1024,
+        )
+
+    def decide(self, path: "Path") -> CompressionDecision:
+        """Escolhe o método de compressão de um arquivo.
+
+        Args:
+            path: Arquivo a ser adicionado ao ZIP
+
+        Returns:
+            CompressionDecision com o método, o nível e o motivo
+        """
+        sample = self._read_sample(path)
+        if not sample:
+            return CompressionDecision(zipfile.ZIP_STORED, None, 1.0, "arquivo vazio")
+
+        ratio = len(zlib.compress(sample, SAMPLE_LEVEL)) / len(sample)
+        estimate = f"amostra de {len(sample)} bytes comprime para {ratio:.0%}"
+        if ratio >= self.store_threshold:
+            return CompressionDecision(
+                zipfile.ZIP_STORED,
+                None,
+                ratio,
+                f"{estimate} (limite {self.store_threshold:.0%}); já comprimido",
+            )
+        if ratio >= self.fast_threshold:
+            return CompressionDecision(
+                zipfile.ZIP_DEFLATED, 1, ratio, f"{estimate}; ganho moderado"
+            )
+        return CompressionDecision(
+            zipfile.ZIP_DEFLATED, self.level, ratio, f"{estimate}; compressível"
+        )
+
+    def _read_sample(self, path: "Path") -> bytes:
+        """Lê blocos distribuídos uniformemente, começando pelo início do arquivo."""
+        size = os.path.getsize(path)
+        with open(path, "rb") as file:
+            if size <= self.block_size * self.sample_blocks:
+                return file.read()
+            step = size // self.sample_blocks
+            blocks = []
+            for index in range(self.sample_blocks):
+                file.seek(index * step)
+                blocks.append(file.read(self.block_size))
+            return b"".join(blocks)
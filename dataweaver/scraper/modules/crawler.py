@@ -0,0 +1,261 @@
+from dataweaver.settings import logger
+from dataweaver.errors import LinkPDFExtractionError
+from .interfaces import CrawlingPDFScraperInterface
+from .pdf_scraper import RequestsPDFScraper
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from contextlib import contextmanager
+from dataclasses import dataclass
+from collections import deque
+from typing import TYPE_CHECKING
+import threading
+import re
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from bs4 import BeautifulSoup
+    from .interfaces import HttpClientInterface, PDFExtractionStrategy
+    from .html_parsing import HtmlDocumentParser
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str, base_url: "str | None" = None) -> str:
+    """Normaliza uma URL para deduplicação.
+
+    - Resolve URLs relativas a partir de ``base_url``
+    - Remove o fragmento (``#...``)
+    - Converte esquema e host para minúsculas e remove a porta padrão
+    - Remove a barra final do caminho (exceto na raiz)
+
+    O caminho e a query são preservados, pois podem diferenciar maiúsculas.
+
+    Raises:
+        ValueError: Se a URL tiver uma porta inválida
+    """
+    if base_url is not None:
+        url = urljoin(base_url, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+
+    host = parts.hostname or ""
+    if ":" in host:
+        host = f"[{host}]"  # IPv6
+    if parts.port is not None and DEFAULT_PORTS.get(scheme) != parts.port:
+        host = f"{host}:{parts.port}"
+    if parts.username is not None:
+        userinfo = parts.username
+        if parts.password is not None:
+            userinfo = f"{userinfo}:{parts.password}"
+        host = f"{userinfo}@{host}"
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, parts.query, ""))
+
+
+@dataclass(frozen=True)
+class CrawlTarget:
+    """Página agendada na fronteira do crawl."""
+
+    url: str  # URL canônica da página
+    depth: int  # Distância (em links) da página inicial
+    seed: str  # Página inicial que originou esta página
+
+
+class CrawlFrontier:
+    """Fila de páginas a visitar, sem repetições entre todas as páginas iniciais.
+
+    Cada URL é canonicalizada antes de entrar na fila e só é aceita uma vez,
+    independentemente de quantas páginas apontem para ela. Páginas além de
+    ``max_depth`` são descartadas.
+    """
+
+    def __init__(self, max_depth: int = 0) -> None:
+        self.max_depth = max(0, max_depth)
+        self._seen: set[str] = set()
+        self._queue: deque[CrawlTarget] = deque()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def add(self, url: str, depth: int = 0, seed: "str | None" = None) -> bool:
+        """Agenda uma página.
+
+        Args:
+            url: URL da página (absoluta)
+            depth: Distância da página inicial
+            seed: Página inicial de origem (None = a própria página)
+
+        Returns:
+            True se a página foi agendada; False se repetida ou fora da profundidade
+        """
+        if depth > self.max_depth:
+            return False
+        try:
+            canonical = canonicalize_url(url)
+        except ValueError:
+            return False
+        if canonical in self._seen:
+            return False
+
+        self._seen.add(canonical)
+        self._queue.append(CrawlTarget(canonical, depth, seed or canonical))
+        return True
+
+    def pop(self) -> "CrawlTarget | None":
+        """Retorna a próxima página agendada (ordem de inserção) ou None."""
+        return self._queue.popleft() if self._queue else None
+
+
+class HostLimiter:
+    """Limita o número de requisições simultâneas por host."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> "Iterator[None]":
+        """Bloqueia até haver uma vaga para o host da URL."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            semaphore = self._slots.get(host)
+            if semaphore is None:
+                semaphore = self._slots[host] = threading.BoundedSemaphore(self.limit)
+        with semaphore:
+            yield
+
+
+class CrawlingPDFScraper(RequestsPDFScraper, CrawlingPDFScraperInterface):
+    """Scraper que percorre várias páginas iniciais e, opcionalmente, suas sub-páginas.
+
+    As páginas são buscadas concorrentemente (até ``max_workers``), respeitando
+    ``per_host_limit`` conexões por host. Links de páginas são seguidos até
+    ``max_depth`` níveis quando estão no mesmo host da página inicial e:
+        - casam com ``follow_pattern``, se informado; ou
+        - ficam sob o caminho da página inicial (paginação, sub-listas).
+
+    Falhas em páginas individuais são registradas e ignoradas; o crawl só
+    falha se nenhuma página inicial puder ser processada.
+
+    Padrão de Projeto:
+        Strategy - delega a extração de links para PDFExtractionStrategy
+    """
+
+    def __init__(
+        self,
+        http_client: "HttpClientInterface",
+        extractor: "PDFExtractionStrategy",
+        document_parser: "HtmlDocumentParser" = None,
+        max_depth: int = 0,
+        follow_pattern: str = "",
+        per_host_limit: int = 2,
+        max_workers: int = 4,
+    ) -> None:
+        """Inicializa o scraper.
+
+        Args:
+            http_client: Cliente HTTP para obter o HTML
+            extractor: Estratégia de extração de links PDF
+            document_parser: (Opcional) Parser do HTML
+            max_depth: Níveis de links seguidos a partir de cada página inicial
+            follow_pattern: (Opcional) Regex dos links de páginas a seguir
+            per_host_limit: Páginas buscadas simultaneamente por host
+            max_workers: Páginas buscadas simultaneamente no total
+        """
+        super().__init__(http_client, extractor, document_parser)
+        self.max_depth = max(0, max_depth)
+        self.follow_pattern = re.compile(follow_pattern) if follow_pattern else None
+        self.host_limiter = HostLimiter(per_host_limit)
+        self.max_workers = max(1, max_workers)
+
+    def get_pdf_links(self, url: str) -> list[str]:
+        """Obtém links de PDFs de uma página (e sub-páginas, se max_depth > 0)."""
+        if self.max_depth == 0:
+            return super().get_pdf_links(url)
+        return self.crawl([url])
+
+    def crawl(self, seeds: "Iterable[str]") -> list[str]:
+        """Percorre as páginas iniciais e retorna os links de PDFs encontrados.
+
+        Args:
+            seeds: URLs das páginas iniciais
+
+        Returns:
+            Links de PDFs canonicalizados e sem duplicatas entre todas as páginas
+
+        Raises:
+            LinkPDFExtractionError: Se nenhuma página inicial puder ser processada
+        """
+        frontier = CrawlFrontier(self.max_depth)
+        seed_count = sum(frontier.add(seed) for seed in seeds)
+        failed_seeds = 0
+        pdf_links: dict[str, None] = {}
+        pending: dict["Future", CrawlTarget] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="crawl"
+        ) as executor:
+            while frontier or pending:
+                while (target := frontier.pop()) is not None:
+                    pending[executor.submit(self._visit, target)] = target
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    target = pending.pop(future)
+                    try:
+                        links, pages = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Falha ao processar a página: {target.url} - Erro: {str(e)}"
+                        )
+                        failed_seeds += target.depth == 0
+                        continue
+
+                    for link in links:
+                        pdf_links.setdefault(canonicalize_url(link))
+                    for page in pages:
+                        frontier.add(page, target.depth + 1, target.seed)
+
+        if seed_count and failed_seeds == seed_count:
+            raise LinkPDFExtractionError("Nenhuma página inicial pôde ser processada")
+        logger.info(f"{len(pdf_links)} PDF(s) encontrados em {seed_count} página(s).")
+        return list(pdf_links)
+
+    def _visit(self, target: CrawlTarget) -> tuple[list[str], list[str]]:
+        """Busca uma página e retorna (links de PDFs, links de páginas a seguir)."""
+        with self.host_limiter.slot(target.url):
+            html = self.http_client.fetch_html(target.url)
+        soup = self.document_parser.parse(html)
+        links = list(self.extractor.extract(soup, target.url))
+        pages = []
+        if target.depth < self.max_depth:
+            pages = list(self._follow_links(soup, target))
+        return links, pages
+
+    def _follow_links(
+        self, soup: "BeautifulSoup", target: CrawlTarget
+    ) -> "Iterator[str]":
+        """Seleciona os links de páginas que pertencem ao escopo da página inicial."""
+        seed = urlsplit(target.seed)
+        seed_path = seed.path.rstrip("/") + "/"
+        for anchor in soup.find_all("a", href=True):
+            try:
+                link = canonicalize_url(anchor["href"], target.url)
+            except ValueError:
+                continue
+            parts = urlsplit(link)
+            if parts.scheme not in DEFAULT_PORTS or parts.netloc != seed.netloc:
+                continue
+            if ".pdf" in parts.path.lower():
+                continue
+            if self.follow_pattern is not None:
+                if self.follow_pattern.search(link):
+                    yield link
+            elif parts.path == seed.path or parts.path.startswith(seed_path):
+                yield link
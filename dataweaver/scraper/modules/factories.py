@@ -1,14 +1,31 @@
 from .interfaces import PDFServiceAbstractFactory
 from .pdf_scraper import (
     RequestsHttpClient,
-    PDFLinkExtractor,
+    SinglePassPDFLinkExtractor,
     AnchorPDFExtractionStrategy,
     ParagraphPDFExtractionStrategy,
-    RequestsPDFScraper,
 )
-from .file_manager import FileManager
-from .zip_compressor import ZipCompressor
+from .streaming_pdf_scraper import StreamingPDFScraper
+from .crawler import CrawlingPDFScraper
+from .file_manager import FileManager, FileDownloader
+from .http_session import PooledHttpSession
+from .http_cache import HttpValidatorCache
+from .html_parsing import HtmlDocumentParser, resolve_html_parser
+from .zip_compressor import (
+    ZipCompressor,
+    ParallelZipCompressor,
+    CodecArchiveCompressor,
+)
+from .archive_codecs import get_archive_codec
+from .compression_policy import CompressionPolicy
+from .archive_sink import ZipArchiveSink
 from .pdf_processor import PDFProcessingService
+from .async_http_session import AsyncHttpSession
+from .async_pdf_scraper import AiohttpHttpClient, AsyncPDFScraper
+from .async_file_manager import AsyncFileManager
+from .async_pdf_processor import AsyncPDFProcessingService
+from dataweaver.settings import config, logger
+from dataweaver.utils import PDFStore
 
 from typing import TYPE_CHECKING
 
@@ -18,8 +35,12 @@ if TYPE_CHECKING:
         PDFScraperInterface,
         FileManagerInterface,
         ZipCompressorInterface,
+        ArchiveSinkInterface,
         PDFProcessingServiceInterface,
         PDFExtractionStrategy,
+        AsyncHttpClientInterface,
+        AsyncPDFScraperInterface,
+        AsyncFileManagerInterface,
     )
     from pathlib import Path
 
@@ -28,6 +49,7 @@ class DefaultPDFServiceFactory(PDFServiceAbstractFactory):
     """Implementação concreta da fábrica abstrata para serviços de PDF.
 
     Fornece as implementações padrão de todos os componentes necessários:
+    - Sessão HTTP com pool (compartilhada)
     - Cliente HTTP
     - Extrator de links
     - Scraper
@@ -36,62 +58,211 @@ class DefaultPDFServiceFactory(PDFServiceAbstractFactory):
 
     Design Patterns:
         Abstract Factory (implementa PDFServiceAbstractFactory).
-        Composition (agrega múltiplas estratégias de extração em PDFLinkExtractor).
+        Composition (agrega múltiplas estratégias de extração em
+        SinglePassPDFLinkExtractor).
 
     Args:
         pdfs_dir: Diretório onde os PDFs serão salvos.
         key_filter: Filtro de palavras-chave para extração de links.
+        max_workers: Número máximo de downloads simultâneos.
+        cache_dir: (Opcional) Diretório de cache; habilita o GET condicional.
     """
 
-    def __init__(self, pdfs_dir: "Path", key_filter: str) -> None:
+    def __init__(
+        self,
+        pdfs_dir: "Path",
+        key_filter: str,
+        max_workers: int = 1,
+        cache_dir: "Path | None" = None,
+    ) -> None:
         self.pdfs_dir = pdfs_dir
         self.key_filter = key_filter
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
+        self._http_session: "PooledHttpSession | None" = None
+        self._http_cache: "HttpValidatorCache | None" = None
+        self._pdf_store: "PDFStore | None" = None
+
+    def create_http_session(self) -> PooledHttpSession:
+        """Cria (uma única vez) a sessão HTTP compartilhada.
+
+        O pool é dimensionado para comportar ao menos ``max_workers``
+        conexões simultâneas com o mesmo host.
+
+        Returns:
+            A mesma instância de PooledHttpSession a cada chamada.
+        """
+        if self._http_session is None:
+            self._http_session = PooledHttpSession.from_config(
+                config.http, min_pool_size=self.max_workers
+            )
+        return self._http_session
+
+    def create_http_cache(self) -> "HttpValidatorCache | None":
+        """Cria (uma única vez) o cache de validadores HTTP.
+
+        Returns:
+            HttpValidatorCache em ``cache_dir/http`` ou None se não houver
+            diretório de cache ou se HTTP_CACHE estiver desabilitado.
+        """
+        if self.cache_dir is None or not config.http.cache_enabled:
+            return None
+        if self._http_cache is None:
+            self._http_cache = HttpValidatorCache(self.cache_dir / "http")
+        return self._http_cache
+
+    def create_pdf_store(self) -> "PDFStore | None":
+        """Cria (uma única vez) o armazenamento de PDFs por conteúdo.
+
+        Returns:
+            PDFStore em ``cache_dir/pdf_store`` ou None se não houver
+            diretório de cache ou se PDF_STORE estiver desabilitado.
+        """
+        if self.cache_dir is None or not config.scraper.store_enabled:
+            return None
+        if self._pdf_store is None:
+            self._pdf_store = PDFStore(
+                self.cache_dir / "pdf_store",
+                self.pdfs_dir,
+                config.scraper.store_max_mb * 1024 * 1024,
+            )
+        return self._pdf_store
 
     def create_http_client(self) -> "HttpClientInterface":
         """Cria um cliente HTTP baseado na biblioteca requests.
 
         Returns:
-            Instância de RequestsHttpClient.
+            Instância de RequestsHttpClient usando a sessão e o cache compartilhados.
         """
-        return RequestsHttpClient()
+        return RequestsHttpClient(self.create_http_session(), self.create_http_cache())
 
     def create_link_extractor(self) -> "PDFExtractionStrategy":
-        """Cria um PDFLinkExtractor com estratégias de extração de:
+        """Cria um SinglePassPDFLinkExtractor com estratégias de extração de:
         - Links em tags ``<a>`` (AnchorPDFExtractionStrategy)
         - Links em parágrafos (ParagraphPDFExtractionStrategy)
+
+        As duas estratégias são avaliadas em uma única varredura do documento.
         """
-        return PDFLinkExtractor(
+        return SinglePassPDFLinkExtractor(
             [
                 AnchorPDFExtractionStrategy(self.key_filter),
                 ParagraphPDFExtractionStrategy(self.key_filter),
             ]
         )
 
+    def create_document_parser(
+        self, extractor: "PDFExtractionStrategy"
+    ) -> HtmlDocumentParser:
+        """Cria o parser de HTML usado pelos scrapers.
+
+        O backend vem de HTML_PARSER (``auto`` = lxml se instalado). Com
+        HTML_PARSE_ONLY ativo, só as tags declaradas pelo extrator são montadas.
+
+        Args:
+            extractor: Extrator cujas ``tag_names`` restringem o parsing.
+
+        Returns:
+            HtmlDocumentParser configurado.
+        """
+        tag_names = ()
+        if config.scraper.parse_only:
+            tag_names = getattr(extractor, "tag_names", ())
+            if tag_names and config.scraper.crawl_depth > 0 and "a" not in tag_names:
+                tag_names = (*tag_names, "a")  # Links de páginas a seguir
+        return HtmlDocumentParser(
+            resolve_html_parser(config.scraper.html_parser), tag_names
+        )
+
     def create_scraper(self) -> "PDFScraperInterface":
         """Cria um scraper de PDFs com dependências injetadas.
 
+        Com SCRAPER_STREAMING ativo, retorna um StreamingPDFScraper, que emite
+        os links enquanto a página ainda está sendo recebida. Ele lê apenas as
+        páginas de URLS, uma de cada vez: CRAWL_DEPTH e CRAWL_FOLLOW não têm
+        efeito e geram um aviso.
+
         Returns:
-            RequestsPDFScraper com cliente HTTP e extrator de links.
+            CrawlingPDFScraper com cliente HTTP, extrator de links e parser,
+            configurado com CRAWL_DEPTH, CRAWL_FOLLOW e CRAWL_PER_HOST.
         """
-        return RequestsPDFScraper(
-            self.create_http_client(), self.create_link_extractor()
+        if config.scraper.streaming:
+            if config.scraper.crawl_depth > 0 or config.scraper.crawl_follow:
+                logger.warning(
+                    "SCRAPER_STREAMING ativo: CRAWL_DEPTH/CRAWL_FOLLOW são ignorados; "
+                    "apenas as páginas de URLS são lidas."
+                )
+            return StreamingPDFScraper(self.key_filter, self.create_http_session())
+        extractor = self.create_link_extractor()
+        return CrawlingPDFScraper(
+            self.create_http_client(),
+            extractor,
+            self.create_document_parser(extractor),
+            max_depth=config.scraper.crawl_depth,
+            follow_pattern=config.scraper.crawl_follow,
+            per_host_limit=config.scraper.crawl_per_host,
+            max_workers=self.max_workers,
         )
 
     def create_file_manager(self) -> "FileManagerInterface":
         """Cria um gerenciador de arquivos para o diretório especificado.
 
         Returns:
-            FileManager configurado com pdfs_dir.
+            FileManager configurado com pdfs_dir, a sessão compartilhada e o
+            armazenamento de PDFs.
         """
-        return FileManager(self.pdfs_dir)
+        downloader = FileDownloader(
+            self.create_http_session(), cache=self.create_http_cache()
+        )
+        return FileManager(
+            self.pdfs_dir,
+            downloader,
+            max_attempts=config.http.download_attempts,
+            store=self.create_pdf_store(),
+        )
 
     def create_zip_compressor(self) -> "ZipCompressorInterface":
         """Cria um compressor ZIP para o diretório de PDFs.
 
         Returns:
-            ZipCompressor configurado com pdfs_dir.
+            CodecArchiveCompressor quando ARCHIVE_CODEC não é zip-deflate;
+            senão ParallelZipCompressor configurado com pdfs_dir, a política
+            de compressão e o modo incremental, ou ZipCompressor quando
+            ZIP_WORKERS=1 e ZIP_INCREMENTAL=false.
         """
-        return ZipCompressor(self.pdfs_dir)
+        codec = get_archive_codec(config.archive.codec)
+        if codec.name != "zip-deflate":
+            return CodecArchiveCompressor(self.pdfs_dir, codec, config.archive.level)
+        policy = CompressionPolicy.from_config(config.archive)
+        if config.archive.workers == 1 and not config.archive.incremental:
+            return ZipCompressor(self.pdfs_dir, policy)
+        return ParallelZipCompressor(
+            self.pdfs_dir,
+            config.archive.workers or None,
+            config.archive.level,
+            policy,
+            incremental=config.archive.incremental,
+        )
+
+    def create_archive_sink(self) -> "ArchiveSinkInterface | None":
+        """Cria o destino que compacta cada PDF assim que é baixado.
+
+        Returns:
+            ZipArchiveSink em pdfs_dir quando ZIP_STREAMING estiver ativo
+            (mantendo soltos TARGET_FILE e ZIP_KEEP_FILES) ou None. Outros
+            codecs (ARCHIVE_CODEC) compactam ao final.
+        """
+        if not config.archive.streaming or config.archive.codec != "zip-deflate":
+            return None
+        return ZipArchiveSink(
+            self.pdfs_dir,
+            CompressionPolicy.from_config(config.archive),
+            config.archive.level,
+            keep_patterns=[*config.archive.keep_files, config.data.target_file],
+        )
+
+    def archive_name(self, zip_name: str) -> str:
+        """Troca o sufixo .zip pela extensão do codec configurado (ARCHIVE_CODEC)."""
+        return get_archive_codec(config.archive.codec).archive_name(zip_name)
 
     def create_service(
         self, zip_name: str, file_extension: str
@@ -110,11 +281,144 @@ class DefaultPDFServiceFactory(PDFServiceAbstractFactory):
             - Scraper
             - FileManager
             - ZipCompressor
+            - max_workers
+            - ArchiveSink (ZIP_STREAMING)
         """
         return PDFProcessingService(
-            zip_name,
+            self.archive_name(zip_name),
+            file_extension,
+            self.create_scraper(),
+            self.create_file_manager(),
+            self.create_zip_compressor(),
+            max_workers=self.max_workers,
+            archive_sink=self.create_archive_sink(),
+        )
+
+
+class AsyncPDFServiceFactory(DefaultPDFServiceFactory):
+    """Fábrica da família assíncrona (asyncio/aiohttp) de componentes.
+
+    Cumpre o mesmo contrato de PDFServiceAbstractFactory, trocando cliente
+    HTTP, scraper, gerenciador de arquivos e serviço por suas versões
+    assíncronas. Extrator de links, compressor ZIP, cache HTTP (HTTP_CACHE),
+    armazenamento de PDFs (PDF_STORE) e compactação durante os downloads
+    (ZIP_STREAMING) são os mesmos da fábrica padrão.
+
+    Retomada de downloads (HTTP_DOWNLOAD_ATTEMPTS), crawl (CRAWL_*),
+    concorrência adaptativa (HTTP_ADAPTIVE_CONCURRENCY) e SCRAPER_STREAMING
+    não têm versão assíncrona: ``unsupported_settings`` os lista e
+    ``create_service`` registra um aviso.
+
+    Design Patterns:
+        Abstract Factory (implementa PDFServiceAbstractFactory).
+
+    Args:
+        pdfs_dir: Diretório onde os PDFs serão salvos.
+        key_filter: Filtro de palavras-chave para extração de links.
+        max_workers: Número máximo de requisições simultâneas no event loop.
+        cache_dir: (Opcional) Diretório de cache; habilita o GET condicional
+                   e o armazenamento de PDFs.
+    """
+
+    def __init__(
+        self,
+        pdfs_dir: "Path",
+        key_filter: str,
+        max_workers: int = 1,
+        cache_dir: "Path | None" = None,
+    ) -> None:
+        super().__init__(pdfs_dir, key_filter, max_workers, cache_dir)
+        self._async_session: "AsyncHttpSession | None" = None
+
+    def create_http_session(self) -> AsyncHttpSession:
+        """Cria (uma única vez) a sessão aiohttp compartilhada.
+
+        Returns:
+            A mesma instância de AsyncHttpSession a cada chamada.
+        """
+        if self._async_session is None:
+            self._async_session = AsyncHttpSession.from_config(
+                config.http, min_pool_size=self.max_workers
+            )
+        return self._async_session
+
+    def create_http_client(self) -> "AsyncHttpClientInterface":
+        """Cria um cliente HTTP assíncrono baseado em aiohttp.
+
+        Returns:
+            Instância de AiohttpHttpClient usando a sessão compartilhada.
+        """
+        return AiohttpHttpClient(self.create_http_session())
+
+    def create_scraper(self) -> "AsyncPDFScraperInterface":
+        """Cria um scraper assíncrono com dependências injetadas.
+
+        Returns:
+            AsyncPDFScraper com cliente HTTP, extrator de links e parser.
+        """
+        extractor = self.create_link_extractor()
+        return AsyncPDFScraper(
+            self.create_http_client(),
+            extractor,
+            self.create_document_parser(extractor),
+        )
+
+    def create_file_manager(self) -> "AsyncFileManagerInterface":
+        """Cria um gerenciador de arquivos assíncrono para o diretório especificado.
+
+        Returns:
+            AsyncFileManager configurado com pdfs_dir, a sessão compartilhada,
+            o cache HTTP e o armazenamento de PDFs.
+        """
+        return AsyncFileManager(
+            self.pdfs_dir,
+            self.create_http_session(),
+            cache=self.create_http_cache(),
+            store=self.create_pdf_store(),
+        )
+
+    def unsupported_settings(self) -> list[str]:
+        """Configurações ativas que a pilha assíncrona não aplica.
+
+        Returns:
+            Nomes das variáveis de ambiente ignoradas com SCRAPER_ASYNC=true
+        """
+        ignored = []
+        if config.http.download_attempts > 1:
+            ignored.append("HTTP_DOWNLOAD_ATTEMPTS")
+        if config.http.adaptive_concurrency:
+            ignored.append("HTTP_ADAPTIVE_CONCURRENCY")
+        if config.scraper.crawl_depth > 0 or config.scraper.crawl_follow:
+            ignored.append("CRAWL_DEPTH/CRAWL_FOLLOW/CRAWL_PER_HOST")
+        if config.scraper.streaming:
+            ignored.append("SCRAPER_STREAMING")
+        return ignored
+
+    def create_service(
+        self, zip_name: str, file_extension: str
+    ) -> "PDFProcessingServiceInterface":
+        """Monta o serviço assíncrono de processamento de PDFs.
+
+        Args:
+            zip_name: Nome do arquivo ZIP de saída.
+            file_extension: Extensão do arquivo (pdf)
+
+        Returns:
+            AsyncPDFProcessingService com todos os componentes injetados.
+        """
+        ignored = self.unsupported_settings()
+        if ignored:
+            logger.warning(
+                "SCRAPER_ASYNC ativo: as configurações a seguir não têm efeito "
+                f"na pilha assíncrona: {', '.join(ignored)}."
+            )
+        return AsyncPDFProcessingService(
+            self.archive_name(zip_name),
             file_extension,
             self.create_scraper(),
             self.create_file_manager(),
             self.create_zip_compressor(),
+            max_workers=self.max_workers,
+            http_session=self.create_http_session(),
+            archive_sink=self.create_archive_sink(),
         )
@@ -1,12 +1,196 @@
 from .interfaces import FileManagerInterface
+from .http_session import PooledHttpSession
+from dataweaver.errors import IncompleteDownloadError
 from dataweaver.settings import logger
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 import requests
+import tempfile
+import hashlib
+import json
 import os
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import BinaryIO
     from pathlib import Path
+    from .http_cache import HttpValidatorCache
+    from dataweaver.utils.interfaces import PDFStoreInterface
+
+CHUNK_SIZE = 1024 * 1024  # 1 MiB por bloco lido da rede
+
+# Falhas transitórias após as quais o download é retomado do ponto em que parou
+RESUMABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    IncompleteDownloadError,
+)
+
+
+@dataclass
+class SavedFile:
+    """Metadados de um arquivo gravado em disco."""
+
+    path: "Path"  # Caminho final do arquivo
+    size: int  # Tamanho em bytes
+    sha256: str  # Hash SHA-256 (hexadecimal) do conteúdo
+
+
+class AtomicFileWriter:
+    """Grava um arquivo em blocos através de um arquivo temporário.
+
+    O conteúdo é escrito em um temporário na mesma pasta do destino e só é
+    renomeado para o nome final em ``commit``, de modo que um download
+    interrompido nunca deixa um arquivo truncado no lugar do original.
+    Tamanho e SHA-256 são calculados durante a escrita.
+
+    Uso:
+        >>> with AtomicFileWriter(path) as writer:
+        ...     writer.write(b"...")
+        ...     saved = writer.commit()
+    """
+
+    def __init__(self, path: "Path") -> None:
+        self.path = path
+        self.size = 0
+        self._hash = hashlib.sha256()
+        self._tmp_name, self._file = self._open_temp()
+
+    def _open_temp(self) -> tuple[str, "BinaryIO"]:
+        """Cria o arquivo temporário que receberá o conteúdo."""
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        return tmp_name, os.fdopen(fd, "wb")
+
+    def write(self, chunk: bytes) -> None:
+        """Escreve um bloco atualizando tamanho e hash."""
+        self._file.write(chunk)
+        self._hash.update(chunk)
+        self.size += len(chunk)
+
+    def commit(self) -> SavedFile:
+        """Finaliza a escrita e move o temporário para o destino final."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_name, self.path)
+        return SavedFile(self.path, self.size, self._hash.hexdigest())
+
+    def abort(self) -> None:
+        """Descarta o temporário sem tocar no destino."""
+        self._file.close()
+        if os.path.exists(self._tmp_name):
+            os.unlink(self._tmp_name)
+
+    def __enter__(self) -> "AtomicFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if os.path.exists(self._tmp_name):
+            self.abort()
+
+
+class PartialDownload:
+    """Download parcial mantido entre tentativas e execuções.
+
+    Os bytes já recebidos ficam em ``<arquivo>.<chave>.part`` e os dados
+    necessários para retomá-lo (URL, validadores, suporte a Range e tamanho
+    total) em ``<arquivo>.<chave>.part.json``. A chave é derivada da URL, de
+    modo que URLs diferentes com o mesmo nome de arquivo (ex: ``/x/anexo.pdf``
+    e ``/y/anexo.pdf``) nunca gravam no mesmo ``.part``.
+    """
+
+    def __init__(self, path: "Path", url: str = "") -> None:
+        self.path = path
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        self.part_path = path.with_name(f"{path.name}.{key}.part")
+        self.meta_path = path.with_name(f"{path.name}.{key}.part.json")
+
+    @property
+    def offset(self) -> int:
+        """Quantidade de bytes já recebidos."""
+        return self.part_path.stat().st_size if self.part_path.is_file() else 0
+
+    def load_meta(self) -> "dict | None":
+        """Lê os metadados do download parcial, se houver."""
+        try:
+            return json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save_meta(self, meta: dict) -> None:
+        """Grava os metadados do download parcial."""
+        self.meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+    def resume_headers(self, url: str) -> dict[str, str]:
+        """Monta os cabeçalhos ``Range``/``If-Range`` para continuar o download.
+
+        Só há retomada se o servidor anunciou ``Accept-Ranges: bytes`` e
+        forneceu um validador forte (ETag) ou Last-Modified; o ``If-Range``
+        garante que o restante pertence à mesma versão do arquivo.
+
+        Returns:
+            Dicionário de cabeçalhos (vazio se o download deve recomeçar)
+        """
+        meta = self.load_meta()
+        if not meta or meta.get("url") != url or not meta.get("accept_ranges"):
+            return {}
+
+        offset = self.offset
+        total = meta.get("total_size")
+        if offset == 0 or (total is not None and offset >= total):
+            return {}
+
+        etag = meta.get("etag")
+        validator = etag if etag and not etag.startswith("W/") else None
+        validator = validator or meta.get("last_modified")
+        if not validator:
+            return {}
+        return {"Range": f"bytes={offset}-", "If-Range": validator}
+
+    def open_writer(self, append: bool) -> "ResumableFileWriter":
+        """Abre o ``.part`` para continuar (append) ou recomeçar a escrita."""
+        return ResumableFileWriter(self, append)
+
+    def discard(self) -> None:
+        """Remove o ``.part`` e seus metadados."""
+        self.part_path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+
+
+class ResumableFileWriter(AtomicFileWriter):
+    """AtomicFileWriter que grava em ``<arquivo>.part`` e o preserva em falhas.
+
+    Ao continuar um download, os bytes já existentes são relidos para que
+    tamanho e SHA-256 finais correspondam ao arquivo completo.
+    """
+
+    def __init__(self, partial: PartialDownload, append: bool) -> None:
+        self.partial = partial
+        self._append = append
+        super().__init__(partial.path)
+
+    def _open_temp(self) -> tuple[str, "BinaryIO"]:
+        part_path = self.partial.part_path
+        if self._append and part_path.is_file():
+            with open(part_path, "rb") as existing:
+                for block in iter(lambda: existing.read(CHUNK_SIZE), b""):
+                    self._hash.update(block)
+                    self.size += len(block)
+            return str(part_path), open(part_path, "ab")
+        return str(part_path), open(part_path, "wb")
+
+    def commit(self) -> SavedFile:
+        saved = super().commit()
+        self.partial.meta_path.unlink(missing_ok=True)
+        return saved
+
+    def abort(self) -> None:
+        """Fecha o ``.part`` mantendo os bytes recebidos para a próxima tentativa."""
+        self._file.close()
 
 
 class FileDownloader:
@@ -16,6 +200,24 @@ class FileDownloader:
         Princípio da Responsabilidade Única - foca apenas no download.
     """
 
+    def __init__(
+        self,
+        session: "requests.Session" = None,
+        chunk_size: int = CHUNK_SIZE,
+        cache: "HttpValidatorCache" = None,
+    ) -> None:
+        """Inicializa o downloader.
+
+        Args:
+            session: (Opcional) Sessão HTTP compartilhada; por padrão cria uma
+                     PooledHttpSession própria.
+            chunk_size: Tamanho dos blocos lidos da rede.
+            cache: (Opcional) Cache de validadores para GET condicional.
+        """
+        self.session = session or PooledHttpSession()
+        self.chunk_size = chunk_size
+        self.cache = cache
+
     def download_file(self, url: str) -> bytes:
         """Baixa o conteúdo de um arquivo a partir de uma URL.
 
@@ -28,10 +230,59 @@ class FileDownloader:
         Raises:
             requests.HTTPError: Se o download falhar (status 4xx/5xx).
         """
-        response = requests.get(url, stream=True)
+        response = self.session.get(url, stream=True)
         response.raise_for_status()
         return response.content
 
+    def stream_file(self, url: str) -> "Iterator[bytes]":
+        """Baixa um arquivo em blocos, sem carregá-lo inteiro em memória.
+
+        Args:
+            url: URL completa do arquivo a ser baixado.
+
+        Yields:
+            Blocos de até ``chunk_size`` bytes do corpo da resposta.
+
+        Raises:
+            requests.HTTPError: Se o download falhar (status 4xx/5xx).
+        """
+        with self.session.get(url, stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=self.chunk_size)
+
+    def open_stream(
+        self, url: str, partial: "PartialDownload | None" = None
+    ) -> "requests.Response":
+        """Abre a resposta de um download sem ler o corpo.
+
+        O corpo é pedido sem codificação de transporte, para que offsets e
+        Content-Length se refiram aos bytes gravados em disco. Havendo um
+        download parcial retomável, a requisição usa ``Range``/``If-Range`` e
+        pode retornar 206; senão, com cache e uma cópia local válida, é
+        condicional e pode retornar 304 (sem corpo).
+
+        Args:
+            url: URL completa do arquivo a ser baixado.
+            partial: (Opcional) Download parcial/cópia local do arquivo.
+
+        Returns:
+            Resposta em modo stream (usar como context manager).
+        """
+        headers = {"Accept-Encoding": "identity"}
+        resume = partial.resume_headers(url) if partial is not None else {}
+        if resume:
+            headers.update(resume)
+        elif self.cache is not None and partial is not None:
+            headers.update(self.cache.conditional_headers(url, partial.path))
+        return self.session.get(url, stream=True, headers=headers)
+
+    def remember(
+        self, url: str, response: "requests.Response", saved: "SavedFile"
+    ) -> None:
+        """Registra no cache os validadores de um download concluído."""
+        if self.cache is not None:
+            self.cache.update(url, response.headers, saved.size, saved.sha256)
+
 
 class FileSaver:
     """Responsável por operações de salvamento de arquivos no sistema local.
@@ -53,10 +304,26 @@ class FileSaver:
         Returns:
             Path: Caminho completo onde o arquivo foi salvo.
         """
-        file_path = self.folder / filename
-        with open(file_path, "wb") as file:
-            file.write(content)
-        return file_path
+        return self.save_stream(filename, [content]).path
+
+    def save_stream(self, filename: str, chunks: "Iterable[bytes]") -> SavedFile:
+        """Salva um fluxo de blocos de forma atômica.
+
+        Args:
+            filename: Nome do arquivo a ser salvo.
+            chunks: Blocos de bytes, consumidos à medida que chegam.
+
+        Returns:
+            SavedFile com caminho, tamanho e SHA-256 do arquivo salvo.
+        """
+        with AtomicFileWriter(self.folder / filename) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+            return writer.commit()
+
+    def partial(self, filename: str, url: str = "") -> PartialDownload:
+        """Retorna o download parcial (retomável) do arquivo vindo da URL."""
+        return PartialDownload(self.folder / filename, url)
 
 
 class FileManager(FileManagerInterface):
@@ -68,7 +335,12 @@ class FileManager(FileManagerInterface):
     """
 
     def __init__(
-        self, folder: "Path", downloader: FileDownloader = None, saver: FileSaver = None
+        self,
+        folder: "Path",
+        downloader: FileDownloader = None,
+        saver: FileSaver = None,
+        max_attempts: int = 1,
+        store: "PDFStoreInterface" = None,
     ) -> None:
         """Inicializa o gerenciador de arquivos com dependências.
 
@@ -76,28 +348,146 @@ class FileManager(FileManagerInterface):
             folder: Diretório alvo para arquivos salvos.
             downloader: (Opcional) Instância de FileDownloader.
             saver: (Opcional) Instância de FileSaver.
+            max_attempts: Tentativas por arquivo; cada nova tentativa retoma o
+                          download parcial quando o servidor permite.
+            store: (Opcional) Armazenamento por conteúdo; restaura cópias
+                   locais antes do download e registra os arquivos baixados.
         """
         self.folder = folder
         self.downloader = downloader or FileDownloader()
         self.saver = saver or FileSaver(folder)
+        self.max_attempts = max(1, max_attempts)
+        self.store = store
 
-    def save_file(self, url: str) -> None:
+    def save_file(self, url: str) -> "Path":
         """Baixa e salva um arquivo a partir de uma URL.
 
         Args:
             url: URL completa do arquivo para download/salvamento.
 
+        Returns:
+            Caminho do arquivo local (baixado ou reaproveitado após 304).
+
         Raises:
             Exception: Propaga quaisquer erros de download/salvamento.
             Logs com informações detalhadas em caso de erro.
         """
+        filename = os.path.basename(url)
+        restored = False
         try:
-            filename = os.path.basename(url)
-            content = self.downloader.download_file(url)
-            saved_path = self.saver.save_file(filename, content)
-            logger.info(f"Arquivo baixado com sucesso: {saved_path.name[:30]}...")
-        except Exception as e:
-            logger.error(
-                f"Erro ao baixar/salvar {os.path.basename(url)[:30]}...: {str(e)}"
+            if self.store is not None:
+                # Recria a cópia local guardada para que o GET condicional a reaproveite
+                restored = self.store.restore(filename)
+            saved = self._download_with_resume(url, filename)
+            if saved is None:
+                logger.info(
+                    f"Arquivo não modificado, download ignorado: {filename[:30]}..."
+                )
+                return self.folder / filename
+            if self.store is not None:
+                self.store.add(saved.path, saved.sha256)
+            logger.info(
+                f"Arquivo baixado com sucesso: {saved.path.name[:30]}... "
+                f"({saved.size} bytes)"
             )
+            return saved.path
+        except Exception as e:
+            if restored:
+                # A cópia guardada não foi confirmada pelo servidor: fica fora do ZIP
+                (self.folder / filename).unlink(missing_ok=True)
+            logger.error(f"Erro ao baixar/salvar {filename[:30]}...: {str(e)}")
             raise
+
+    def _download_with_resume(self, url: str, filename: str) -> "SavedFile | None":
+        """Executa o download com até ``max_attempts`` tentativas.
+
+        Falhas transitórias (conexão, timeout, corpo incompleto) mantêm o
+        ``.part`` em disco e a tentativa seguinte continua de onde parou.
+
+        Returns:
+            SavedFile do arquivo concluído ou None se não foi modificado (304)
+        """
+        partial = self.saver.partial(filename, url)
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                return self._transfer(url, partial)
+            except RESUMABLE_ERRORS as e:
+                if attempt == self.max_attempts:
+                    raise
+                logger.warning(
+                    f"Download interrompido ({filename[:30]}..., tentativa "
+                    f"{attempt}/{self.max_attempts}): {e}. "
+                    f"Retomando a partir de {partial.offset} bytes..."
+                )
+
+    def _transfer(self, url: str, partial: PartialDownload) -> "SavedFile | None":
+        """Faz uma tentativa de download gravando no ``.part``.
+
+        Raises:
+            IncompleteDownloadError: Se o servidor devolver outra versão do
+                arquivo ou um corpo com tamanho diferente do anunciado.
+        """
+        with self.downloader.open_stream(url, partial) as response:
+            if response.status_code == 304:
+                return None
+            if response.status_code == 416:
+                partial.discard()
+                raise IncompleteDownloadError("Intervalo solicitado inválido (416)")
+            response.raise_for_status()
+
+            append = response.status_code == 206
+            meta = partial.load_meta() if append else None
+            if append:
+                self._check_resumed_response(response, partial, meta)
+            else:
+                meta = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "accept_ranges": (
+                        response.headers.get("Accept-Ranges", "").lower() == "bytes"
+                    ),
+                    "total_size": self._expected_size(response),
+                }
+                partial.save_meta(meta)
+
+            with partial.open_writer(append) as writer:
+                for chunk in response.iter_content(
+                    chunk_size=self.downloader.chunk_size
+                ):
+                    writer.write(chunk)
+                total = meta.get("total_size")
+                if total is not None and writer.size != total:
+                    raise IncompleteDownloadError(
+                        f"Recebidos {writer.size} de {total} bytes"
+                    )
+                saved = writer.commit()
+
+        self.downloader.remember(url, response, saved)
+        return saved
+
+    @staticmethod
+    def _check_resumed_response(
+        response: "requests.Response", partial: PartialDownload, meta: dict
+    ) -> None:
+        """Confere se a resposta 206 continua exatamente o ``.part`` existente."""
+        content_range = response.headers.get("Content-Range", "")
+        try:
+            start = int(content_range.split()[1].split("-")[0])
+        except (IndexError, ValueError):
+            start = -1
+
+        etag = response.headers.get("ETag")
+        if start != partial.offset or (meta.get("etag") and etag != meta["etag"]):
+            partial.discard()
+            raise IncompleteDownloadError(
+                f"Resposta parcial incompatível com o download salvo: {content_range}"
+            )
+
+    @staticmethod
+    def _expected_size(response: "requests.Response") -> "int | None":
+        """Tamanho final anunciado pelo servidor, se conhecido."""
+        if response.headers.get("Content-Encoding", "identity") != "identity":
+            return None
+        length = response.headers.get("Content-Length")
+        return int(length) if length and length.isdigit() else None
@@ -0,0 +1,61 @@
+from dataweaver.settings import logger
+
+from bs4 import BeautifulSoup, SoupStrainer
+import importlib.util
+
+# Backend usado quando "auto" é solicitado e o lxml não está instalado
+FALLBACK_PARSER = "html.parser"
+
+
+def resolve_html_parser(preferred: str = "auto") -> str:
+    """Escolhe o backend de parsing do BeautifulSoup.
+
+    Args:
+        preferred: "auto" (lxml se instalado, senão html.parser), "lxml" ou
+                   "html.parser". Um backend indisponível recai no html.parser.
+
+    Returns:
+        Nome do backend a ser repassado ao BeautifulSoup
+    """
+    preferred = preferred.strip().lower()
+    lxml_available = importlib.util.find_spec("lxml") is not None
+
+    if preferred == "auto":
+        return "lxml" if lxml_available else FALLBACK_PARSER
+    if preferred == "lxml" and not lxml_available:
+        logger.warning("lxml não está instalado, usando html.parser")
+        return FALLBACK_PARSER
+    return preferred
+
+
+class HtmlDocumentParser:
+    """Constrói a árvore BeautifulSoup usada pelas estratégias de extração.
+
+    Com ``tag_names`` informado, apenas essas tags (e seus descendentes) são
+    incluídas na árvore via ``SoupStrainer``, evitando montar o documento
+    inteiro quando as estratégias só examinam ``<a>`` e ``<p>``.
+
+    Obs.: o lxml corrige HTML malformado de forma diferente do html.parser
+    (ex.: fecha ``<p>`` antes de um bloco aninhado), o que pode alterar quais
+    elementos ficam dentro de cada parágrafo.
+    """
+
+    def __init__(
+        self, parser: str = FALLBACK_PARSER, tag_names: "tuple[str, ...]" = ()
+    ) -> None:
+        """Inicializa o parser.
+
+        Args:
+            parser: Backend do BeautifulSoup (ver ``resolve_html_parser``)
+            tag_names: (Opcional) Tags a manter na árvore; vazio = documento inteiro
+        """
+        self.parser = parser
+        self.tag_names = tuple(tag_names)
+
+    def parse(self, html: str) -> BeautifulSoup:
+        """Faz o parsing do HTML conforme o backend e o filtro de tags."""
+        if self.tag_names:
+            return BeautifulSoup(
+                html, self.parser, parse_only=SoupStrainer(list(self.tag_names))
+            )
+        return BeautifulSoup(html, self.parser)
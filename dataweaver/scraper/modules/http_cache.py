@@ -0,0 +1,132 @@
+from dataweaver.utils import ensure_directory_exists
+
+from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING
+import threading
+import tempfile
+import hashlib
+import json
+import os
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+
+@dataclass
+class CacheEntry:
+    """Validadores HTTP e metadados da última resposta completa de uma URL."""
+
+    etag: "str | None"  # Cabeçalho ETag recebido
+    last_modified: "str | None"  # Cabeçalho Last-Modified recebido
+    size: int  # Tamanho do conteúdo em bytes
+    sha256: str  # Hash SHA-256 do conteúdo
+
+
+class HttpValidatorCache:
+    """Cache persistente de validadores HTTP para GET condicional.
+
+    Guarda, por URL, ETag, Last-Modified, tamanho e hash do conteúdo em um
+    índice JSON. Na próxima execução os clientes enviam ``If-None-Match`` e
+    ``If-Modified-Since`` e, se o servidor responder 304, reaproveitam a cópia
+    local em vez de transferir o arquivo novamente. Corpos de páginas HTML são
+    guardados junto ao índice; PDFs são reaproveitados da pasta de destino.
+
+    Seguro para uso por várias threads (downloads concorrentes).
+    """
+
+    INDEX_NAME = "http_validators.json"
+
+    def __init__(self, cache_dir: "Path") -> None:
+        self.cache_dir = cache_dir
+        self.index_path = cache_dir / self.INDEX_NAME
+        self.pages_dir = cache_dir / "pages"
+        self._lock = threading.Lock()
+
+        ensure_directory_exists(self.pages_dir)
+        self._entries = self._load()
+
+    def get(self, url: str) -> "CacheEntry | None":
+        """Retorna a entrada registrada para a URL, se houver."""
+        with self._lock:
+            return self._entries.get(url)
+
+    def conditional_headers(self, url: str, local_path: "Path") -> dict[str, str]:
+        """Monta os cabeçalhos condicionais para revalidar uma URL.
+
+        Os validadores só são enviados se a cópia local ainda existir com o
+        tamanho registrado; caso contrário um 304 não teria o que reaproveitar.
+
+        Args:
+            url: URL a ser revalidada
+            local_path: Cópia local que será reaproveitada em caso de 304
+
+        Returns:
+            Dicionário de cabeçalhos (vazio se não houver o que revalidar)
+        """
+        entry = self.get(url)
+        if entry is None or not local_path.is_file():
+            return {}
+        if local_path.stat().st_size != entry.size:
+            return {}
+
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def update(
+        self, url: str, headers: "Mapping[str, str]", size: int, sha256: str
+    ) -> None:
+        """Registra os validadores de uma resposta 200 completa.
+
+        Respostas sem ETag nem Last-Modified não podem ser revalidadas e
+        removem qualquer entrada anterior da URL.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if etag or last_modified:
+                self._entries[url] = CacheEntry(etag, last_modified, size, sha256)
+            else:
+                self._entries.pop(url, None)
+            self._save()
+
+    def page_path(self, url: str) -> "Path":
+        """Caminho do corpo HTML guardado para a URL."""
+        return self.pages_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+
+    def store_page(self, url: str, headers: "Mapping[str, str]", html: str) -> None:
+        """Guarda o corpo HTML de uma página junto com seus validadores."""
+        body = html.encode("utf-8")
+        path = self.page_path(url)
+        path.write_bytes(body)
+        self.update(url, headers, len(body), hashlib.sha256(body).hexdigest())
+
+    def load_page(self, url: str) -> "str | None":
+        """Retorna o HTML guardado para a URL, se ainda estiver íntegro."""
+        entry = self.get(url)
+        path = self.page_path(url)
+        if entry is None or not path.is_file():
+            return None
+        body = path.read_bytes()
+        if hashlib.sha256(body).hexdigest() != entry.sha256:
+            return None
+        return body.decode("utf-8")
+
+    def _load(self) -> dict[str, CacheEntry]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+            return {url: CacheEntry(**data) for url, data in raw.items()}
+        except (OSError, ValueError, TypeError):
+            return {}
+
+    def _save(self) -> None:
+        """Grava o índice de forma atômica (temporário + rename)."""
+        data = {url: asdict(entry) for url, entry in self._entries.items()}
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(tmp_name, self.index_path)
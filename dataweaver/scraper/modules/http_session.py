@@ -0,0 +1,202 @@
+from dataweaver.settings import logger
+from .rate_control import RetryPolicy, AdaptiveConcurrencyLimiter, RETRY_STATUSES
+
+from requests.adapters import HTTPAdapter
+from typing import TYPE_CHECKING
+import threading
+import requests
+import time
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from dataweaver.settings.config import HttpConfig
+
+
+class PooledHttpSession(requests.Session):
+    """Sessão HTTP com pool de conexões e timeouts padrão.
+
+    Criada uma única vez pela fábrica e compartilhada entre o cliente HTTP e o
+    downloader, de modo que as requisições ao mesmo host reutilizem conexões
+    TCP/TLS já abertas em vez de refazer o handshake a cada arquivo.
+
+    Opcionalmente aplica uma RetryPolicy (backoff com jitter e Retry-After para
+    429/5xx e falhas de conexão) e um AdaptiveConcurrencyLimiter (AIMD), que
+    valem para todas as requisições do scraper e do downloader.
+
+    Padrão de Projeto:
+        Adapter - especializa requests.Session com a configuração do projeto
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        keep_alive: bool = True,
+        retry_policy: "RetryPolicy | None" = None,
+        limiter: "AdaptiveConcurrencyLimiter | None" = None,
+    ) -> None:
+        """Inicializa a sessão montando o adaptador com pool.
+
+        Args:
+            pool_size: Conexões mantidas por host (deve cobrir os downloads simultâneos)
+            connect_timeout: Timeout para estabelecer a conexão (segundos)
+            read_timeout: Timeout de leitura entre blocos recebidos (segundos)
+            keep_alive: Se False, envia ``Connection: close`` em cada requisição
+            retry_policy: (Opcional) Política de novas tentativas
+            limiter: (Opcional) Limite adaptativo de requisições simultâneas
+        """
+        super().__init__()
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry_policy = retry_policy
+        self.limiter = limiter
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+    @classmethod
+    def from_config(
+        cls, http_config: "HttpConfig", min_pool_size: int = 1
+    ) -> "PooledHttpSession":
+        """Cria a sessão a partir de ``config.http``.
+
+        Args:
+            http_config: Configuração HTTP da aplicação
+            min_pool_size: Tamanho mínimo do pool (ex: número de workers de download)
+        """
+        pool_size = max(http_config.pool_size, min_pool_size)
+        limiter = None
+        if http_config.adaptive_concurrency:
+            limiter = AdaptiveConcurrencyLimiter(
+                maximum=pool_size, latency_target=http_config.latency_target or None
+            )
+        return cls(
+            pool_size=pool_size,
+            connect_timeout=http_config.connect_timeout,
+            read_timeout=http_config.read_timeout,
+            keep_alive=http_config.keep_alive,
+            retry_policy=RetryPolicy(
+                http_config.max_retries,
+                http_config.backoff_base,
+                http_config.backoff_max,
+            ),
+            limiter=limiter,
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Executa a requisição aplicando timeout padrão, limite e novas tentativas.
+
+        Respostas 429/5xx e falhas de conexão são repetidas conforme a
+        RetryPolicy (apenas métodos idempotentes); quando as tentativas se
+        esgotam, a última resposta é retornada ou a exceção é propagada.
+
+        Com ``stream=True``, a vaga do limitador só é liberada quando o corpo
+        termina de ser lido ou a resposta é fechada: a transferência do corpo
+        é a carga real sobre o servidor, e a latência informada ao AIMD passa
+        a ser a da resposta completa.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        stream = kwargs.get("stream", False)
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self.limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._release()
+                self._overload("falha de conexão")
+                if not self._can_retry(method, attempt):
+                    raise
+                logger.warning(
+                    f"Falha de conexão em {url[:50]}..., nova tentativa "
+                    f"({attempt + 1}/{self.retry_policy.max_retries}): {e}"
+                )
+                self.retry_policy.wait(attempt)
+                attempt += 1
+                continue
+            except BaseException:
+                self._release()
+                raise
+
+            if response.status_code not in self._retry_statuses():
+                if stream:
+                    self._release_with_body(response, start)
+                else:
+                    self._release(time.perf_counter() - start)
+                return response
+
+            self._release()
+            self._overload(f"HTTP {response.status_code}")
+            if not self._can_retry(method, attempt):
+                return response
+            retry_after = response.headers.get("Retry-After")
+            response.close()
+            logger.warning(
+                f"HTTP {response.status_code} em {url[:50]}..., nova tentativa "
+                f"({attempt + 1}/{self.retry_policy.max_retries})"
+            )
+            self.retry_policy.wait(attempt, retry_after)
+            attempt += 1
+
+    def _release(self, latency: "float | None" = None) -> None:
+        """Libera a vaga do limitador, informando a latência se a resposta foi ok."""
+        if self.limiter is None:
+            return
+        self.limiter.release()
+        if latency is not None:
+            self.limiter.on_success(latency)
+
+    def _release_with_body(self, response: requests.Response, start: float) -> None:
+        """Mantém a vaga até o corpo ser consumido (iter_content/content) ou fechado."""
+        if self.limiter is None:
+            return
+        lock = threading.Lock()
+        released = False
+
+        def release(success: bool) -> None:
+            nonlocal released
+            with lock:
+                if released:
+                    return
+                released = True
+            self._release(time.perf_counter() - start if success else None)
+
+        close, iter_content = response.close, response.iter_content
+
+        def close_and_release() -> None:
+            try:
+                close()
+            finally:
+                release(success=response._content_consumed)
+
+        def iter_content_and_release(*args, **kwargs) -> "Iterator[bytes]":
+            try:
+                yield from iter_content(*args, **kwargs)
+            except BaseException:
+                release(success=False)
+                raise
+            release(success=True)
+
+        response.close = close_and_release
+        response.iter_content = iter_content_and_release
+
+    def _retry_statuses(self) -> "frozenset[int]":
+        if self.retry_policy is not None:
+            return self.retry_policy.retry_statuses
+        return RETRY_STATUSES
+
+    def _can_retry(self, method: str, attempt: int) -> bool:
+        return self.retry_policy is not None and self.retry_policy.should_retry(
+            method, attempt
+        )
+
+    def _overload(self, reason: str) -> None:
+        if self.limiter is not None:
+            self.limiter.on_overload(reason)
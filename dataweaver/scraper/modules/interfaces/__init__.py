@@ -2,18 +2,30 @@ from .base import (
     PDFServiceAbstractFactory,
     HttpClientInterface,
     PDFScraperInterface,
+    StreamingPDFScraperInterface,
+    CrawlingPDFScraperInterface,
     FileManagerInterface,
     ZipCompressorInterface,
+    ArchiveSinkInterface,
     PDFProcessingServiceInterface,
     PDFExtractionStrategy,
+    AsyncHttpClientInterface,
+    AsyncPDFScraperInterface,
+    AsyncFileManagerInterface,
 )
 
 __all__ = [
     "PDFServiceAbstractFactory",
     "HttpClientInterface",
     "PDFScraperInterface",
+    "StreamingPDFScraperInterface",
+    "CrawlingPDFScraperInterface",
     "FileManagerInterface",
     "ZipCompressorInterface",
+    "ArchiveSinkInterface",
     "PDFProcessingServiceInterface",
     "PDFExtractionStrategy",
+    "AsyncHttpClientInterface",
+    "AsyncPDFScraperInterface",
+    "AsyncFileManagerInterface",
 ]
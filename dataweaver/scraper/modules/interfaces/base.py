@@ -2,7 +2,9 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, Tag
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
 
 
 class PDFScraperInterface(ABC):
@@ -25,15 +27,53 @@ class PDFScraperInterface(ABC):
         pass
 
 
+class StreamingPDFScraperInterface(PDFScraperInterface):
+    """Scraper que emite os links à medida que a página é recebida.
+
+    Permite iniciar downloads antes de o corpo da página terminar de chegar.
+    """
+
+    @abstractmethod
+    def iter_pdf_links(self, url: str) -> "Iterator[str]":
+        """Gera os links dos arquivos PDF, sem duplicatas, conforme são encontrados.
+
+        Args:
+            url: URL da página a ser analisada.
+
+        Yields:
+            URLs absolutos dos arquivos PDF encontrados.
+        """
+        pass
+
+
+class CrawlingPDFScraperInterface(PDFScraperInterface):
+    """Scraper capaz de percorrer várias páginas iniciais em uma única chamada."""
+
+    @abstractmethod
+    def crawl(self, seeds: "Iterable[str]") -> list[str]:
+        """Obtém os links de PDFs de todas as páginas, sem duplicatas.
+
+        Args:
+            seeds: URLs das páginas iniciais.
+
+        Returns:
+            Lista de URLs absolutos dos arquivos PDF encontrados.
+        """
+        pass
+
+
 class FileManagerInterface(ABC):
     """Interface para gerenciamento de arquivos (download/armazenamento)."""
 
     @abstractmethod
-    def save_file(self, url: str) -> None:
+    def save_file(self, url: str) -> "Path | None":
         """Faz o download de um arquivo e o salva no local especificado.
 
         Args:
             url: URL do arquivo a ser baixado.
+
+        Returns:
+            Caminho do arquivo salvo (ou None se a implementação não o expõe).
         """
         pass
 
@@ -51,6 +91,42 @@ class ZipCompressorInterface(ABC):
         pass
 
 
+class ArchiveSinkInterface(ABC):
+    """Interface para arquivos compactados alimentados durante os downloads.
+
+    Cada arquivo concluído é acrescentado ao arquivo compactado enquanto os
+    demais downloads continuam, em vez de compactar tudo ao final.
+    """
+
+    @abstractmethod
+    def open(self, archive_name: str) -> None:
+        """Inicia um novo arquivo compactado.
+
+        Args:
+            archive_name: Nome do arquivo de saída (com extensão).
+        """
+        pass
+
+    @abstractmethod
+    def add(self, path: "Path") -> None:
+        """Acrescenta um arquivo concluído (seguro para várias threads).
+
+        Args:
+            path: Arquivo a ser incluído.
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finaliza e publica o arquivo compactado."""
+        pass
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Descarta o arquivo compactado em construção."""
+        pass
+
+
 class PDFProcessingServiceInterface(ABC):
     """Interface para o serviço completo de processamento de PDFs.
 
@@ -67,6 +143,18 @@ class PDFProcessingServiceInterface(ABC):
         """
         pass
 
+    def process_many(self, urls: list[str]) -> None:
+        """Executa o pipeline para várias páginas.
+
+        A implementação padrão processa uma página por vez; os serviços
+        concretos consolidam as páginas em uma única execução.
+
+        Args:
+            urls: URLs das páginas web alvo.
+        """
+        for url in urls:
+            self.process(url)
+
 
 class HttpClientInterface(ABC):
     """Interface para clientes HTTP (ex: requests, aiohttp)."""
@@ -84,13 +172,68 @@ class HttpClientInterface(ABC):
         pass
 
 
+class AsyncHttpClientInterface(ABC):
+    """Interface para clientes HTTP assíncronos (ex: aiohttp)."""
+
+    @abstractmethod
+    async def fetch_html(self, url: str) -> str:
+        """Obtém o HTML bruto de uma URL sem bloquear o event loop.
+
+        Args:
+            url: Endereço web alvo.
+
+        Returns:
+            HTML da página como string.
+        """
+        pass
+
+
+class AsyncPDFScraperInterface(ABC):
+    """Interface assíncrona para extração de links PDF de uma página web."""
+
+    @abstractmethod
+    async def get_pdf_links(self, url: str) -> list[str]:
+        """Obtém os links dos arquivos PDF.
+
+        Args:
+            url: URL da página a ser analisada.
+
+        Returns:
+            Lista de URLs absolutos dos arquivos PDF encontrados.
+        """
+        pass
+
+
+class AsyncFileManagerInterface(ABC):
+    """Interface assíncrona para download/armazenamento de arquivos."""
+
+    @abstractmethod
+    async def save_file(self, url: str) -> "Path | None":
+        """Faz o download de um arquivo e o salva no local especificado.
+
+        Args:
+            url: URL do arquivo a ser baixado.
+
+        Returns:
+            Caminho do arquivo salvo (ou None se a implementação não o expõe).
+        """
+        pass
+
+
 class PDFExtractionStrategy(ABC):
     """Interface para estratégias de extração de links PDF.
 
     Design Pattern:
         Strategy (permite variações na lógica de extração).
+
+    Estratégias que declaram ``tag_names`` e implementam ``extract_from_tag``
+    podem ser combinadas em uma única varredura do documento
+    (SinglePassPDFLinkExtractor); as demais são executadas via ``extract``.
     """
 
+    #: Tags examinadas pela estratégia (vazio = sem suporte a varredura única).
+    tag_names: tuple[str, ...] = ()
+
     @abstractmethod
     def extract(self, soup: "BeautifulSoup", base_url: str) -> set[str]:
         """Extrai links de PDFs de um objeto BeautifulSoup.
@@ -104,6 +247,18 @@ class PDFExtractionStrategy(ABC):
         """
         pass
 
+    def extract_from_tag(self, tag: "Tag", base_url: str) -> set[str]:
+        """Extrai links de PDFs de uma única tag listada em ``tag_names``.
+
+        Args:
+            tag: Elemento encontrado na varredura do documento.
+            base_url: URL base para resolver links relativos.
+
+        Returns:
+            Conjunto de URLs absolutos de PDFs.
+        """
+        return set()
+
 
 class PDFServiceAbstractFactory(ABC):
     """Interface para fábrica abstrata de componentes do serviço de PDF.
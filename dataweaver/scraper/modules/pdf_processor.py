@@ -2,20 +2,56 @@
 Pipeline Scraper - Fluxo Completo de Processamento
 """
 
-from .interfaces import PDFProcessingServiceInterface
+from .interfaces import (
+    PDFProcessingServiceInterface,
+    StreamingPDFScraperInterface,
+    CrawlingPDFScraperInterface,
+)
+from .crawler import canonicalize_url
 from .zip_compressor import ValidationZipCompressor, LoggingZipCompressor
 from dataweaver.settings import logger
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
+import threading
+import os
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
     from .interfaces import (
         PDFScraperInterface,
         FileManagerInterface,
         ZipCompressorInterface,
+        ArchiveSinkInterface,
     )
 
 
+@dataclass
+class DownloadSummary:
+    """Resumo dos downloads de uma execução.
+
+    As listas são ordenadas por URL, de modo que o resumo é o mesmo
+    independentemente da ordem em que os downloads concorrentes terminam.
+    """
+
+    succeeded: list[str] = field(default_factory=list)  # URLs baixadas
+    failed: dict[str, str] = field(default_factory=dict)  # URL -> mensagem de erro
+
+    @classmethod
+    def from_results(cls, results: dict[str, "str | None"]) -> "DownloadSummary":
+        """Monta o resumo a partir do mapa URL -> erro (None em caso de sucesso)."""
+        return cls(
+            succeeded=sorted(url for url, error in results.items() if error is None),
+            failed={
+                url: error
+                for url, error in sorted(results.items())
+                if error is not None
+            },
+        )
+
+
 class PDFProcessingService(PDFProcessingServiceInterface):
     """Coordena o fluxo completo de processamento de arquivos PDF.
 
@@ -26,7 +62,8 @@ class PDFProcessingService(PDFProcessingServiceInterface):
     Responsabilidades:
         1. Extração de links PDF
         2. Download dos arquivos
-        3. Compactação em ZIP
+        3. Compactação em ZIP (ao final ou, com um ArchiveSinkInterface,
+           à medida que cada download termina)
     """
 
     def __init__(
@@ -36,6 +73,8 @@ class PDFProcessingService(PDFProcessingServiceInterface):
         scraper: "PDFScraperInterface",
         file_manager: "FileManagerInterface",
         zip_compressor: "ZipCompressorInterface",
+        max_workers: int = 1,
+        archive_sink: "ArchiveSinkInterface | None" = None,
     ) -> None:
         """Inicializa o serviço com seus componentes.
 
@@ -46,11 +85,20 @@ class PDFProcessingService(PDFProcessingServiceInterface):
             file_manager: Componente para download de arquivos
             zip_compressor: Será automaticamente decorado com
                             Validation + Logging decorators
+            max_workers: Número máximo de downloads simultâneos
+                         (1 mantém o download sequencial)
+            archive_sink: (Opcional) Recebe cada arquivo assim que é baixado;
+                          substitui a compactação ao final
         """
         self.zip_name = zip_name
         self.file_extension = file_extension
         self.scraper = scraper
         self.file_manager = file_manager
+        self.max_workers = max(1, max_workers)
+        self.archive_sink = archive_sink
+        self.summary: "DownloadSummary | None" = None
+        self._file_locks: dict[str, threading.Lock] = {}
+        self._file_locks_guard = threading.Lock()
 
         # Uso de Decorators
         self.zip_compressor = ValidationZipCompressor(
@@ -62,7 +110,7 @@ class PDFProcessingService(PDFProcessingServiceInterface):
 
         Fluxo:
             1. Extrai links de PDFs da URL fornecida
-            2. Baixa cada arquivo individualmente
+            2. Baixa os arquivos (em paralelo quando max_workers > 1)
             3. Compacta todos em um único ZIP
 
         Args:
@@ -76,25 +124,149 @@ class PDFProcessingService(PDFProcessingServiceInterface):
             >>> service = PDFProcessingService(...)
             >>> service.process("http://exemplo.com/pdfs")
         """
+        self.process_many([url])
+
+    def process_many(self, urls: list[str]) -> None:
+        """Executa o pipeline para várias páginas em uma única execução.
+
+        Os links de todas as páginas são consolidados (sem duplicatas) antes
+        do download e todos os arquivos vão para o mesmo ZIP. Scrapers que
+        implementam CrawlingPDFScraperInterface percorrem as páginas
+        concorrentemente.
+
+        Args:
+            urls: URLs das páginas contendo os PDFs
+        """
         try:
             logger.info("Iniciando busca por PDFs...")
-            pdf_links = self.scraper.get_pdf_links(url)
+            if self.archive_sink is not None:
+                self.archive_sink.open(self.zip_name)
+            if isinstance(self.scraper, StreamingPDFScraperInterface):
+                logger.info("Baixando PDFs conforme os links são encontrados...")
+                self.summary = self._download_streaming(self._iter_links(urls))
+                if not self.summary.succeeded and not self.summary.failed:
+                    logger.warning("Nenhum PDF encontrado na página.")
+                    self._abort_archive()
+                    return
+            else:
+                pdf_links = self._collect_links(urls)
 
-            if not pdf_links:
-                logger.warning("Nenhum PDF encontrado na página.")
-                return
+                if not pdf_links:
+                    logger.warning("Nenhum PDF encontrado na página.")
+                    self._abort_archive()
+                    return
 
-            logger.info(f"Iniciando download de {len(pdf_links)} PDFs...")
-            for link in pdf_links:
-                try:
-                    self.file_manager.save_file(link)
-                except Exception as e:
-                    logger.error(f"Falha no download: {link} - Erro: {str(e)}")
-                    continue
+                logger.info(f"Iniciando download de {len(pdf_links)} PDFs...")
+                self.summary = self._download_all(pdf_links)
+            logger.info(
+                f"Downloads concluídos: {len(self.summary.succeeded)} sucesso(s), "
+                f"{len(self.summary.failed)} falha(s)."
+            )
 
-            logger.info("Compactando arquivos...")
-            self.zip_compressor.create_zip(self.zip_name, self.file_extension)
+            if self.archive_sink is not None:
+                logger.info("Finalizando o arquivo compactado...")
+                self.archive_sink.close()
+            else:
+                logger.info("Compactando arquivos...")
+                self.zip_compressor.create_zip(self.zip_name, self.file_extension)
 
         except Exception as e:
+            self._abort_archive()
             logger.critical(f"Falha crítica no processamento: {str(e)}")
             raise
+
+    def _abort_archive(self) -> None:
+        if self.archive_sink is not None:
+            self.archive_sink.abort()
+
+    def _collect_links(self, urls: list[str]) -> list[str]:
+        """Obtém os links de todas as páginas, sem duplicatas."""
+        if isinstance(self.scraper, CrawlingPDFScraperInterface) and len(urls) > 1:
+            return self.scraper.crawl(urls)
+
+        links: dict[str, None] = {}
+        for url in dict.fromkeys(urls):
+            for link in self.scraper.get_pdf_links(url):
+                links.setdefault(link)
+        return list(links)
+
+    def _iter_links(self, urls: list[str]) -> "Iterator[str]":
+        """Encadeia os links emitidos incrementalmente para cada página."""
+        pages: dict[str, str] = {}
+        for url in urls:
+            pages.setdefault(canonicalize_url(url), url)
+        for url in pages.values():
+            yield from self.scraper.iter_pdf_links(url)
+
+    def _download_all(self, links: list[str]) -> DownloadSummary:
+        """Baixa todos os links, sequencialmente ou com um pool de threads.
+
+        Args:
+            links: URLs dos arquivos a serem baixados
+
+        Returns:
+            DownloadSummary com os sucessos e falhas ordenados por URL
+        """
+        if self.max_workers == 1 or len(links) == 1:
+            results = {link: self._download(link) for link in links}
+        else:
+            workers = min(self.max_workers, len(links))
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="pdf-download"
+            ) as executor:
+                results = dict(zip(links, executor.map(self._download, links)))
+        return DownloadSummary.from_results(results)
+
+    def _download_streaming(self, links: "Iterable[str]") -> DownloadSummary:
+        """Agenda cada link no pool assim que ele é emitido pelo scraper.
+
+        A fila de trabalho do ThreadPoolExecutor desacopla o parsing da página
+        dos downloads: o primeiro arquivo começa a ser baixado enquanto o
+        restante da página ainda está sendo lido. Links repetidos são ignorados.
+
+        Args:
+            links: Iterável de URLs produzido incrementalmente
+
+        Returns:
+            DownloadSummary com os sucessos e falhas ordenados por URL
+        """
+        futures: dict[str, "Future"] = {}
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="pdf-download"
+        )
+        try:
+            for link in links:
+                if link not in futures:
+                    futures[link] = executor.submit(self._download, link)
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+        return DownloadSummary.from_results(
+            {link: future.result() for link, future in futures.items()}
+        )
+
+    def _download(self, link: str) -> "str | None":
+        """Baixa um único arquivo isolando a falha dos demais.
+
+        Links com o mesmo nome de arquivo (ex: ``/x/anexo.pdf`` e
+        ``/y/anexo.pdf``) gravam o mesmo destino e por isso são baixados um
+        de cada vez; vale o último a terminar.
+
+        Returns:
+            None em caso de sucesso ou a mensagem de erro
+        """
+        try:
+            with self._file_lock(os.path.basename(link)):
+                path = self.file_manager.save_file(link)
+                if self.archive_sink is not None:
+                    self.archive_sink.add(path)
+            return None
+        except Exception as e:
+            logger.error(f"Falha no download: {link} - Erro: {str(e)}")
+            return str(e)
+
+    def _file_lock(self, filename: str) -> threading.Lock:
+        """Lock que serializa os downloads de um mesmo nome de arquivo."""
+        with self._file_locks_guard:
+            return self._file_locks.setdefault(filename, threading.Lock())
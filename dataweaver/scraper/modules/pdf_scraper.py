@@ -1,12 +1,19 @@
 from dataweaver.settings import logger
 from dataweaver.errors import LinkPDFExtractionError
 from .interfaces import PDFScraperInterface, HttpClientInterface, PDFExtractionStrategy
+from .http_session import PooledHttpSession
+from .html_parsing import HtmlDocumentParser
 
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 import requests
 import re
 
+if TYPE_CHECKING:
+    from .http_cache import HttpValidatorCache
+    from bs4 import Tag
+
 
 class RequestsPDFScraper(PDFScraperInterface):
     """Implementação concreta de PDFScraper usando requests e estratégia de extração.
@@ -17,16 +24,28 @@ class RequestsPDFScraper(PDFScraperInterface):
     """
 
     def __init__(
-        self, http_client: HttpClientInterface, extractor: "PDFExtractionStrategy"
+        self,
+        http_client: HttpClientInterface,
+        extractor: "PDFExtractionStrategy",
+        document_parser: "HtmlDocumentParser" = None,
     ) -> None:
+        """Inicializa o scraper.
+
+        Args:
+            http_client: Cliente HTTP para obter o HTML
+            extractor: Estratégia de extração de links
+            document_parser: (Opcional) Parser do HTML; por padrão html.parser
+                             com o documento inteiro.
+        """
         self.http_client = http_client
         self.extractor = extractor
+        self.document_parser = document_parser or HtmlDocumentParser()
 
     def get_pdf_links(self, url: str) -> list[str]:
         """Obtém links de PDFs de uma página web."""
         try:
             html = self.http_client.fetch_html(url)
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self.document_parser.parse(html)
             return self.extractor.extract(soup, url)
         except Exception as e:
             logger.error("Erro ao extrair PDFs")
@@ -40,6 +59,8 @@ class AnchorPDFExtractionStrategy(PDFExtractionStrategy):
         Strategy - implementa algoritmo específico de extração
     """
 
+    tag_names = ("a",)
+
     def __init__(self, keyword: str) -> None:
         self.keyword = keyword.lower()
 
@@ -55,15 +76,26 @@ class AnchorPDFExtractionStrategy(PDFExtractionStrategy):
         """
         links = set()
         for link in soup.find_all("a", href=True):
-            href = link["href"]
-            if ".pdf" in href.lower() and self.keyword in href.lower():
-                links.add(urljoin(base_url, href))
+            links.update(self.extract_from_tag(link, base_url))
         return links
 
+    def extract_from_tag(self, tag: "Tag", base_url: str) -> set[str]:
+        """Avalia o href de uma única tag <a>."""
+        href = tag.get("href")
+        if href is None:
+            return set()
+        lowered = href.lower()
+        if ".pdf" in lowered and self.keyword in lowered:
+            return {urljoin(base_url, href)}
+        return set()
+
 
 class ParagraphPDFExtractionStrategy(PDFExtractionStrategy):
     """Estratégia para extrair links PDF embutidos em parágrafos."""
 
+    tag_names = ("p",)
+    PATTERN = re.compile(r'href=[\'"]?([^\'" >]+\.pdf)')
+
     def __init__(self, keyword: str) -> None:
         self.keyword = keyword.lower()
 
@@ -79,10 +111,22 @@ class ParagraphPDFExtractionStrategy(PDFExtractionStrategy):
         """
         links = set()
         for paragraph in soup.find_all("p"):
-            matches = re.findall(r'href=[\'"]?([^\'" >]+\.pdf)', str(paragraph))
-            for match in matches:
-                if self.keyword in match.lower():
-                    links.add(urljoin(base_url, match))
+            links.update(self.extract_from_tag(paragraph, base_url))
+        return links
+
+    def extract_from_tag(self, tag: "Tag", base_url: str) -> set[str]:
+        """Aplica a regex sobre o HTML serializado de um parágrafo.
+
+        Parágrafos aninhados são ignorados: seu HTML já faz parte da
+        serialização do parágrafo externo e uma correspondência nunca
+        atravessa os limites de uma tag (``>``, aspas e espaço a encerram).
+        """
+        if tag.find_parent("p") is not None:
+            return set()
+        links = set()
+        for match in self.PATTERN.findall(tag.decode()):
+            if self.keyword in match.lower():
+                links.add(urljoin(base_url, match))
         return links
 
 
@@ -96,6 +140,22 @@ class PDFLinkExtractor(PDFExtractionStrategy):
     def __init__(self, strategies: list["PDFExtractionStrategy"]) -> None:
         self.strategies = strategies
 
+    @property
+    def tag_names(self) -> tuple[str, ...]:
+        """União das tags declaradas pelas estratégias.
+
+        Vazio se alguma estratégia não declarar suas tags, pois ela pode
+        precisar do documento inteiro.
+        """
+        names: list[str] = []
+        for strategy in self.strategies:
+            if not isinstance(strategy, PDFExtractionStrategy):
+                return ()
+            if not strategy.tag_names:
+                return ()
+            names.extend(n for n in strategy.tag_names if n not in names)
+        return tuple(names)
+
     def extract(self, soup: BeautifulSoup, base_url: str) -> list[str]:
         """Executa todas as estratégias e consolida os resultados.
 
@@ -112,6 +172,50 @@ class PDFLinkExtractor(PDFExtractionStrategy):
         return list(pdf_links)
 
 
+class SinglePassPDFLinkExtractor(PDFLinkExtractor):
+    """Combina as estratégias em uma única varredura do documento.
+
+    Em vez de cada estratégia percorrer a árvore inteira, as tags de
+    interesse de todas elas (``tag_names``) são buscadas de uma só vez e
+    cada tag é entregue apenas às estratégias que a registraram.
+    Estratégias sem ``tag_names`` continuam sendo executadas via ``extract``.
+    O resultado é o mesmo do PDFLinkExtractor.
+
+    Padrão de Projeto:
+        Composite - combina resultados de várias estratégias
+    """
+
+    def __init__(self, strategies: list["PDFExtractionStrategy"]) -> None:
+        super().__init__(strategies)
+        self._by_tag: dict[str, list["PDFExtractionStrategy"]] = {}
+        self._fallback: list["PDFExtractionStrategy"] = []
+        for strategy in strategies:
+            if isinstance(strategy, PDFExtractionStrategy) and strategy.tag_names:
+                for name in strategy.tag_names:
+                    self._by_tag.setdefault(name, []).append(strategy)
+            else:
+                self._fallback.append(strategy)
+
+    def extract(self, soup: BeautifulSoup, base_url: str) -> list[str]:
+        """Percorre o documento uma vez e consolida os resultados.
+
+        Args:
+            soup: HTML parseado
+            base_url: URL base para normalização
+
+        Returns:
+            Lista única com todos os links encontrados (sem duplicatas)
+        """
+        pdf_links = set()
+        if self._by_tag:
+            for tag in soup.find_all(list(self._by_tag)):
+                for strategy in self._by_tag[tag.name]:
+                    pdf_links.update(strategy.extract_from_tag(tag, base_url))
+        for strategy in self._fallback:
+            pdf_links.update(strategy.extract(soup, base_url))
+        return list(pdf_links)
+
+
 class RequestsHttpClient(HttpClientInterface):
     """Implementação de cliente HTTP usando a biblioteca requests.
 
@@ -119,6 +223,19 @@ class RequestsHttpClient(HttpClientInterface):
         Adapter - adapta a interface do requests para HttpClientInterface
     """
 
+    def __init__(
+        self, session: "requests.Session" = None, cache: "HttpValidatorCache" = None
+    ) -> None:
+        """Inicializa o cliente.
+
+        Args:
+            session: (Opcional) Sessão HTTP compartilhada; por padrão cria uma
+                     PooledHttpSession própria.
+            cache: (Opcional) Cache de validadores para GET condicional.
+        """
+        self.session = session or PooledHttpSession()
+        self.cache = cache
+
     def fetch_html(self, url: str) -> str:
         """Obtém o conteúdo HTML de uma URL.
 
@@ -132,9 +249,28 @@ class RequestsHttpClient(HttpClientInterface):
             requests.exceptions.RequestException: Em falhas de rede/timeout
         """
         try:
-            response = requests.get(url, timeout=10)
+            headers = {}
+            if self.cache is not None:
+                headers = self.cache.conditional_headers(url, self.cache.page_path(url))
+
+            response = self._get(url, headers)
+            if response.status_code == 304:
+                html = self.cache.load_page(url)
+                if html is not None:
+                    logger.info(f"Página não modificada, usando cache: {url[:50]}...")
+                    return html
+                response = self._get(url, {})
+
             response.raise_for_status()
+            if self.cache is not None:
+                self.cache.store_page(url, response.headers, response.text)
             return response.text
         except requests.exceptions.RequestException as e:
             logger.error(f"Falha na requisição para {url[:50]}...: {e}")
             raise
+
+    def _get(self, url: str, headers: dict[str, str]) -> "requests.Response":
+        """GET simples ou condicional, conforme os cabeçalhos informados."""
+        if headers:
+            return self.session.get(url, headers=headers)
+        return self.session.get(url)
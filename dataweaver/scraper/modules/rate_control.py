@@ -0,0 +1,196 @@
+from dataweaver.settings import logger
+
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+import threading
+import random
+import time
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Respostas que indicam sobrecarga/limitação temporária do servidor
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Métodos seguros para repetir sem efeitos colaterais
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def parse_retry_after(value: "str | None") -> "float | None":
+    """Converte o cabeçalho Retry-After (segundos ou data HTTP) em segundos.
+
+    Returns:
+        Segundos a aguardar (nunca negativo) ou None se ausente/inválido
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Política de novas tentativas com backoff exponencial e jitter.
+
+    O intervalo da tentativa ``n`` é sorteado entre 0 e
+    ``min(backoff_max, backoff_base * 2**n)`` ("full jitter"), o que evita que
+    vários workers voltem ao servidor ao mesmo tempo. Um ``Retry-After``
+    enviado pelo servidor tem precedência sobre o backoff calculado.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        retry_statuses: "frozenset[int]" = RETRY_STATUSES,
+        sleep=time.sleep,
+    ) -> None:
+        """Inicializa a política.
+
+        Args:
+            max_retries: Novas tentativas após a primeira requisição
+            backoff_base: Intervalo base do backoff (segundos)
+            backoff_max: Intervalo máximo entre tentativas (segundos)
+            retry_statuses: Status HTTP que disparam nova tentativa
+            sleep: Função de espera (injetável em testes)
+        """
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = retry_statuses
+        self.sleep = sleep
+
+    def should_retry(self, method: str, attempt: int) -> bool:
+        """Indica se a tentativa ``attempt`` (0 = primeira) pode ser repetida."""
+        return method.upper() in IDEMPOTENT_METHODS and attempt < self.max_retries
+
+    def delay(self, attempt: int, retry_after: "str | None" = None) -> float:
+        """Calcula a espera antes da próxima tentativa.
+
+        Args:
+            attempt: Número da tentativa que falhou (0 = primeira)
+            retry_after: Valor do cabeçalho Retry-After, se houver
+
+        Returns:
+            Segundos a aguardar
+        """
+        server_delay = parse_retry_after(retry_after)
+        if server_delay is not None:
+            return min(server_delay, self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(0, ceiling)
+
+    def wait(self, attempt: int, retry_after: "str | None" = None) -> None:
+        """Aguarda o intervalo calculado por ``delay``."""
+        self.sleep(self.delay(attempt, retry_after))
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limite de requisições simultâneas ajustado por AIMD.
+
+    - Aumento aditivo: cada janela de ``limit`` respostas rápidas e bem-sucedidas
+      libera uma vaga a mais (até ``maximum``).
+    - Redução multiplicativa: throttling (429/5xx), erros de rede ou latência
+      acima de ``latency_target`` multiplicam o limite por ``decrease_factor``
+      (até ``minimum``). Reduções ficam espaçadas por ``cooldown`` segundos para
+      que uma rajada de erros simultâneos conte como um único sinal.
+
+    Seguro para uso por várias threads.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        initial: "int | None" = None,
+        decrease_factor: float = 0.5,
+        latency_target: "float | None" = None,
+        cooldown: float = 1.0,
+    ) -> None:
+        """Inicializa o limitador.
+
+        Args:
+            maximum: Limite superior (ex: tamanho do pool de conexões)
+            minimum: Limite inferior
+            initial: Limite inicial (padrão: ``maximum``)
+            decrease_factor: Fator aplicado ao limite a cada sinal de sobrecarga
+            latency_target: (Opcional) Latência (s) acima da qual o limite diminui
+            cooldown: Intervalo mínimo entre reduções (segundos)
+        """
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.decrease_factor = decrease_factor
+        self.latency_target = latency_target
+        self.cooldown = cooldown
+
+        self._limit = float(initial if initial is not None else self.maximum)
+        self._limit = min(max(self._limit, self.minimum), self.maximum)
+        self._active = 0
+        self._last_decrease = float("-inf")
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Número atual de vagas."""
+        return int(self._limit)
+
+    @property
+    def active(self) -> int:
+        """Vagas ocupadas no momento."""
+        return self._active
+
+    @contextmanager
+    def slot(self) -> "Iterator[None]":
+        """Bloqueia até haver uma vaga livre sob o limite atual."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def acquire(self) -> None:
+        """Ocupa uma vaga, bloqueando até haver uma livre (liberar com ``release``)."""
+        with self._condition:
+            while self._active >= self.limit:
+                self._condition.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        """Libera uma vaga ocupada por ``acquire``."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        """Registra uma resposta bem-sucedida e sua latência (segundos)."""
+        if self.latency_target is not None and latency > self.latency_target:
+            self.on_overload("latência elevada")
+            return
+        with self._condition:
+            if self._limit < self.maximum:
+                self._limit = min(self.maximum, self._limit + 1 / self.limit)
+                self._condition.notify_all()
+
+    def on_overload(self, reason: str) -> None:
+        """Registra um sinal de sobrecarga (throttling, erro ou latência)."""
+        with self._condition:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            previous = self.limit
+            self._limit = max(self.minimum, self._limit * self.decrease_factor)
+        if self.limit != previous:
+            logger.warning(
+                f"Reduzindo requisições simultâneas de {previous} para "
+                f"{self.limit} ({reason})"
+            )
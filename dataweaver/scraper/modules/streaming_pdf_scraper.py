@@ -0,0 +1,168 @@
+from dataweaver.settings import logger
+from dataweaver.errors import LinkPDFExtractionError
+from .interfaces import StreamingPDFScraperInterface
+from .http_session import PooledHttpSession
+from .pdf_scraper import ParagraphPDFExtractionStrategy
+
+from typing import TYPE_CHECKING
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+from bs4.dammit import EntitySubstitution
+import codecs
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    import requests
+
+# Tamanho dos blocos lidos do corpo da página
+CHUNK_SIZE = 64 * 1024
+
+
+class StreamingPDFLinkParser(HTMLParser):
+    """Parser HTML incremental que aplica as regras de extração de links PDF.
+
+    Reproduz, sem montar a árvore, as duas estratégias padrão:
+        - AnchorPDFExtractionStrategy: ``href`` de qualquer ``<a>``
+        - ParagraphPDFExtractionStrategy: a mesma regex aplicada ao HTML
+          serializado de cada parágrafo (atributos, textos e comentários)
+
+    Os links novos ficam pendentes até serem consumidos via ``pop_links``.
+    """
+
+    def __init__(self, keyword: str, base_url: str) -> None:
+        super().__init__(convert_charrefs=True)
+        self.keyword = keyword.lower()
+        self.base_url = base_url
+        self._paragraph_depth = 0
+        self._text: list[str] = []
+        self._seen: set[str] = set()
+        self._pending: list[str] = []
+
+    def pop_links(self) -> list[str]:
+        """Retorna e limpa os links encontrados desde a última chamada."""
+        links, self._pending = self._pending, []
+        return links
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text()
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, "str | None"]]) -> None:
+        self._flush_text()
+        if tag == "p":
+            self._paragraph_depth += 1
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href is not None:
+                lowered = href.lower()
+                if ".pdf" in lowered and self.keyword in lowered:
+                    self._emit(urljoin(self.base_url, href))
+        if self._paragraph_depth:
+            for name, value in attrs:
+                quoted = EntitySubstitution.substitute_xml(
+                    value or "", make_quoted_attribute=True
+                )
+                self._scan_markup(f"{name}={quoted}")
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_text()
+        if tag == "p" and self._paragraph_depth:
+            self._paragraph_depth -= 1
+
+    def handle_data(self, data: str) -> None:
+        # O texto pode chegar fragmentado entre blocos; é avaliado inteiro
+        # na próxima tag para não perder correspondências na divisa.
+        if self._paragraph_depth:
+            self._text.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_text()
+        if self._paragraph_depth:
+            self._scan_markup(f"<!--{data}-->")
+
+    def _flush_text(self) -> None:
+        if self._text:
+            text, self._text = "".join(self._text), []
+            self._scan_markup(EntitySubstitution.substitute_xml(text))
+
+    def _scan_markup(self, markup: str) -> None:
+        for match in ParagraphPDFExtractionStrategy.PATTERN.findall(markup):
+            if self.keyword in match.lower():
+                self._emit(urljoin(self.base_url, match))
+
+    def _emit(self, link: str) -> None:
+        if link not in self._seen:
+            self._seen.add(link)
+            self._pending.append(link)
+
+
+class StreamingPDFScraper(StreamingPDFScraperInterface):
+    """Scraper que alimenta um parser incremental com o corpo da página.
+
+    Cada link PDF é emitido assim que sua tag é lida, permitindo que o
+    serviço inicie os downloads enquanto o restante da página ainda está
+    sendo transferido. Não usa o cache de validadores: a página é sempre
+    transferida por completo.
+
+    Padrão de Projeto:
+        Iterator - ``iter_pdf_links`` produz os links sob demanda
+    """
+
+    def __init__(
+        self,
+        keyword: str,
+        session: "requests.Session" = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        """Inicializa o scraper.
+
+        Args:
+            keyword: Filtro de palavras-chave aplicado aos links
+            session: (Opcional) Sessão HTTP compartilhada; por padrão cria uma
+                     PooledHttpSession própria.
+            chunk_size: Tamanho dos blocos lidos da resposta (bytes)
+        """
+        self.keyword = keyword
+        self.session = session or PooledHttpSession()
+        self.chunk_size = chunk_size
+
+    def get_pdf_links(self, url: str) -> list[str]:
+        """Obtém todos os links de PDFs de uma página web."""
+        return list(self.iter_pdf_links(url))
+
+    def iter_pdf_links(self, url: str) -> "Iterator[str]":
+        """Gera os links de PDFs conforme a página é recebida.
+
+        Args:
+            url: URL da página a ser analisada
+
+        Yields:
+            URLs absolutos dos PDFs, sem duplicatas
+
+        Raises:
+            LinkPDFExtractionError: Em falhas de rede ou de parsing
+        """
+        try:
+            with self.session.get(url, stream=True) as response:
+                response.raise_for_status()
+                decoder = self._decoder(response.encoding)
+                parser = StreamingPDFLinkParser(self.keyword, url)
+
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    parser.feed(decoder.decode(chunk))
+                    yield from parser.pop_links()
+
+                parser.feed(decoder.decode(b"", final=True))
+                parser.close()
+                yield from parser.pop_links()
+        except Exception:
+            logger.error("Erro ao extrair PDFs")
+            raise LinkPDFExtractionError(f"Erro ao processar a URL: {url}")
+
+    @staticmethod
+    def _decoder(encoding: "str | None") -> "codecs.IncrementalDecoder":
+        """Decodificador incremental para a codificação informada pela resposta."""
+        try:
+            return codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+        except LookupError:
+            return codecs.getincrementaldecoder("utf-8")(errors="replace")
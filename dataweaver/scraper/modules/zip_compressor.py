@@ -1,22 +1,47 @@
 from .interfaces import ZipCompressorInterface
+from .zip_writer import (
+    RawZipWriter,
+    compress_file,
+    dos_date_time,
+    member_from_zipinfo,
+    open_raw_member,
+)
 from dataweaver.settings import logger
 
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from pathlib import Path
+import dataclasses
 from typing import TYPE_CHECKING
+import tempfile
 import zipfile
+import zlib
+import os
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from .archive_codecs import ArchiveCodec
+    from .compression_policy import CompressionPolicy, CompressionDecision
 
 
 class ZipCompressor(ZipCompressorInterface):
     """Responsável por compactar arquivos PDF em um arquivo ZIP.
 
+    Com uma CompressionPolicy, cada arquivo é guardado sem compressão
+    (STORED) ou comprimido com o nível escolhido pela política; as escolhas
+    ficam em ``decisions`` (nome do membro -> CompressionDecision).
+
     SOLID:
         Single Responsibility Principle - foca apenas na compressão
     """
 
-    def __init__(self, folder: "Path") -> None:
+    archive_extension = ".zip"
+
+    def __init__(
+        self, folder: "Path", policy: "CompressionPolicy | None" = None
+    ) -> None:
         self.folder = folder
+        self.policy = policy
+        self.decisions: dict[str, "CompressionDecision"] = {}
 
     def create_zip(self, zip_name: str, file_extension: str) -> None:
         """Cria arquivo ZIP contendo todos os PDFs do diretório.
@@ -49,15 +74,46 @@ class ZipCompressor(ZipCompressorInterface):
         return self.folder / f"{zip_name}"
 
     def _compress_files(self, zip_path: "Path", extension: str) -> None:
+        self.decisions = {}
         with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
             for file_path in self._get_files_by_extension(extension):
                 try:
                     arcname = file_path.relative_to(self.folder)
-                    zipf.write(file_path, arcname)
+                    decision = self._decide(file_path, arcname.as_posix())
+                    if decision is None:
+                        zipf.write(file_path, arcname)
+                    else:
+                        zipf.write(
+                            file_path,
+                            arcname,
+                            compress_type=decision.method,
+                            compresslevel=decision.level,
+                        )
                     logger.debug(f"Adicionado: {arcname}")
                 except Exception as e:
                     logger.warning(f"Pulando {file_path.name}: {e}")
                     raise
+        self._log_decisions()
+
+    def _decide(self, file_path: "Path", arcname: str) -> "CompressionDecision | None":
+        """Consulta a política (se houver) e registra a escolha do membro."""
+        if self.policy is None:
+            return None
+        decision = self.policy.decide(file_path)
+        self.decisions[arcname] = decision
+        method = "STORED" if decision.stored else f"DEFLATE {decision.level}"
+        logger.debug(f"{arcname}: {method} ({decision.reason})")
+        return decision
+
+    def _log_decisions(self) -> None:
+        """Resume as escolhas da política de compressão."""
+        if not self.decisions:
+            return
+        stored = sum(decision.stored for decision in self.decisions.values())
+        logger.info(
+            f"Política de compressão: {stored} membro(s) sem compressão, "
+            f"{len(self.decisions) - stored} com DEFLATE."
+        )
 
     def _get_files_by_extension(self, extension: str) -> list["Path"]:
         try:
@@ -67,6 +123,193 @@ class ZipCompressor(ZipCompressorInterface):
             raise
 
 
+class ParallelZipCompressor(ZipCompressor):
+    """Compressor que comprime os membros do ZIP em paralelo.
+
+    Cada arquivo é preparado (DEFLATE bruto ou STORED, com CRC) em um pool
+    de threads e o RawZipWriter monta o ZIP com os fluxos já comprimidos, na
+    ordem original dos arquivos. O resultado é um ZIP padrão, legível por
+    ``zipfile``.
+
+    No modo incremental, os arquivos são comparados com o diretório central
+    do ZIP existente (tamanho e data; se só a data mudou, o CRC): membros
+    inalterados são copiados como bytes comprimidos, sem recompressão, e
+    apenas arquivos novos ou alterados são comprimidos. Membros cujo arquivo
+    não existe mais são descartados.
+
+    O ZIP é escrito em um temporário e renomeado ao final, de modo que uma
+    falha não deixa um arquivo parcial no lugar do anterior.
+    """
+
+    def __init__(
+        self,
+        folder: "Path",
+        max_workers: "int | None" = None,
+        level: int = zlib.Z_DEFAULT_COMPRESSION,
+        policy: "CompressionPolicy | None" = None,
+        incremental: bool = False,
+    ) -> None:
+        """Inicializa o compressor.
+
+        Args:
+            folder: Diretório dos arquivos (e do ZIP gerado)
+            max_workers: Threads de compressão (padrão: número de CPUs)
+            level: Nível de compressão DEFLATE (0-9) sem política
+            policy: (Opcional) Política STORED/DEFLATE por arquivo
+            incremental: Reaproveita os membros inalterados do ZIP existente
+        """
+        super().__init__(folder, policy)
+        self.max_workers = max(1, max_workers or os.cpu_count() or 1)
+        self.level = level
+        self.incremental = incremental
+        self.reused: list[str] = []
+
+    def _compress_files(self, zip_path: "Path", extension: str) -> None:
+        files = self._get_files_by_extension(extension)
+        self.decisions = {}
+        self.reused = []
+        existing = self._load_existing(zip_path) if self.incremental else {}
+        fd, tmp_name = tempfile.mkstemp(dir=zip_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as output, ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="zip"
+            ) as executor:
+                writer = RawZipWriter(output)
+                # Limita os membros comprimidos aguardando escrita
+                pending = deque()
+                for file_path in files:
+                    arcname = file_path.relative_to(self.folder).as_posix()
+                    pending.append(
+                        (
+                            file_path,
+                            executor.submit(
+                                self._prepare_member,
+                                file_path,
+                                arcname,
+                                zip_path,
+                                existing.get(arcname),
+                            ),
+                        )
+                    )
+                    if len(pending) >= 2 * self.max_workers:
+                        self._write_next(writer, pending)
+                while pending:
+                    self._write_next(writer, pending)
+                writer.close()
+            os.replace(tmp_name, zip_path)
+            self._log_decisions()
+            if self.incremental:
+                logger.info(
+                    f"ZIP incremental: {len(self.reused)} membro(s) reaproveitado(s), "
+                    f"{len(files) - len(self.reused)} comprimido(s)."
+                )
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _load_existing(self, zip_path: "Path") -> dict[str, zipfile.ZipInfo]:
+        """Lê o diretório central do ZIP existente (vazio se ausente ou inválido)."""
+        if not zip_path.is_file():
+            return {}
+        try:
+            with zipfile.ZipFile(zip_path) as archive:
+                return {
+                    info.filename: info
+                    for info in archive.infolist()
+                    # Membros criptografados ou com descritor de dados são recomprimidos
+                    if not info.flag_bits & 0x9 and not info.is_dir()
+                }
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.warning(f"ZIP existente ignorado ({zip_path.name}): {e}")
+            return {}
+
+    def _prepare_member(
+        self,
+        file_path: "Path",
+        arcname: str,
+        zip_path: "Path",
+        previous: "zipfile.ZipInfo | None",
+    ) -> tuple:
+        """Reaproveita o membro anterior se inalterado; senão comprime o arquivo."""
+        if previous is not None:
+            stat = file_path.stat()
+            date_time = dos_date_time(stat.st_mtime)
+            if stat.st_size == previous.file_size and (
+                date_time == previous.date_time or self._crc(file_path) == previous.CRC
+            ):
+                member = dataclasses.replace(
+                    member_from_zipinfo(previous), date_time=date_time
+                )
+                self.reused.append(arcname)
+                return member, open_raw_member(zip_path, previous)
+        return self._prepare(file_path, arcname)
+
+    @staticmethod
+    def _crc(file_path: "Path") -> int:
+        crc = 0
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc
+
+    def _prepare(self, file_path: "Path", arcname: str) -> tuple:
+        """Escolhe o método e comprime o arquivo (executado no pool)."""
+        decision = self._decide(file_path, arcname)
+        if decision is None:
+            return compress_file(file_path, arcname, zipfile.ZIP_DEFLATED, self.level)
+        return compress_file(file_path, arcname, decision.method, decision.level)
+
+    @staticmethod
+    def _write_next(writer: RawZipWriter, pending: deque) -> None:
+        """Escreve o próximo membro da fila, na ordem de submissão."""
+        file_path, future = pending.popleft()
+        try:
+            member, data = future.result()
+        except Exception as e:
+            logger.warning(f"Pulando {file_path.name}: {e}")
+            raise
+        with data:
+            writer.write_member(member, data)
+        logger.debug(f"Adicionado: {member.arcname}")
+
+
+class CodecArchiveCompressor(ZipCompressor):
+    """Compressor que grava os arquivos com um codec do registro.
+
+    Permite trocar DEFLATE/ZIP por formatos mais rápidos ou mais compactos
+    (zstd, xz) em contêineres ZIP ou tar, escolhidos por ARCHIVE_CODEC.
+    """
+
+    def __init__(
+        self, folder: "Path", codec: "ArchiveCodec", level: "int | None" = None
+    ) -> None:
+        """Inicializa o compressor.
+
+        Args:
+            folder: Diretório dos arquivos (e do arquivo gerado)
+            codec: Codec de compactação (ver archive_codecs.py)
+            level: (Opcional) Nível de compressão do codec
+        """
+        super().__init__(folder)
+        self.codec = codec
+        self.level = level
+        self.archive_extension = codec.extension
+
+    def _compress_files(self, zip_path: "Path", extension: str) -> None:
+        files = self._get_files_by_extension(extension)
+        fd, tmp_name = tempfile.mkstemp(dir=zip_path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            self.codec.write(Path(tmp_name), files, self.folder, self.level)
+            os.replace(tmp_name, zip_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        logger.debug(f"{len(files)} arquivo(s) gravado(s) com {self.codec.name}")
+
+
 class ZipCompressorDecorator(ZipCompressorInterface):
     """Classe base para decoradores de compressão.
 
@@ -104,16 +347,39 @@ class LoggingZipCompressor(ZipCompressorDecorator):
 class ValidationZipCompressor(ZipCompressorDecorator):
     """Decorador que valida o nome do arquivo ZIP.
 
+    A extensão esperada é a do codec do compressor decorado (``.zip`` por
+    padrão; ex: ``.tar.xz`` para CodecArchiveCompressor com tar-xz).
+
     Padrão de Projeto:
         Decorator - adiciona validação prévia
     """
 
+    def __init__(
+        self, compressor: ZipCompressorInterface, extension: "str | None" = None
+    ) -> None:
+        """Inicializa com o compressor a ser decorado.
+
+        Args:
+            compressor: Instância de ZipCompressorInterface
+            extension: (Opcional) Extensão exigida; padrão: a do compressor
+        """
+        super().__init__(compressor)
+        self.extension = extension or self._compressor_extension(compressor)
+
+    @staticmethod
+    def _compressor_extension(compressor: ZipCompressorInterface) -> str:
+        """Obtém a extensão do compressor mais interno da cadeia de decorators."""
+        while isinstance(compressor, ZipCompressorDecorator):
+            compressor = compressor._compressor
+        extension = getattr(compressor, "archive_extension", ".zip")
+        return extension if isinstance(extension, str) else ".zip"
+
     def create_zip(self, zip_name: str, file_extension: str) -> None:
-        """Valida se o nome termina com .zip antes de comprimir.
+        """Valida se o nome termina com a extensão do codec antes de comprimir.
 
         Raises:
             ValueError: Se o nome for inválido
         """
-        if not str(zip_name).endswith(".zip"):
-            raise ValueError("O nome do arquivo deve terminar com .zip")
+        if not str(zip_name).endswith(self.extension):
+            raise ValueError(f"O nome do arquivo deve terminar com {self.extension}")
         super().create_zip(zip_name, file_extension)
@@ -0,0 +1,372 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, BinaryIO
+import tempfile
+import zipfile
+import struct
+import time
+import zlib
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Blocos lidos/comprimidos por vez
+CHUNK_SIZE = 1024 * 1024
+# Acima deste tamanho o conteúdo comprimido sai da memória para um temporário
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+ZIP32_LIMIT = 0xFFFFFFFF
+ZIP32_MAX_ENTRIES = 0xFFFF
+UTF8_FLAG = 0x800
+VERSION_DEFAULT = 20
+VERSION_ZIP64 = 45
+CREATE_SYSTEM_UNIX = 3
+
+LOCAL_HEADER = struct.Struct("<IHHHHHIIIHH")
+CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+END_RECORD = struct.Struct("<IHHHHIIH")
+END_RECORD64 = struct.Struct("<IQHHIIQQQQ")
+END_LOCATOR64 = struct.Struct("<IIQI")
+
+
+@dataclass(frozen=True)
+class ZipMember:
+    """Metadados de um membro cujo conteúdo já está comprimido."""
+
+    arcname: str  # Nome dentro do arquivo
+    method: int  # zipfile.ZIP_STORED ou zipfile.ZIP_DEFLATED
+    crc: int  # CRC-32 do conteúdo original
+    file_size: int  # Tamanho original (bytes)
+    compress_size: int  # Tamanho comprimido (bytes)
+    date_time: tuple  # (ano, mês, dia, hora, minuto, segundo)
+    external_attr: int = 0o644 << 16  # Permissões Unix
+
+
+def dos_date_time(mtime: float) -> tuple:
+    """Data de modificação como gravada no ZIP (hora local, segundos pares)."""
+    year, month, day, hour, minute, second = time.localtime(mtime)[:6]
+    return (year, month, day, hour, minute, second - second % 2)
+
+
+def member_from_zipinfo(info: zipfile.ZipInfo) -> ZipMember:
+    """Converte a entrada do diretório central de um ZIP existente."""
+    return ZipMember(
+        arcname=info.filename,
+        method=info.compress_type,
+        crc=info.CRC,
+        file_size=info.file_size,
+        compress_size=info.compress_size,
+        date_time=info.date_time,
+        external_attr=info.external_attr,
+    )
+
+
+def member_data_offset(fileobj: BinaryIO, info: zipfile.ZipInfo) -> int:
+    """Calcula onde começam os dados (comprimidos) de um membro no arquivo.
+
+    Usa o deslocamento do diretório central para localizar o cabeçalho local,
+    cujo tamanho varia com o nome e o campo extra.
+
+    Raises:
+        zipfile.BadZipFile: Se o cabeçalho local for inválido
+    """
+    fileobj.seek(info.header_offset)
+    header = fileobj.read(LOCAL_HEADER.size)
+    if len(header) != LOCAL_HEADER.size or header[:4] != b"PK\x03\x04":
+        raise zipfile.BadZipFile(f"Cabeçalho local inválido: {info.filename}")
+    fields = LOCAL_HEADER.unpack(header)
+    return info.header_offset + LOCAL_HEADER.size + fields[9] + fields[10]
+
+
+def open_raw_member(zip_path: "Path", info: zipfile.ZipInfo) -> BinaryIO:
+    """Abre o fluxo comprimido de um membro sem descomprimi-lo.
+
+    O arquivo é posicionado no início dos dados; são válidos os próximos
+    ``info.compress_size`` bytes.
+
+    Raises:
+        zipfile.BadZipFile: Se o cabeçalho local for inválido
+    """
+    source = open(zip_path, "rb")
+    try:
+        source.seek(member_data_offset(source, info))
+    except BaseException:
+        source.close()
+        raise
+    return source
+
+
+def deflate_file(
+    path: "Path", arcname: str, level: int = zlib.Z_DEFAULT_COMPRESSION
+) -> "tuple[ZipMember, BinaryIO]":
+    """Comprime um arquivo em DEFLATE bruto, calculando o CRC no mesmo passo.
+
+    Pode ser executada em várias threads ao mesmo tempo: zlib libera o GIL
+    durante a compressão.
+
+    Args:
+        path: Arquivo de origem
+        arcname: Nome do membro dentro do ZIP
+        level: Nível de compressão (0-9)
+
+    Returns:
+        (metadados do membro, arquivo temporário posicionado no início com o
+        fluxo comprimido); quem chama deve fechar o temporário
+    """
+    stat = os.stat(path)
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    crc = 0
+    file_size = 0
+    try:
+        with open(path, "rb") as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+                crc = zlib.crc32(chunk, crc)
+                file_size += len(chunk)
+                output.write(compressor.compress(chunk))
+        output.write(compressor.flush())
+        compress_size = output.tell()
+        output.seek(0)
+    except BaseException:
+        output.close()
+        raise
+
+    member = ZipMember(
+        arcname=arcname,
+        method=zipfile.ZIP_DEFLATED,
+        crc=crc,
+        file_size=file_size,
+        compress_size=compress_size,
+        date_time=dos_date_time(stat.st_mtime),
+        external_attr=(stat.st_mode & 0xFFFF) << 16,
+    )
+    return member, output
+
+
+def store_file(path: "Path", arcname: str) -> "tuple[ZipMember, BinaryIO]":
+    """Prepara um arquivo para ser guardado sem compressão (STORED).
+
+    Apenas calcula o CRC; o conteúdo é copiado do próprio arquivo pelo
+    RawZipWriter, sem passar por um temporário.
+
+    Returns:
+        (metadados do membro, arquivo de origem aberto no início); quem
+        chama deve fechá-lo
+    """
+    stat = os.stat(path)
+    crc = 0
+    file_size = 0
+    source = open(path, "rb")
+    try:
+        for chunk in iter(lambda: source.read(CHUNK_SIZE), b""):
+            crc = zlib.crc32(chunk, crc)
+            file_size += len(chunk)
+        source.seek(0)
+    except BaseException:
+        source.close()
+        raise
+
+    member = ZipMember(
+        arcname=arcname,
+        method=zipfile.ZIP_STORED,
+        crc=crc,
+        file_size=file_size,
+        compress_size=file_size,
+        date_time=dos_date_time(stat.st_mtime),
+        external_attr=(stat.st_mode & 0xFFFF) << 16,
+    )
+    return member, source
+
+
+def compress_file(
+    path: "Path",
+    arcname: str,
+    method: int = zipfile.ZIP_DEFLATED,
+    level: "int | None" = None,
+) -> "tuple[ZipMember, BinaryIO]":
+    """Prepara um membro com o método escolhido (STORED ou DEFLATE)."""
+    if method == zipfile.ZIP_STORED:
+        return store_file(path, arcname)
+    if level is None:
+        level = zlib.Z_DEFAULT_COMPRESSION
+    return deflate_file(path, arcname, level)
+
+
+class RawZipWriter:
+    """Escreve um ZIP padrão a partir de membros já comprimidos.
+
+    Diferente de ``zipfile.ZipFile.write``, não comprime nada: recebe o fluxo
+    bruto (DEFLATE ou STORED) com CRC e tamanhos já conhecidos e monta os
+    cabeçalhos locais, o diretório central e o registro final, usando ZIP64
+    quando tamanhos, deslocamentos ou número de membros excedem o formato
+    clássico. O resultado é legível por ``zipfile`` e ferramentas comuns.
+    """
+
+    def __init__(self, fileobj: BinaryIO) -> None:
+        """Inicializa o escritor.
+
+        Args:
+            fileobj: Arquivo binário aberto para escrita, posicionado no início
+        """
+        self.fileobj = fileobj
+        self._entries: list[tuple[ZipMember, int]] = []
+        self._names: set[str] = set()
+
+    def __enter__(self) -> "RawZipWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+
+    @property
+    def members(self) -> list[ZipMember]:
+        """Membros escritos até o momento, na ordem do arquivo."""
+        return [member for member, _ in self._entries]
+
+    def write_member(self, member: ZipMember, data: BinaryIO) -> None:
+        """Acrescenta um membro com seu conteúdo já comprimido.
+
+        Args:
+            member: Metadados (CRC e tamanhos devem corresponder a ``data``)
+            data: Fluxo comprimido; são copiados ``compress_size`` bytes
+
+        Raises:
+            ValueError: Se o nome já existir no arquivo ou se ``data`` terminar
+                        antes de ``compress_size`` bytes
+        """
+        if member.arcname in self._names:
+            raise ValueError(f"Membro duplicado no ZIP: {member.arcname}")
+        offset = self.fileobj.tell()
+        self.fileobj.write(self._local_header(member))
+        copied = self._copy(data, member.compress_size)
+        if copied != member.compress_size:
+            raise ValueError(
+                f"Conteúdo de {member.arcname} mudou durante a compactação"
+            )
+        self._entries.append((member, offset))
+        self._names.add(member.arcname)
+
+    def close(self) -> None:
+        """Escreve o diretório central e o registro final."""
+        start = self.fileobj.tell()
+        for member, offset in self._entries:
+            self.fileobj.write(self._central_header(member, offset))
+        end = self.fileobj.tell()
+        self._write_end_record(start, end - start)
+        self.fileobj.flush()
+
+    def _copy(self, data: BinaryIO, size: int) -> int:
+        """Copia até ``size`` bytes de ``data`` e retorna quantos foram copiados."""
+        copied = 0
+        while copied < size:
+            chunk = data.read(min(CHUNK_SIZE, size - copied))
+            if not chunk:
+                break
+            self.fileobj.write(chunk)
+            copied += len(chunk)
+        return copied
+
+    @staticmethod
+    def _encode_name(member: ZipMember) -> tuple[bytes, int]:
+        try:
+            return member.arcname.encode("ascii"), 0
+        except UnicodeEncodeError:
+            return member.arcname.encode("utf-8"), UTF8_FLAG
+
+    @staticmethod
+    def _pack_date_time(date_time: tuple) -> tuple[int, int]:
+        year, month, day, hour, minute, second = date_time
+        year = min(max(year, 1980), 2107)
+        dos_date = (year - 1980) << 9 | month << 5 | day
+        dos_time = hour << 11 | minute << 5 | second // 2
+        return dos_date, dos_time
+
+    def _local_header(self, member: ZipMember) -> bytes:
+        name, flags = self._encode_name(member)
+        dos_date, dos_time = self._pack_date_time(member.date_time)
+        zip64 = max(member.file_size, member.compress_size) >= ZIP32_LIMIT
+        extra = b""
+        file_size, compress_size = member.file_size, member.compress_size
+        if zip64:
+            extra = struct.pack("<HHQQ", 1, 16, file_size, compress_size)
+            file_size = compress_size = ZIP32_LIMIT
+        header = LOCAL_HEADER.pack(
+            0x04034B50,
+            VERSION_ZIP64 if zip64 else VERSION_DEFAULT,
+            flags,
+            member.method,
+            dos_time,
+            dos_date,
+            member.crc,
+            compress_size,
+            file_size,
+            len(name),
+            len(extra),
+        )
+        return header + name + extra
+
+    def _central_header(self, member: ZipMember, offset: int) -> bytes:
+        name, flags = self._encode_name(member)
+        dos_date, dos_time = self._pack_date_time(member.date_time)
+        fields = []
+        file_size, compress_size = member.file_size, member.compress_size
+        if file_size >= ZIP32_LIMIT:
+            fields.append(file_size)
+            file_size = ZIP32_LIMIT
+        if compress_size >= ZIP32_LIMIT:
+            fields.append(compress_size)
+            compress_size = ZIP32_LIMIT
+        if offset >= ZIP32_LIMIT:
+            fields.append(offset)
+            offset = ZIP32_LIMIT
+        extra = b""
+        if fields:
+            extra = struct.pack(f"<HH{len(fields)}Q", 1, 8 * len(fields), *fields)
+        version = VERSION_ZIP64 if fields else VERSION_DEFAULT
+        header = CENTRAL_HEADER.pack(
+            0x02014B50,
+            CREATE_SYSTEM_UNIX << 8 | version,
+            version,
+            flags,
+            member.method,
+            dos_time,
+            dos_date,
+            member.crc,
+            compress_size,
+            file_size,
+            len(name),
+            len(extra),
+            0,
+            0,
+            0,
+            member.external_attr,
+            offset,
+        )
+        return header + name + extra
+
+    def _write_end_record(self, start: int, size: int) -> None:
+        count = len(self._entries)
+        if count > ZIP32_MAX_ENTRIES or start >= ZIP32_LIMIT or size >= ZIP32_LIMIT:
+            end64 = self.fileobj.tell()
+            self.fileobj.write(
+                END_RECORD64.pack(
+                    0x06064B50,
+                    END_RECORD64.size - 12,
+                    CREATE_SYSTEM_UNIX << 8 | VERSION_ZIP64,
+                    VERSION_ZIP64,
+                    0,
+                    0,
+                    count,
+                    count,
+                    size,
+                    start,
+                )
+            )
+            self.fileobj.write(END_LOCATOR64.pack(0x07064B50, 0, end64, 1))
+            count = min(count, ZIP32_MAX_ENTRIES)
+            start = min(start, ZIP32_LIMIT)
+            size = min(size, ZIP32_LIMIT)
+        self.fileobj.write(
+            END_RECORD.pack(0x06054B50, 0, 0, count, count, size, start, 0)
+        )
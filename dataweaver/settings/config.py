@@ -1,4 +1,9 @@
-from dataweaver.utils import ensure_directory_exists, get_env_variable
+from dataweaver.utils import (
+    ensure_directory_exists,
+    get_env_variable,
+    get_env_flag,
+    get_env_list,
+)
 
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,6 +17,7 @@ class DirectoryConfig:
     root: Path  # Diretório raiz do projeto
     tests: Path  # Pasta de testes
     logs: Path  # Pasta de arquivos de log
+    cache: Path  # Pasta de caches persistentes entre execuções
 
     # SCRAPER
     pdfs: Path  # Pasta para armazenar PDFs
@@ -30,6 +36,7 @@ class DirectoryConfig:
             root=root,
             tests=root / "dataweaver" / "scraper" / "tests",
             logs=root / "dataweaver" / "logs",
+            cache=root / "dataweaver" / "cache",
             # SCRAPER
             pdfs=root / "dataweaver" / "scraper" / "pdfs",
             modules_scraper=root / "dataweaver" / "scraper" / "modules",
@@ -66,17 +73,106 @@ class ScraperConfig:
     zip_name: str  # Nome do arquivo ZIP para compactação
     filter: str  # Filtro para busca de documentos
     url: str  # URL base para scraping
+    urls: list[str]  # Páginas iniciais do crawl (URLS; padrão: [url])
+    crawl_depth: int  # Níveis de links seguidos a partir de cada página (0 = nenhum)
+    crawl_follow: str  # Regex dos links a seguir (vazio = sub-páginas da inicial)
+    crawl_per_host: int  # Páginas buscadas simultaneamente por host
+    max_workers: int  # Número de downloads simultâneos (1 = sequencial)
+    use_async: bool  # Usa a pilha assíncrona (asyncio/aiohttp)
+    html_parser: str  # Backend do BeautifulSoup: auto, lxml ou html.parser
+    parse_only: bool  # Monta apenas as tags usadas pelas estratégias de extração
+    streaming: bool  # Inicia downloads enquanto a página ainda é recebida
+    store_enabled: bool  # Guarda os PDFs por conteúdo entre execuções
+    store_max_mb: int  # Orçamento do armazenamento de PDFs (MB; 0 = sem limite)
 
     @classmethod
     def create(cls) -> "ScraperConfig":
         """Método factory para criação da configuração do scraper"""
+        url = get_env_variable(
+            "URL",
+            "https://www.gov.br/ans/pt-br/acesso-a-informacao/participacao-da-sociedade/atualizacao-do-rol-de-procedimentos",
+        )
         return cls(
             zip_name=get_env_variable("PDF_ZIP_NAME", "pdfs_compactados.zip"),
             filter=get_env_variable("FILTER", "ANEXO"),
-            url=get_env_variable(
-                "URL",
-                "https://www.gov.br/ans/pt-br/acesso-a-informacao/participacao-da-sociedade/atualizacao-do-rol-de-procedimentos",
-            ),
+            url=url,
+            urls=get_env_list("URLS", [url]),
+            crawl_depth=int(get_env_variable("CRAWL_DEPTH", "0")),
+            crawl_follow=get_env_variable("CRAWL_FOLLOW", ""),
+            crawl_per_host=int(get_env_variable("CRAWL_PER_HOST", "2")),
+            max_workers=int(get_env_variable("MAX_WORKERS", "4")),
+            use_async=get_env_flag("SCRAPER_ASYNC", False),
+            html_parser=get_env_variable("HTML_PARSER", "auto"),
+            parse_only=get_env_flag("HTML_PARSE_ONLY", True),
+            streaming=get_env_flag("SCRAPER_STREAMING", False),
+            store_enabled=get_env_flag("PDF_STORE", True),
+            store_max_mb=int(get_env_variable("PDF_STORE_MAX_MB", "500")),
+        )
+
+
+@dataclass
+class HttpConfig:
+    """Configuração da sessão HTTP compartilhada pelo scraper"""
+
+    pool_size: int  # Conexões mantidas por host no pool
+    connect_timeout: float  # Timeout de conexão (segundos)
+    read_timeout: float  # Timeout de leitura entre blocos (segundos)
+    keep_alive: bool  # Reutiliza conexões entre requisições
+    cache_enabled: bool  # Usa GET condicional (ETag/Last-Modified) entre execuções
+    download_attempts: int  # Tentativas por arquivo (retomando downloads parciais)
+    max_retries: int  # Novas tentativas em 429/5xx e falhas de conexão
+    backoff_base: float  # Intervalo base do backoff exponencial (segundos)
+    backoff_max: float  # Intervalo máximo entre tentativas (segundos)
+    adaptive_concurrency: bool  # Ajusta as requisições simultâneas por AIMD
+    latency_target: float  # Latência (s) que reduz a concorrência (0 = ignorar)
+
+    @classmethod
+    def create(cls) -> "HttpConfig":
+        """Método factory para criação da configuração HTTP"""
+        return cls(
+            pool_size=int(get_env_variable("HTTP_POOL_SIZE", "10")),
+            connect_timeout=float(get_env_variable("HTTP_CONNECT_TIMEOUT", "5")),
+            read_timeout=float(get_env_variable("HTTP_READ_TIMEOUT", "30")),
+            keep_alive=get_env_flag("HTTP_KEEP_ALIVE", True),
+            cache_enabled=get_env_flag("HTTP_CACHE", True),
+            download_attempts=int(get_env_variable("HTTP_DOWNLOAD_ATTEMPTS", "3")),
+            max_retries=int(get_env_variable("HTTP_MAX_RETRIES", "3")),
+            backoff_base=float(get_env_variable("HTTP_BACKOFF_BASE", "0.5")),
+            backoff_max=float(get_env_variable("HTTP_BACKOFF_MAX", "60")),
+            adaptive_concurrency=get_env_flag("HTTP_ADAPTIVE_CONCURRENCY", True),
+            latency_target=float(get_env_variable("HTTP_LATENCY_TARGET", "0")),
+        )
+
+
+@dataclass
+class ArchiveConfig:
+    """Configuração da geração dos arquivos compactados (PDFs e CSVs)"""
+
+    codec: str  # Formato do arquivo de PDFs (zip-deflate, zip-zstd, tar-xz, ...)
+    workers: int  # Threads de compressão (0 = número de CPUs; 1 = sequencial)
+    level: int  # Nível de compressão DEFLATE (0-9)
+    policy_enabled: bool  # Escolhe STORED/DEFLATE por arquivo a partir de amostras
+    store_threshold: float  # Razão estimada a partir da qual não comprime
+    sample_kb: int  # Tamanho de cada bloco amostrado (KB)
+    incremental: bool  # Reaproveita membros inalterados do ZIP existente
+    streaming: bool  # Compacta cada PDF assim que o download termina
+    keep_files: list[
+        str
+    ]  # PDFs mantidos soltos no modo streaming (além de TARGET_FILE)
+
+    @classmethod
+    def create(cls) -> "ArchiveConfig":
+        """Método factory para criação da configuração de compactação"""
+        return cls(
+            codec=get_env_variable("ARCHIVE_CODEC", "zip-deflate"),
+            workers=int(get_env_variable("ZIP_WORKERS", "0")),
+            level=int(get_env_variable("ZIP_LEVEL", "6")),
+            policy_enabled=get_env_flag("ZIP_POLICY", True),
+            store_threshold=float(get_env_variable("ZIP_STORE_THRESHOLD", "0.9")),
+            sample_kb=int(get_env_variable("ZIP_SAMPLE_KB", "64")),
+            incremental=get_env_flag("ZIP_INCREMENTAL", True),
+            streaming=get_env_flag("ZIP_STREAMING", False),
+            keep_files=get_env_list("ZIP_KEEP_FILES", []),
         )
 
 
@@ -86,6 +182,19 @@ class DataConfig:
 
     zip_name: str  # Nome do arquivo ZIP para compactação
     target_file: str  # Nome do arqvuios pdf para extração de tabelas
+    extract_pages: str  # Páginas extraídas (ex: 3-181; auto = varredura das tabelas)
+    page_scan_min_rulings: int  # Linhas mínimas para a varredura considerar tabela
+    extract_workers: int  # Processos da extração por blocos (0 = número de CPUs)
+    extract_chunk_pages: int  # Páginas por bloco da extração (0 = automático)
+    streaming: bool  # Extrai, processa e grava o CSV bloco a bloco (memória limitada)
+    checkpoint_enabled: bool  # Grava cada bloco extraído e retoma após interrupções
+    cache_enabled: bool  # Reaproveita tabelas já extraídas do mesmo PDF/opções
+    cache_max_mb: int  # Espaço máximo do cache de extração (MB; 0 = sem limite)
+    worker_enabled: bool  # Envia as extrações ao serviço com a JVM aquecida
+    worker_address: str  # host:porta ou socket Unix do serviço (vazio = cache)
+    worker_key: str  # Chave das conexões com o serviço (vazia = gerada no cache)
+    worker_max_jobs: int  # Extrações por processo antes de reciclar (0 = sem limite)
+    worker_max_memory_mb: int  # Memória que provoca a reciclagem (MB; 0 = sem limite)
 
     @classmethod
     def create(cls) -> "DataConfig":
@@ -95,6 +204,19 @@ class DataConfig:
             target_file=get_env_variable(
                 "TARGET_FILE", "copy3_of_Anexo_I_Rol_2021RN_465.2021_RN627L.2024.pdf"
             ),
+            extract_pages=get_env_variable("EXTRACT_PAGES", "auto"),
+            page_scan_min_rulings=int(get_env_variable("PAGE_SCAN_MIN_RULINGS", "8")),
+            extract_workers=int(get_env_variable("EXTRACT_WORKERS", "0")),
+            extract_chunk_pages=int(get_env_variable("EXTRACT_CHUNK_PAGES", "0")),
+            streaming=get_env_flag("EXTRACT_STREAMING", False),
+            checkpoint_enabled=get_env_flag("EXTRACT_CHECKPOINT", True),
+            cache_enabled=get_env_flag("EXTRACT_CACHE", True),
+            cache_max_mb=int(get_env_variable("EXTRACT_CACHE_MAX_MB", "200")),
+            worker_enabled=get_env_flag("TABULA_WORKER", False),
+            worker_address=get_env_variable("TABULA_WORKER_ADDRESS", ""),
+            worker_key=get_env_variable("TABULA_WORKER_KEY", ""),
+            worker_max_jobs=int(get_env_variable("TABULA_WORKER_MAX_JOBS", "50")),
+            worker_max_memory_mb=int(get_env_variable("TABULA_WORKER_MAX_MB", "1024")),
         )
 
 
@@ -116,8 +238,11 @@ class AppConfig:
         ensure_directory_exists(self.dirs.pdfs)  # Cria diretórios necessários
         ensure_directory_exists(self.dirs.csv)  # Cria diretórios necessários
         ensure_directory_exists(self.dirs.logs)
+        ensure_directory_exists(self.dirs.cache)
         self.logging = LoggingConfig.create(self.dirs.logs)  # Configuração de logs
         self.scraper = ScraperConfig.create()  # Configuração do scraper
+        self.http = HttpConfig.create()  # Configuração da sessão HTTP
+        self.archive = ArchiveConfig.create()  # Configuração da compactação
         self.data = DataConfig.create()  # Configuração do data
         # Caminho completo para o arquivo ZIP dos PDFs e CSVs
         self.pdf_zip_file = self.dirs.root / "scraper" / "pdfs" / "pdfs_compactados.zip"
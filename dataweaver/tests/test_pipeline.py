@@ -1,7 +1,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
+import dataclasses
+import zipfile
 
 from dataweaver.pipeline import PDFProcessor, CSVExtractor, CleanupManager
+from dataweaver.data.modules import ArchiveMember
+from dataweaver.settings import config
 
 
 def test_pdf_processor_run_executes_process():
@@ -15,7 +19,21 @@ def test_pdf_processor_run_executes_process():
 
         mock_factory.assert_called_once()
         mock_factory.return_value.create_service.assert_called_once()
-        mock_service.process.assert_called_once_with(processor.url)
+        mock_service.process.assert_called_once_with(processor.urls[0])
+
+
+def test_pdf_processor_run_processes_many_urls():
+    """Garante que várias URLs configuradas são processadas em uma única execução."""
+    with patch("dataweaver.pipeline.DefaultPDFServiceFactory") as mock_factory:
+        mock_service = MagicMock()
+        mock_factory.return_value.create_service.return_value = mock_service
+
+        processor = PDFProcessor()
+        processor.urls = ["http://a.com/1", "http://a.com/2"]
+        processor.run()
+
+        mock_service.process_many.assert_called_once_with(processor.urls)
+        mock_service.process.assert_not_called()
 
 
 def test_csv_extractor_requires_pdf_file():
@@ -39,11 +57,71 @@ def test_csv_extractor_run_executes_extraction(tmp_path):
         mock_extractor.return_value.run.assert_called_once()
 
 
+def test_csv_extractor_reads_pdf_from_zip(tmp_path):
+    """Testa que, sem o PDF solto, o CSVExtractor usa o membro do ZIP."""
+    dirs = dataclasses.replace(config.dirs, pdfs=tmp_path, cache=tmp_path)
+    with zipfile.ZipFile(tmp_path / config.scraper.zip_name, "w") as zf:
+        zf.writestr("documento.pdf", b"%PDF-1.7")
+
+    with patch.object(config, "dirs", dirs), patch(
+        "dataweaver.pipeline.TableExtractor"
+    ) as mock_extractor:
+        extractor = CSVExtractor()
+        extractor.csv_dir = tmp_path
+        extractor.set_pdf_file("documento.pdf")
+        assert isinstance(extractor.pdf_file, ArchiveMember)
+
+        extractor.pdf_file.path()  # simula a leitura pelo tabula
+        extractor.run()
+
+    mock_extractor.return_value.run.assert_called_once()
+    assert not extractor.pdf_file.spilled
+
+
 def test_cleanup_manager_run_removes_pdfs():
-    """Garante que CleanupManager chama corretamente a remoção de PDFs."""
+    """Garante que, sem o armazenamento, CleanupManager remove todos os PDFs."""
     with patch("dataweaver.pipeline.PDFRemove") as mock_pdf_remove:
         manager = CleanupManager()
+        manager.store_enabled = False
         manager.run()
 
         mock_pdf_remove.assert_called_once_with(manager.pdfs_dir)
         mock_pdf_remove.return_value.remove_pdfs.assert_called_once()
+
+
+def test_cleanup_manager_run_evicts_store():
+    """Garante que, com o armazenamento, CleanupManager aplica o limite de espaço."""
+    with patch("dataweaver.pipeline.PDFStore") as mock_store, patch(
+        "dataweaver.pipeline.PDFRemove"
+    ) as mock_pdf_remove:
+        mock_store.return_value.evict.return_value = ["abc"]
+        mock_store.return_value.total_size = 0
+        manager = CleanupManager()
+        manager.store_enabled = True
+        manager.run()
+
+        mock_store.assert_called_once_with(
+            manager.store_dir, manager.pdfs_dir, manager.store_max_bytes
+        )
+        mock_store.return_value.sync.assert_called_once()
+        mock_store.return_value.evict.assert_called_once()
+        mock_store.return_value.clear_folder.assert_called_once()
+        mock_pdf_remove.assert_not_called()
+
+
+def test_csv_extractor_warns_when_codec_is_not_zip(tmp_path):
+    """Testa que um ARCHIVE_CODEC tar-* é informado em vez de ignorado."""
+    dirs = dataclasses.replace(config.dirs, pdfs=tmp_path, cache=tmp_path)
+    archive = dataclasses.replace(config.archive, codec="tar-xz")
+
+    with patch.object(config, "dirs", dirs), patch.object(
+        config, "archive", archive
+    ), patch("dataweaver.pipeline.logger") as mock_logger:
+        extractor = CSVExtractor()
+        extractor.csv_dir = tmp_path
+        extractor.set_pdf_file("documento.pdf")
+
+    assert extractor.pdf_file == tmp_path / "documento.pdf"
+    message = mock_logger.warning.call_args.args[0]
+    expected = config.scraper.zip_name.replace(".zip", ".tar.xz")
+    assert expected in message and "tar-xz" in message
@@ -0,0 +1,78 @@
+from dataweaver.data.modules import ArchiveMember, PdfExtractor
+
+import pytest
+from unittest.mock import patch
+import zipfile
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """ZIP com um membro STORED e um DEFLATED"""
+    path = tmp_path / "pdfs.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("stored.pdf", b"%PDF-stored" * 100, zipfile.ZIP_STORED)
+        zf.writestr("deflated.pdf", b"%PDF-deflated" * 100, zipfile.ZIP_DEFLATED)
+    return path
+
+
+def test_contains(archive, tmp_path):
+    """Testa a busca do membro pelo diretório central"""
+    assert ArchiveMember.contains(archive, "stored.pdf")
+    assert not ArchiveMember.contains(archive, "outro.pdf")
+    assert not ArchiveMember.contains(tmp_path / "inexistente.zip", "stored.pdf")
+
+
+def test_stored_member_is_mapped_without_spill(archive):
+    """Testa que membros STORED são lidos do próprio ZIP, sem temporário"""
+    with ArchiveMember(archive, "stored.pdf") as member:
+        assert member.stored
+        assert bytes(member.buffer()) == b"%PDF-stored" * 100
+        assert not member.spilled
+
+
+def test_deflated_member_is_spilled(archive, tmp_path):
+    """Testa que membros comprimidos são descomprimidos para um temporário"""
+    spill_dir = tmp_path / "spill"
+    spill_dir.mkdir()
+    member = ArchiveMember(archive, "deflated.pdf", spill_dir)
+
+    assert not member.stored
+    assert bytes(member.buffer()) == b"%PDF-deflated" * 100
+    assert member.spilled
+    assert len(list(spill_dir.iterdir())) == 1
+
+    member.close()
+    assert list(spill_dir.iterdir()) == []
+
+
+def test_path_spills_once_and_close_removes(archive):
+    """Testa que path() cria um único temporário, removido em close()"""
+    member = ArchiveMember(archive, "stored.pdf")
+    path = member.path()
+
+    assert path.suffix == ".pdf"
+    assert path.read_bytes() == b"%PDF-stored" * 100
+    assert member.path() == path
+
+    member.close()
+    assert not path.exists()
+    # Reutilizável após close()
+    assert member.path().read_bytes() == b"%PDF-stored" * 100
+    member.close()
+
+
+def test_missing_member_raises(archive):
+    """Testa erro ao acessar membro inexistente"""
+    with pytest.raises(KeyError):
+        ArchiveMember(archive, "outro.pdf").buffer()
+
+
+def test_pdf_extractor_reads_archive_member(archive):
+    """Testa que o tabula recebe o caminho temporário do membro"""
+    member = ArchiveMember(archive, "deflated.pdf")
+    with patch("tabula.read_pdf", return_value=[]) as mock_tabula:
+        PdfExtractor(member).extract_tables(pages="1")
+
+    pdf_arg = mock_tabula.call_args.args[0]
+    assert pdf_arg == str(member.path())
+    member.close()
@@ -73,3 +73,46 @@ def test_save_csv_overwrite_existing(tmp_path, sample_dataframe):
     # Verifica se o conteúdo foi sobrescrito corretamente
     saved_data = pd.read_csv(csv_path)
     pd.testing.assert_frame_equal(saved_data, sample_dataframe)
+
+
+def test_save_csv_chunks_appends_with_single_header(tmp_path):
+    """Testa a gravação incremental com um único cabeçalho"""
+    csv_path = tmp_path / "output.csv"
+    chunks = [
+        pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}),
+        pd.DataFrame({"col2": ["c"], "col1": [3]}),
+    ]
+
+    rows = CsvSaver(csv_path).save_csv_chunks(iter(chunks))
+
+    assert rows == 3
+    saved_data = pd.read_csv(csv_path)
+    expected = pd.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    pd.testing.assert_frame_equal(saved_data, expected)
+    assert not (tmp_path / "output.csv.tmp").exists()
+
+
+def test_save_csv_chunks_keeps_columns_of_later_chunks(tmp_path):
+    """Testa que colunas novas em blocos seguintes geram o mesmo CSV do pd.concat"""
+    chunks = [
+        pd.DataFrame({"col1": [1, 2], "col2": ["a, b", "linha\nquebrada"]}),
+        pd.DataFrame({"col2": ["c"], "col1": [3], "extra": ["x"]}),
+        pd.DataFrame({"novo": ["y"]}),
+    ]
+    streamed = tmp_path / "streamed.csv"
+    concatenated = tmp_path / "concatenated.csv"
+
+    assert CsvSaver(streamed).save_csv_chunks(iter(chunks)) == 4
+    CsvSaver(concatenated).save_csv(pd.concat(chunks, axis=0))
+
+    pd.testing.assert_frame_equal(pd.read_csv(streamed), pd.read_csv(concatenated))
+    assert list(pd.read_csv(streamed).columns) == ["col1", "col2", "extra", "novo"]
+
+
+def test_save_csv_chunks_without_chunks_keeps_file(tmp_path):
+    """Testa que nenhum bloco não altera o CSV existente"""
+    csv_path = tmp_path / "output.csv"
+    csv_path.write_text("old content")
+
+    assert CsvSaver(csv_path).save_csv_chunks(iter([])) == 0
+    assert csv_path.read_text() == "old content"
@@ -84,3 +84,88 @@ def test_process_data_with_nan_values():
 
     result = processor.process_data(tables)
     assert result["A"].isna().sum() == 1
+
+
+def test_process_chunks_yields_one_frame_per_chunk(sample_tables):
+    """Testa o processamento em streaming, ignorando blocos vazios"""
+    processor = DataProcessor(abbreviation_dict={})
+    chunks = iter([sample_tables[:1], [pd.DataFrame()], sample_tables[1:]])
+
+    result = list(processor.process_chunks(chunks))
+
+    assert len(result) == 2
+    pd.testing.assert_frame_equal(result[1], sample_tables[1])
+
+
+ABBREVIATIONS = {"OD": "Seg. Odontológica", "AMB": "Seg. Ambulatorial"}
+
+
+def test_process_data_expands_abbreviations_and_compacts_dtypes():
+    """Testa a expansão das abreviações e a conversão para tipos compactos"""
+    tables = [
+        pd.DataFrame(
+            {
+                "PROCEDIMENTO": ["CONSULTA A", "EXAME B"],
+                "OD": ["OD", np.nan],
+                "AMB": [np.nan, "AMB"],
+                "SEGMENTO": ["OD ", "AMB"],
+            }
+        ),
+        pd.DataFrame(
+            {
+                "PROCEDIMENTO": ["TERAPIA C", "CIRURGIA D"],
+                "OD": [np.nan, ""],
+                "AMB": ["AMB", "AMB"],
+                "SEGMENTO": ["AMB", "AMB"],
+            }
+        ),
+    ]
+    processor = DataProcessor(abbreviation_dict=ABBREVIATIONS)
+
+    result = processor.process_data(tables)
+
+    assert list(result.columns) == [
+        "PROCEDIMENTO",
+        "Seg. Odontológica",
+        "Seg. Ambulatorial",
+        "SEGMENTO",
+    ]
+    # Colunas-marcador mantêm os valores publicados (marcador ou vazio)
+    assert result["Seg. Odontológica"].dtype == "category"
+    assert result["Seg. Odontológica"].tolist()[0] == "OD"
+    assert result["Seg. Odontológica"].iloc[1:].isna().all()
+    assert result["Seg. Ambulatorial"].dtype == "category"
+    assert result["Seg. Ambulatorial"].tolist()[1:] == ["AMB", "AMB", "AMB"]
+    assert result["SEGMENTO"].dtype == "category"
+    assert result["SEGMENTO"].tolist() == [
+        "Seg. Odontológica",
+        "Seg. Ambulatorial",
+        "Seg. Ambulatorial",
+        "Seg. Ambulatorial",
+    ]
+    assert result["PROCEDIMENTO"].dtype == "string"
+
+
+def test_process_chunks_keeps_dtypes_of_first_chunk():
+    """Testa que a mesma coluna tem o mesmo tipo em todos os blocos"""
+    chunks = [
+        [pd.DataFrame({"SEGMENTO": ["OD", "OD", "OD", "AMB"]})],
+        [pd.DataFrame({"SEGMENTO": ["OD", "AMB"]})],
+    ]
+    processor = DataProcessor(abbreviation_dict=ABBREVIATIONS)
+
+    first, second = processor.process_chunks(iter(chunks))
+
+    assert first["SEGMENTO"].dtype == "category"
+    assert second["SEGMENTO"].dtype == "category"
+    assert second["SEGMENTO"].tolist() == ["Seg. Odontológica", "Seg. Ambulatorial"]
+
+
+def test_normalize_keeps_non_text_columns(sample_tables):
+    """Testa que colunas numéricas e de tipos mistos não são alteradas"""
+    mixed = pd.DataFrame({"A": [1, "OD"], "B": [1.5, 2.5]})
+    processor = DataProcessor(abbreviation_dict=ABBREVIATIONS)
+
+    result = processor.normalize(mixed)
+
+    pd.testing.assert_frame_equal(result, mixed)
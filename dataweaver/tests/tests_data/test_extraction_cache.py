@@ -0,0 +1,152 @@
+from dataweaver.data.modules import (
+    ExtractionCache,
+    CachedPdfExtractor,
+    PdfExtractor,
+    ArchiveMember,
+)
+
+from unittest.mock import MagicMock, patch
+import pandas as pd
+import zipfile
+import os
+
+OPTIONS = {"lattice": True, "multiple_tables": True}
+
+
+def tables():
+    return [
+        pd.DataFrame({"PROCEDIMENTO": ["A", "B"], "OD": ["OD", ""]}),
+        pd.DataFrame({"PROCEDIMENTO": ["C"], "OD": [""]}),
+    ]
+
+
+def test_key_depends_on_content_pages_and_options():
+    """Testa a composição da chave"""
+    key = ExtractionCache.key("abc", "3-181", OPTIONS)
+
+    assert key == ExtractionCache.key("abc", "3-100,101-181", OPTIONS)
+    assert key != ExtractionCache.key("abd", "3-181", OPTIONS)
+    assert key != ExtractionCache.key("abc", "3-180", OPTIONS)
+    assert key != ExtractionCache.key("abc", "3-181", {**OPTIONS, "lattice": False})
+
+
+def test_put_and_get_roundtrip(tmp_path):
+    """Testa a gravação e a leitura das tabelas"""
+    cache = ExtractionCache(tmp_path)
+    cache.put("chave", tables())
+
+    result = cache.get("chave")
+
+    assert len(result) == 2
+    pd.testing.assert_frame_equal(result[0], tables()[0])
+    assert cache.get("outra") is None
+
+
+def test_corrupted_entry_is_discarded(tmp_path):
+    """Testa que uma entrada ilegível é removida"""
+    cache = ExtractionCache(tmp_path)
+    cache.put("chave", tables())
+    for path in (tmp_path / "chave").iterdir():
+        path.write_bytes(b"corrompido")
+
+    assert cache.get("chave") is None
+    assert not (tmp_path / "chave").exists()
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """Testa o despejo LRU pelo espaço ocupado"""
+    cache = ExtractionCache(tmp_path)
+    for i, key in enumerate(["a", "b", "c"]):
+        cache.put(key, tables())
+        os.utime(tmp_path / key, (1000 + i, 1000 + i))
+    cache.get("a")  # "a" passa a ser a mais recente
+    size = sum(p.stat().st_size for p in (tmp_path / "a").iterdir())
+
+    removed = cache.evict(max_bytes=size * 2)
+
+    assert removed == ["b"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a", "c"]
+
+
+def test_cached_extractor_skips_tabula_on_hit(tmp_path):
+    """Testa que o segundo acesso não chama o tabula"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7 conteudo")
+    extractor = CachedPdfExtractor(PdfExtractor(pdf), ExtractionCache(tmp_path / "c"))
+
+    with patch("tabula.read_pdf", return_value=tables()) as mock_tabula:
+        first = extractor.extract_tables(pages="3-5")
+        second = extractor.extract_tables(pages="3-5")
+
+    mock_tabula.assert_called_once()
+    assert len(first) == len(second) == 2
+
+
+def test_cached_extractor_does_not_store_empty_result(tmp_path):
+    """Testa que extrações vazias não são guardadas"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    inner = MagicMock(pdf_path=pdf)
+    inner.extract_tables.return_value = []
+    cache = ExtractionCache(tmp_path / "c")
+
+    CachedPdfExtractor(inner, cache).extract_tables(pages="1")
+
+    assert not (tmp_path / "c").exists()
+
+
+def test_archive_member_hashed_without_spill(tmp_path):
+    """Testa o acerto no cache para um PDF dentro do ZIP, sem cópia temporária"""
+    archive = tmp_path / "pdfs.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("anexo.pdf", b"%PDF-1.7 conteudo")
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7 conteudo")
+    cache = ExtractionCache(tmp_path / "c")
+    with patch("tabula.read_pdf", return_value=tables()):
+        CachedPdfExtractor(PdfExtractor(pdf), cache).extract_tables(pages="1")
+
+    with ArchiveMember(archive, "anexo.pdf") as member:
+        with patch("tabula.read_pdf") as mock_tabula:
+            result = CachedPdfExtractor(PdfExtractor(member), cache).extract_tables(
+                pages="1"
+            )
+        assert not member.spilled
+    mock_tabula.assert_not_called()
+    assert len(result) == 2
+
+
+def test_cached_extractor_streams_and_stores(tmp_path):
+    """Testa o streaming: grava os blocos na falta e os lê no acerto"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7 conteudo")
+    inner = MagicMock(pdf_path=pdf)
+    inner.iter_tables.return_value = iter([tables()[:1], tables()[1:]])
+    extractor = CachedPdfExtractor(inner, ExtractionCache(tmp_path / "c"))
+
+    first = list(extractor.iter_tables(pages="1-2"))
+    second = list(extractor.iter_tables(pages="1-2"))
+
+    inner.iter_tables.assert_called_once()
+    assert len(first) == len(second) == 2
+    pd.testing.assert_frame_equal(second[1][0], tables()[1])
+
+
+def test_cached_extractor_streams_around_corrupted_entry(tmp_path):
+    """Testa que uma tabela ilegível no meio do acerto refaz a extração"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7 conteudo")
+    inner = MagicMock(pdf_path=pdf)
+    inner.iter_tables.side_effect = lambda pages: iter([tables()])
+    cache = ExtractionCache(tmp_path / "c")
+    extractor = CachedPdfExtractor(inner, cache)
+    list(extractor.iter_tables(pages="1-2"))
+    (entry,) = (tmp_path / "c").iterdir()
+    sorted(entry.iterdir())[1].write_bytes(b"corrompido")
+
+    result = [table for chunk in extractor.iter_tables(pages="1-2") for table in chunk]
+
+    assert inner.iter_tables.call_count == 2
+    assert len(result) == 2  # A primeira do cache, a segunda extraída de novo
+    pd.testing.assert_frame_equal(result[1], tables()[1])
+    assert len(cache.get(entry.name)) == 2  # Entrada regravada
@@ -0,0 +1,213 @@
+from dataweaver.data.modules import (
+    ExtractionWorker,
+    ExtractionServer,
+    ExtractionClient,
+    PdfExtractor,
+)
+from dataweaver.data.modules.extraction_worker import (
+    parse_address,
+    worker_address,
+    worker_authkey,
+)
+from dataweaver.errors import ExtractionError
+from dataweaver.settings import config
+
+import pytest
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+from multiprocessing.connection import Client
+import dataclasses
+import threading
+import time
+import stat
+import os
+
+
+def fake_extract(pdf_path, pages):
+    """Tarefa executada no processo trabalhador (substitui o tabula)"""
+    if pages == "falha":
+        raise RuntimeError("PDF inválido")
+    if pages == "lento":
+        time.sleep(0.3)
+    return {"pdf": pdf_path, "pages": pages, "pid": os.getpid()}
+
+
+@pytest.fixture
+def worker():
+    worker = ExtractionWorker(max_jobs=2, handler=fake_extract)
+    yield worker
+    worker.close()
+
+
+def test_worker_runs_jobs_in_child_process(worker):
+    """Testa que as tarefas rodam em outro processo, reaproveitado entre elas"""
+    first = worker.submit("a.pdf", "1")
+
+    assert first["pdf"] == "a.pdf"
+    assert first["pid"] != os.getpid()
+    assert worker.pid == first["pid"]
+
+
+def test_worker_recycled_after_max_jobs(worker):
+    """Testa a reciclagem do processo após max_jobs tarefas"""
+    first = worker.submit("a.pdf", "1")
+    second = worker.submit("a.pdf", "2")
+    third = worker.submit("a.pdf", "3")
+
+    assert first["pid"] == second["pid"]
+    assert third["pid"] != second["pid"]
+    assert worker.recycled == 1
+
+
+def test_worker_recycled_above_memory_limit():
+    """Testa a reciclagem quando a memória passa do limite"""
+    worker = ExtractionWorker(max_jobs=0, max_memory_mb=1, handler=fake_extract)
+    with patch(
+        "dataweaver.data.modules.extraction_worker.process_memory_mb",
+        return_value=2.0,
+    ):
+        worker.submit("a.pdf", "1")
+    assert worker.recycled == 1
+    assert worker.pid is None
+
+
+def test_worker_error_keeps_process():
+    """Testa que a falha de uma tarefa vira ExtractionError sem derrubar o processo"""
+    worker = ExtractionWorker(max_jobs=0, handler=fake_extract)
+    try:
+        pid = worker.submit("a.pdf", "1")["pid"]
+        with pytest.raises(ExtractionError, match="PDF inválido"):
+            worker.submit("a.pdf", "falha")
+        assert worker.submit("a.pdf", "1")["pid"] == pid
+    finally:
+        worker.close()
+
+
+def test_server_and_client_roundtrip(tmp_path):
+    """Testa extração e encerramento via socket local"""
+    address = str(tmp_path / "tabula.sock")
+    server = ExtractionServer(address, b"chave", ExtractionWorker(handler=fake_extract))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    client = ExtractionClient(address, b"chave")
+    try:
+        for _ in range(50):
+            if client.available():
+                break
+            threading.Event().wait(0.05)
+
+        result = client.extract(Path("a.pdf"), "3-5")
+        assert result["pdf"] == "a.pdf"
+        with pytest.raises(ExtractionError, match="PDF inválido"):
+            client.extract("a.pdf", "falha")
+        # O mesmo processo atende as próximas requisições
+        assert client.extract("a.pdf", "1")["pid"] == result["pid"]
+    finally:
+        client.shutdown()
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_server_survives_bad_requests_and_disconnects(tmp_path):
+    """Testa que requisições inválidas e clientes desconectados não derrubam o serviço"""
+    address = str(tmp_path / "tabula.sock")
+    server = ExtractionServer(address, b"chave", ExtractionWorker(handler=fake_extract))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    client = ExtractionClient(address, b"chave")
+    try:
+        for _ in range(50):
+            if client.available():
+                break
+            threading.Event().wait(0.05)
+
+        with Client(address, authkey=b"chave") as conn:
+            conn.send(5)
+            status, message = conn.recv()
+        assert status == "error" and "inválida" in message
+
+        # Cliente que desiste no meio da tarefa (ex: Ctrl-C no pipeline)
+        with Client(address, authkey=b"chave") as conn:
+            conn.send(("a.pdf", "lento"))
+
+        assert client.extract("a.pdf", "1")["pdf"] == "a.pdf"
+        assert thread.is_alive()
+    finally:
+        client.shutdown()
+        thread.join(timeout=5)
+
+
+def test_client_unavailable(tmp_path):
+    """Testa o erro de conexão sem serviço em execução"""
+    client = ExtractionClient(str(tmp_path / "ausente.sock"), b"chave")
+
+    assert not client.available()
+    with pytest.raises(ConnectionError):
+        client.extract("a.pdf", "1")
+
+
+def test_parse_address():
+    """Testa a conversão do endereço configurado"""
+    assert parse_address("127.0.0.1:6000") == ("127.0.0.1", 6000)
+    assert parse_address("/tmp/tabula.sock") == "/tmp/tabula.sock"
+
+
+def test_worker_address_rejects_remote_hosts():
+    """Testa que o serviço só escuta TCP na interface local"""
+    for address, expected in [
+        ("127.0.0.1:6000", ("127.0.0.1", 6000)),
+        ("localhost:6000", ("localhost", 6000)),
+    ]:
+        data = dataclasses.replace(config.data, worker_address=address)
+        with patch.object(config, "data", data):
+            assert worker_address() == expected
+
+    data = dataclasses.replace(config.data, worker_address="0.0.0.0:6000")
+    with patch.object(config, "data", data), pytest.raises(ValueError):
+        worker_address()
+
+
+def test_worker_authkey_generated_in_cache(tmp_path):
+    """Testa a chave aleatória (0600) usada sem TABULA_WORKER_KEY"""
+    dirs = dataclasses.replace(config.dirs, cache=tmp_path)
+    data = dataclasses.replace(config.data, worker_key="CHANGE-ME")
+    with patch.object(config, "dirs", dirs), patch.object(config, "data", data):
+        key = worker_authkey()
+        assert worker_authkey() == key
+    assert len(key) == 64
+    assert stat.S_IMODE((tmp_path / "tabula.key").stat().st_mode) == 0o600
+
+    data = dataclasses.replace(config.data, worker_key="segredo")
+    with patch.object(config, "data", data):
+        assert worker_authkey() == b"segredo"
+
+
+def test_server_requires_authkey(tmp_path):
+    with pytest.raises(ValueError):
+        ExtractionServer(str(tmp_path / "s.sock"), b"", ExtractionWorker())
+
+
+def test_pdf_extractor_uses_client():
+    """Testa que o PdfExtractor envia a extração ao serviço"""
+    client = MagicMock()
+    client.extract.return_value = ["tabela"]
+
+    with patch("tabula.read_pdf") as mock_tabula:
+        result = PdfExtractor(Path("a.pdf"), client).extract_tables(pages="1")
+
+    assert result == ["tabela"]
+    client.extract.assert_called_once_with(Path("a.pdf"), "1")
+    mock_tabula.assert_not_called()
+
+
+def test_pdf_extractor_falls_back_without_service():
+    """Testa o uso do tabula no processo atual quando o serviço não responde"""
+    client = MagicMock()
+    client.extract.side_effect = ConnectionError("Serviço de extração indisponível")
+
+    with patch("tabula.read_pdf", return_value=[]) as mock_tabula:
+        PdfExtractor(Path("a.pdf"), client).extract_tables(pages="1")
+
+    mock_tabula.assert_called_once_with(
+        "a.pdf", pages="1", multiple_tables=True, lattice=True
+    )
@@ -0,0 +1,127 @@
+from dataweaver.data.modules.page_scanner import (
+    PageScanner,
+    PageIndex,
+    PageStats,
+    count_operators,
+    FALLBACK_PAGES,
+)
+
+import pytest
+from unittest.mock import patch
+
+TEXT = b"BT /F1 12 Tf 72 720 Td (Procedimento re l Tj) Tj ET"
+GRID = b"\n".join(
+    b"%d 100 m %d 700 l S 72 %d 400 20 re S" % (x, x, x) for x in range(50, 500, 50)
+)
+
+
+def build_pdf(contents: list[bytes], forms: "dict[int, bytes] | None" = None) -> bytes:
+    """Monta um PDF mínimo, sem compressão, com um content stream por página.
+
+    ``forms`` (índice da página -> conteúdo) adiciona um Form XObject ``/Fm1``
+    aos recursos da página.
+    """
+    forms = forms or {}
+    count = len(contents)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>".encode(),
+    ]
+    form_objects = []
+    for i, content in enumerate(contents):
+        resources = ""
+        if i in forms:
+            number = 3 + 2 * count + len(form_objects)
+            resources = f"/Resources << /XObject << /Fm1 {number} 0 R >> >> "
+            form_objects.append(
+                b"<< /Type /XObject /Subtype /Form /BBox [0 0 612 792] "
+                b"/Length %d >>\nstream\n%s\nendstream" % (len(forms[i]), forms[i])
+            )
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"{resources}/Contents {4 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content)
+        )
+    objects.extend(form_objects)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\n" % (len(objects) + 1)
+    output += b"startxref\n%d\n%%%%EOF\n" % xref
+    return bytes(output)
+
+
+def test_count_operators_ignores_strings():
+    """Testa a contagem de operadores sem confundir o conteúdo das strings"""
+    assert count_operators(TEXT) == (1, 0)
+    assert count_operators(GRID) == (0, 18)
+
+
+def test_count_operators_ignores_nested_parentheses():
+    """Testa strings literais com parênteses aninhados e escapados"""
+    assert count_operators(b"BT (Tabela (I) re l anexo) Tj ET") == (1, 0)
+    assert count_operators(b"BT (a \\) re (b) l) Tj ET") == (1, 0)
+    assert count_operators(b"BT (sem fim re l") == (0, 0)
+    assert count_operators(b"(x (y)) Tj 0 0 1 1 re") == (1, 1)
+
+
+def test_table_pages():
+    """Testa a seleção das páginas com grade e texto"""
+    index = PageIndex(
+        "abc",
+        3,
+        (PageStats(1, 40, 0), PageStats(2, 80, 30), PageStats(3, 0, 50)),
+    )
+    assert index.table_pages(min_rulings=8) == [2]
+    assert PageIndex.from_dict(index.to_dict()) == index
+
+
+def test_select_pages_without_pypdf(tmp_path):
+    """Testa o intervalo padrão quando o pypdf não está instalado"""
+    scanner = PageScanner(tmp_path)
+    with patch(
+        "dataweaver.data.modules.page_scanner.pypdf_available", return_value=False
+    ):
+        assert scanner.select_pages(tmp_path / "anexo.pdf") == FALLBACK_PAGES
+
+
+def test_select_pages_detects_tables_and_caches(tmp_path):
+    """Testa a varredura real e o reaproveitamento do índice pelo hash"""
+    pytest.importorskip("pypdf")
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(build_pdf([TEXT, TEXT + GRID, TEXT + GRID, TEXT]))
+    scanner = PageScanner(tmp_path / "index")
+
+    assert scanner.select_pages(pdf) == "2-3"
+    assert len(list((tmp_path / "index").glob("*.json"))) == 1
+
+    with patch.object(PageScanner, "_build_index") as mock_build:
+        assert scanner.select_pages(pdf) == "2-3"
+    mock_build.assert_not_called()
+
+
+def test_select_pages_without_tables_uses_fallback(tmp_path):
+    """Testa o intervalo padrão quando nenhuma página tem grade"""
+    pytest.importorskip("pypdf")
+    pdf = tmp_path / "texto.pdf"
+    pdf.write_bytes(build_pdf([TEXT, TEXT]))
+
+    assert PageScanner(tmp_path).select_pages(pdf, fallback="1-2") == "1-2"
+
+
+def test_select_pages_counts_form_xobjects(tmp_path):
+    """Testa que grades desenhadas dentro de Form XObjects (Do) são contadas"""
+    pytest.importorskip("pypdf")
+    pdf = tmp_path / "formularios.pdf"
+    pdf.write_bytes(build_pdf([TEXT, TEXT + b" /Fm1 Do", TEXT], forms={1: GRID}))
+
+    assert PageScanner(tmp_path / "index").select_pages(pdf) == "2"
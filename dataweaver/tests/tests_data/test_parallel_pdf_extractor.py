@@ -0,0 +1,220 @@
+from dataweaver.data.modules import ParallelPdfExtractor, PdfExtractor
+from dataweaver.data.modules.extraction_checkpoint import ExtractionCheckpoint
+from dataweaver.data.modules.page_ranges import (
+    parse_page_range,
+    format_page_range,
+    plan_chunks,
+)
+
+import pytest
+from unittest.mock import MagicMock, patch
+from pathlib import Path
+import pandas as pd
+import time
+
+
+def fake_chunk(pdf_path, pages):
+    """Extrai um bloco simulado: uma tabela por página (blocos iniciais demoram mais)"""
+    page_list = parse_page_range(pages)
+    time.sleep(0.2 if page_list[0] == 1 else 0)
+    return [pd.DataFrame({"pagina": [page]}) for page in page_list]
+
+
+def test_parse_page_range():
+    """Testa a leitura das seleções de páginas do tabula"""
+    assert parse_page_range("3-6") == [3, 4, 5, 6]
+    assert parse_page_range("1,4-5,4") == [1, 4, 5]
+    with pytest.raises(ValueError):
+        parse_page_range("all")
+    with pytest.raises(ValueError):
+        parse_page_range("5-3")
+
+
+def test_format_page_range():
+    """Testa o agrupamento de páginas consecutivas"""
+    assert format_page_range([3, 4, 5, 7, 9, 10]) == "3-5,7,9-10"
+    assert format_page_range([2]) == "2"
+
+
+def test_plan_chunks_autotune():
+    """Testa a divisão automática pelo número de páginas"""
+    pages = list(range(3, 182))
+
+    workers, chunks = plan_chunks(pages, max_workers=16)
+    assert workers == 16
+    assert [p for chunk in chunks for p in chunk] == pages
+    assert len(chunks[0]) == 4  # ~4 blocos por processo, mínimo de 4 páginas
+
+    workers, chunks = plan_chunks(list(range(1, 7)), max_workers=16)
+    assert workers == 2  # poucos blocos limitam os processos
+
+
+def test_plan_chunks_fixed_size():
+    """Testa o tamanho de bloco configurado"""
+    workers, chunks = plan_chunks(list(range(1, 11)), max_workers=2, chunk_size=3)
+    assert workers == 2
+    assert chunks == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+
+
+def test_parallel_extraction_keeps_page_order():
+    """Testa a extração em processos com remontagem na ordem das páginas"""
+    extractor = ParallelPdfExtractor(
+        Path("anexo.pdf"), max_workers=2, chunk_size=2, handler=fake_chunk
+    )
+
+    tables = extractor.extract_tables(pages="1-7")
+
+    assert [int(df["pagina"].iloc[0]) for df in tables] == list(range(1, 8))
+
+
+def test_single_worker_uses_sequential_extraction():
+    """Testa que um único processo usa a extração sequencial"""
+    extractor = ParallelPdfExtractor(Path("anexo.pdf"), max_workers=1)
+
+    with patch("tabula.read_pdf", return_value=[]) as mock_tabula:
+        extractor.extract_tables(pages="3-181")
+
+    mock_tabula.assert_called_once_with(
+        "anexo.pdf", pages="3-181", multiple_tables=True, lattice=True
+    )
+
+
+def test_non_numeric_pages_are_not_split():
+    """Testa que 'all' é extraído sem divisão"""
+    extractor = ParallelPdfExtractor(Path("anexo.pdf"), max_workers=4)
+
+    with patch("tabula.read_pdf", return_value=[]) as mock_tabula:
+        extractor.extract_tables(pages="all")
+
+    mock_tabula.assert_called_once()
+
+
+def test_checkpoint_resumes_after_interruption(tmp_path):
+    """Testa que uma nova execução retoma a partir do primeiro bloco pendente"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    calls = []
+
+    def interrupted(pdf_path, pages):
+        calls.append(pages)
+        if pages == "5-6":
+            raise RuntimeError("JVM encerrada")
+        return fake_chunk(pdf_path, pages)
+
+    extractor = ParallelPdfExtractor(
+        pdf, 1, 2, handler=interrupted, checkpoint_dir=tmp_path / "ckpt"
+    )
+    with pytest.raises(RuntimeError):
+        extractor.extract_tables(pages="1-7")
+    assert calls == ["1-2", "3-4", "5-6"]
+
+    calls.clear()
+    extractor.handler = lambda pdf_path, pages: calls.append(pages) or fake_chunk(
+        pdf_path, pages
+    )
+    tables = extractor.extract_tables(pages="1-7")
+
+    assert calls == ["5-6", "7"]
+    assert [int(df["pagina"].iloc[0]) for df in tables] == list(range(1, 8))
+    assert list((tmp_path / "ckpt").iterdir()) == []
+
+
+def test_checkpoint_chunks_do_not_depend_on_cpu_count(tmp_path):
+    """Testa que, com checkpoint, a divisão automática é a mesma em qualquer máquina"""
+    pages = list(range(3, 182))
+    plans = [
+        ParallelPdfExtractor(
+            tmp_path / "a.pdf", workers, checkpoint_dir=tmp_path
+        )._plan(pages)[1]
+        for workers in (2, 16)
+    ]
+
+    assert plans[0] == plans[1]
+    assert len(plans[0][0]) == ParallelPdfExtractor.CHECKPOINT_CHUNK_PAGES
+
+
+def test_checkpoint_discards_unreadable_chunk(tmp_path):
+    """Testa que um bloco truncado é descartado e extraído de novo"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    calls = []
+
+    def interrupted(pdf_path, pages):
+        calls.append(pages)
+        if pages == "5-6":
+            raise RuntimeError("JVM encerrada")
+        return fake_chunk(pdf_path, pages)
+
+    extractor = ParallelPdfExtractor(
+        pdf, 1, 2, handler=interrupted, checkpoint_dir=tmp_path / "ckpt"
+    )
+    with pytest.raises(RuntimeError):
+        extractor.extract_tables(pages="1-6")
+    (folder,) = (tmp_path / "ckpt").iterdir()
+    (folder / "chunk_1-2.pkl").write_bytes(b"truncado")
+
+    calls.clear()
+    extractor.handler = lambda pdf_path, pages: calls.append(pages) or fake_chunk(
+        pdf_path, pages
+    )
+    tables = extractor.extract_tables(pages="1-6")
+
+    assert calls == ["1-2", "5-6"]
+    assert [int(df["pagina"].iloc[0]) for df in tables] == list(range(1, 7))
+    assert ExtractionCheckpoint(tmp_path / "outro").load("1-2") is None
+
+
+def test_checkpoint_resumes_with_extraction_service(tmp_path):
+    """Testa que, com o serviço de extração, os blocos também vão para o checkpoint"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    client = MagicMock()
+    client.extract.side_effect = [
+        fake_chunk(None, "1-2"),
+        RuntimeError("serviço encerrado"),
+    ]
+
+    extractor = ParallelPdfExtractor(
+        pdf, 4, 2, checkpoint_dir=tmp_path / "ckpt", client=client
+    )
+    with pytest.raises(RuntimeError):
+        list(extractor.iter_tables(pages="1-5"))
+
+    client.reset_mock(side_effect=True)
+    client.extract.side_effect = fake_chunk
+    tables = extractor.extract_tables(pages="1-5")
+
+    assert [c.args[1] for c in client.extract.call_args_list] == ["3-4", "5"]
+    assert [int(df["pagina"].iloc[0]) for df in tables] == list(range(1, 6))
+
+
+def test_iter_tables_streams_chunks_in_page_order():
+    """Testa a entrega dos blocos em ordem conforme ficam prontos"""
+    extractor = ParallelPdfExtractor(
+        Path("anexo.pdf"), max_workers=2, chunk_size=2, handler=fake_chunk
+    )
+
+    chunks = list(extractor.iter_tables(pages="1-7"))
+
+    assert [[int(df["pagina"].iloc[0]) for df in c] for c in chunks] == [
+        [1, 2],
+        [3, 4],
+        [5, 6],
+        [7],
+    ]
+
+
+def test_sequential_iter_tables_calls_tabula_per_chunk():
+    """Testa o streaming sequencial: uma chamada ao tabula por bloco"""
+    extractor = PdfExtractor(Path("anexo.pdf"), chunk_size=3)
+
+    with patch("tabula.read_pdf", return_value=[]) as mock_tabula:
+        chunks = extractor.iter_tables(pages="1-7")
+        mock_tabula.assert_not_called()  # extração preguiçosa
+        assert len(list(chunks)) == 3
+
+    assert [c.kwargs["pages"] for c in mock_tabula.call_args_list] == [
+        "1-3",
+        "4-6",
+        "7",
+    ]
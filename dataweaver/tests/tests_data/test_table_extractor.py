@@ -0,0 +1,76 @@
+from dataweaver.data.modules import TableExtractor, ParallelPdfExtractor
+from dataweaver.errors import ExtractionError
+from dataweaver.settings import config
+
+import pytest
+from unittest.mock import patch
+import pandas as pd
+import dataclasses
+import zipfile
+
+
+@pytest.fixture
+def streaming_config():
+    data = dataclasses.replace(
+        config.data,
+        streaming=True,
+        extract_pages="1-4",
+        extract_workers=1,
+        extract_chunk_pages=2,
+        checkpoint_enabled=False,
+        cache_enabled=False,
+        worker_enabled=False,
+    )
+    with patch.object(config, "data", data):
+        yield
+
+
+def test_streaming_run_writes_csv_per_chunk(tmp_path, streaming_config):
+    """Testa o fluxo em streaming: um bloco extraído, processado e gravado por vez"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    pages = iter([[pd.DataFrame({"A": [1, 2]})], [pd.DataFrame({"A": [3]})]])
+    extractor = TableExtractor(
+        pdf, tmp_path / "anexo.csv", tmp_path / "csv.zip", "csv", {}
+    )
+
+    with patch("tabula.read_pdf", side_effect=lambda *a, **k: next(pages)) as mock:
+        extractor.run()
+
+    assert [c.kwargs["pages"] for c in mock.call_args_list] == ["1-2", "3-4"]
+    assert pd.read_csv(tmp_path / "anexo.csv")["A"].tolist() == [1, 2, 3]
+    with zipfile.ZipFile(tmp_path / "csv.zip") as zf:
+        assert zf.namelist() == ["anexo.csv"]
+
+
+def test_streaming_run_without_tables(tmp_path, streaming_config):
+    """Testa o erro quando nenhum bloco contém tabelas"""
+    pdf = tmp_path / "anexo.pdf"
+    pdf.write_bytes(b"%PDF-1.7")
+    extractor = TableExtractor(
+        pdf, tmp_path / "anexo.csv", tmp_path / "csv.zip", "csv", {}
+    )
+
+    with patch("tabula.read_pdf", return_value=[]):
+        with pytest.raises(ExtractionError):
+            extractor.run()
+    assert not (tmp_path / "anexo.csv").exists()
+
+
+def test_extraction_service_keeps_checkpoint(tmp_path):
+    """Testa que TABULA_WORKER não desativa o checkpoint (EXTRACT_CHECKPOINT)"""
+    data = dataclasses.replace(
+        config.data, checkpoint_enabled=True, cache_enabled=False, extract_workers=4
+    )
+    client = object()
+
+    with patch.object(config, "data", data), patch(
+        "dataweaver.data.modules.table_extractor.create_extraction_client",
+        return_value=client,
+    ), patch("dataweaver.data.modules.table_extractor.logger") as mock_logger:
+        extractor = TableExtractor._create_pdf_extractor(tmp_path / "anexo.pdf")
+
+    assert isinstance(extractor, ParallelPdfExtractor)
+    assert extractor.client is client
+    assert extractor.checkpoint_dir is not None
+    mock_logger.warning.assert_called_once()
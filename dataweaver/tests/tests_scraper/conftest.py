@@ -0,0 +1,110 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import threading
+import hashlib
+
+
+class LocalHttpServer:
+    """Servidor HTTP local que substitui o site real nos testes.
+
+    As rotas são registradas em ``routes`` (caminho -> (status, corpo)) e
+    cada requisição recebida é anotada em ``requests`` (caminhos) e
+    ``headers`` (cabeçalhos). Respostas 200 trazem um ETag derivado do corpo
+    e ``If-None-Match`` correspondente é respondido com 304. Com
+    ``accept_ranges`` ativo, ``Range``/``If-Range`` geram respostas 206, e
+    ``drop_after`` (caminho -> bytes) derruba a conexão uma vez no meio do corpo.
+    ``fail_next`` (caminho -> [(status, cabeçalhos)]) responde falhas em sequência
+    antes da rota normal.
+    """
+
+    def __init__(self) -> None:
+        self.routes: dict[str, tuple[int, bytes]] = {}
+        self.requests: list[str] = []
+        self.headers: list[dict[str, str]] = []
+        self.accept_ranges = True
+        self.drop_after: dict[str, int] = {}
+        self.fail_next: dict[str, list[tuple[int, dict[str, str]]]] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.requests.append(self.path)
+                server.headers.append(dict(self.headers))
+                if server.fail_next.get(self.path):
+                    status, headers = server.fail_next[self.path].pop(0)
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status, body = server.routes.get(self.path, (404, b"not found"))
+                etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+
+                if status == 200 and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    return
+
+                headers = {}
+                range_header = self.headers.get("Range")
+                if (
+                    status == 200
+                    and server.accept_ranges
+                    and range_header
+                    and self.headers.get("If-Range") == etag
+                ):
+                    start = int(range_header.split("=")[1].split("-")[0])
+                    status, full_size, body = 206, len(body), body[start:]
+                    headers["Content-Range"] = (
+                        f"bytes {start}-{full_size - 1}/{full_size}"
+                    )
+
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(body)))
+                if status in (200, 206):
+                    self.send_header("ETag", etag)
+                    if server.accept_ranges:
+                        self.send_header("Accept-Ranges", "bytes")
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+
+                drop_after = server.drop_after.pop(self.path, None)
+                if drop_after is not None:
+                    self.wfile.write(body[:drop_after])
+                    self.close_connection = True
+                    return
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._httpd.server_port}"
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, args=(0.05,), daemon=True
+        )
+
+    def url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def local_http_server():
+    """Fornece um servidor HTTP local em uma porta livre."""
+    server = LocalHttpServer()
+    server.start()
+    yield server
+    server.stop()
@@ -0,0 +1,102 @@
+from dataweaver.scraper.modules import (
+    ArchiveCodec,
+    CodecArchiveCompressor,
+    DefaultPDFServiceFactory,
+    LoggingZipCompressor,
+    ValidationZipCompressor,
+    available_codecs,
+    get_archive_codec,
+)
+from dataweaver.scraper.modules.archive_codecs import ARCHIVE_CODECS
+from dataweaver.settings import config
+
+from unittest.mock import patch
+import dataclasses
+import tarfile
+import zipfile
+
+import pytest
+
+
+@pytest.fixture
+def files(tmp_path):
+    (tmp_path / "a.pdf").write_bytes(b"%PDF a" * 200)
+    (tmp_path / "b.pdf").write_bytes(b"%PDF b" * 200)
+    return tmp_path
+
+
+def read_members(path, codec):
+    if codec.container == "zip":
+        with zipfile.ZipFile(path) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+    with tarfile.open(path) as archive:
+        return {m.name: archive.extractfile(m).read() for m in archive.getmembers()}
+
+
+@pytest.mark.parametrize("codec", available_codecs(), ids=lambda codec: codec.name)
+def test_codec_roundtrip(files, codec):
+    """Cada codec disponível gera um arquivo legível com o mesmo conteúdo"""
+    name = codec.archive_name("saida.zip")
+    compressor = ValidationZipCompressor(
+        LoggingZipCompressor(CodecArchiveCompressor(files, codec, level=3))
+    )
+
+    compressor.create_zip(name, "pdf")
+
+    assert name.endswith(codec.extension)
+    assert read_members(files / name, codec) == {
+        "a.pdf": b"%PDF a" * 200,
+        "b.pdf": b"%PDF b" * 200,
+    }
+    assert not list(files.glob("*.tmp"))
+
+
+def test_validation_uses_codec_extension(files):
+    compressor = ValidationZipCompressor(
+        LoggingZipCompressor(CodecArchiveCompressor(files, get_archive_codec("tar-xz")))
+    )
+
+    with pytest.raises(ValueError, match="deve terminar com .tar.xz"):
+        compressor.create_zip("saida.zip", "pdf")
+
+
+def test_archive_name_swaps_zip_suffix():
+    codec = get_archive_codec("tar-xz")
+
+    assert codec.archive_name("pdfs.zip") == "pdfs.tar.xz"
+    assert codec.archive_name("pdfs.tar.xz") == "pdfs.tar.xz"
+    assert get_archive_codec("zip-lzma").archive_name("pdfs.zip") == "pdfs.zip"
+
+
+def test_get_archive_codec_rejects_unknown_codec():
+    with pytest.raises(ValueError, match="desconhecido"):
+        get_archive_codec("rar")
+
+
+def test_get_archive_codec_rejects_unavailable_codec():
+    codec = ArchiveCodec(
+        "teste-ausente", ".x", "tar", "x", requires=("modulo.ausente",)
+    )
+    with patch.dict(ARCHIVE_CODECS, {codec.name: codec}):
+        assert codec not in available_codecs()
+        with pytest.raises(ValueError, match="indisponível"):
+            get_archive_codec(codec.name)
+
+
+def test_zstd_codecs_follow_interpreter_support():
+    """zstd depende de compression.zstd (Python 3.14+)"""
+    expected = hasattr(zipfile, "ZIP_ZSTANDARD")
+    assert ARCHIVE_CODECS["zip-zstd"].available() == expected
+
+
+def test_factory_uses_configured_codec(tmp_path):
+    archive = dataclasses.replace(config.archive, codec="tar-xz")
+    with patch.object(config, "archive", archive):
+        factory = DefaultPDFServiceFactory(tmp_path, "test")
+        compressor = factory.create_zip_compressor()
+
+        assert isinstance(compressor, CodecArchiveCompressor)
+        assert compressor.codec.name == "tar-xz"
+        assert factory.archive_name("pdfs_compactados.zip") == (
+            "pdfs_compactados.tar.xz"
+        )
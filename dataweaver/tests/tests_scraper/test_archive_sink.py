@@ -0,0 +1,153 @@
+from dataweaver.scraper.modules import (
+    ZipArchiveSink,
+    CompressionPolicy,
+    PDFProcessingService,
+    FileManager,
+    FileDownloader,
+    PooledHttpSession,
+)
+from dataweaver.scraper.modules.interfaces import (
+    PDFScraperInterface,
+    ZipCompressorInterface,
+)
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+import zipfile
+import os
+
+import pytest
+
+
+def write_pdf(folder, name, content):
+    path = folder / name
+    path.write_bytes(content)
+    return path
+
+
+def test_sink_appends_files_and_publishes_on_close(tmp_path):
+    sink = ZipArchiveSink(tmp_path)
+    sink.open("saida.zip")
+    sink.add(write_pdf(tmp_path, "a.pdf", b"a" * 1000))
+    sink.add(write_pdf(tmp_path, "b.pdf", b"b" * 1000))
+
+    assert not (tmp_path / "saida.zip").exists()
+    sink.close()
+
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.testzip() is None
+        assert archive.read("b.pdf") == b"b" * 1000
+    assert sink.added == ["a.pdf", "b.pdf"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sink_is_thread_safe(tmp_path):
+    """Testa adições simultâneas vindas de vários downloads"""
+    paths = [write_pdf(tmp_path, f"f{i}.pdf", os.urandom(5000)) for i in range(20)]
+    sink = ZipArchiveSink(tmp_path, CompressionPolicy())
+    sink.open("saida.zip")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(sink.add, paths))
+    sink.close()
+
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(p.name for p in paths)
+
+
+def test_sink_keeps_only_matching_loose_files(tmp_path):
+    sink = ZipArchiveSink(tmp_path, keep_patterns=["Anexo_I.*"])
+    sink.open("saida.zip")
+    sink.add(write_pdf(tmp_path, "Anexo_I.pdf", b"tabela"))
+    sink.add(write_pdf(tmp_path, "Anexo_II.pdf", b"outro"))
+    sink.close()
+
+    assert (tmp_path / "Anexo_I.pdf").exists()
+    assert not (tmp_path / "Anexo_II.pdf").exists()
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert sorted(archive.namelist()) == ["Anexo_I.pdf", "Anexo_II.pdf"]
+
+
+def test_sink_ignores_repeated_names(tmp_path):
+    sink = ZipArchiveSink(tmp_path)
+    sink.open("saida.zip")
+    path = write_pdf(tmp_path, "a.pdf", b"a")
+    sink.add(path)
+    sink.add(path)
+    sink.close()
+
+    assert sink.added == ["a.pdf"]
+
+
+def test_sink_abort_keeps_previous_archive(tmp_path):
+    (tmp_path / "saida.zip").write_bytes(b"anterior")
+    sink = ZipArchiveSink(tmp_path)
+    sink.open("saida.zip")
+    sink.add(write_pdf(tmp_path, "a.pdf", b"a"))
+
+    sink.abort()
+
+    assert (tmp_path / "saida.zip").read_bytes() == b"anterior"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_sink_validates_name_and_state(tmp_path):
+    sink = ZipArchiveSink(tmp_path)
+
+    with pytest.raises(ValueError, match="deve terminar com .zip"):
+        sink.open("saida")
+    with pytest.raises(RuntimeError):
+        sink.add(tmp_path / "a.pdf")
+
+
+def test_service_streams_downloads_into_archive(local_http_server, tmp_path):
+    """Testa o pipeline com o ZIP montado durante os downloads"""
+    links = []
+    for i in range(4):
+        local_http_server.routes[f"/anexo{i}.pdf"] = (200, f"%PDF {i}".encode() * 50)
+        links.append(local_http_server.url(f"/anexo{i}.pdf"))
+    local_http_server.routes["/falha.pdf"] = (404, b"")
+    links.append(local_http_server.url("/falha.pdf"))
+
+    scraper = MagicMock(spec=PDFScraperInterface)
+    scraper.get_pdf_links.return_value = links
+    compressor = MagicMock(spec=ZipCompressorInterface)
+    service = PDFProcessingService(
+        "saida.zip",
+        "pdf",
+        scraper,
+        FileManager(tmp_path, FileDownloader(PooledHttpSession())),
+        compressor,
+        max_workers=3,
+        archive_sink=ZipArchiveSink(tmp_path, keep_patterns=[]),
+    )
+
+    service.process("http://example.com")
+
+    compressor.create_zip.assert_not_called()
+    assert list(service.summary.failed) == [links[-1]]
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert sorted(archive.namelist()) == [f"anexo{i}.pdf" for i in range(4)]
+        assert archive.read("anexo2.pdf") == b"%PDF 2" * 50
+    assert not list(tmp_path.glob("*.pdf"))
+
+
+def test_service_aborts_archive_when_no_links(tmp_path):
+    scraper = MagicMock(spec=PDFScraperInterface)
+    scraper.get_pdf_links.return_value = []
+    sink = MagicMock(spec=ZipArchiveSink)
+    service = PDFProcessingService(
+        "saida.zip",
+        "pdf",
+        scraper,
+        MagicMock(),
+        MagicMock(spec=ZipCompressorInterface),
+        archive_sink=sink,
+    )
+
+    service.process("http://example.com")
+
+    sink.open.assert_called_once_with("saida.zip")
+    sink.abort.assert_called_once()
+    sink.close.assert_not_called()
@@ -0,0 +1,270 @@
+from dataweaver.scraper.modules.interfaces import (
+    PDFServiceAbstractFactory,
+    PDFProcessingServiceInterface,
+    AsyncHttpClientInterface,
+    AsyncPDFScraperInterface,
+    AsyncFileManagerInterface,
+)
+from dataweaver.scraper.modules import (
+    AsyncPDFServiceFactory,
+    HttpValidatorCache,
+    ZipArchiveSink,
+    AsyncPDFProcessingService,
+    AsyncHttpSession,
+    AiohttpHttpClient,
+    AsyncFileManager,
+    AsyncPDFScraper,
+    AnchorPDFExtractionStrategy,
+)
+from dataweaver.settings import config
+
+import pytest
+import asyncio
+import zipfile
+from unittest.mock import MagicMock, patch
+
+
+LISTING = b"""
+<html>
+    <a href="/files/anexo_1.pdf">Anexo I</a>
+    <a href="/files/anexo_2.pdf">Anexo II</a>
+    <a href="/files/anexo_missing.pdf">Anexo quebrado</a>
+    <a href="/files/outro.pdf">Outro</a>
+</html>
+"""
+
+
+def test_async_http_client_fetches_html(local_http_server):
+    """Testa o cliente aiohttp contra o servidor local"""
+    local_http_server.routes["/page"] = (200, b"<html>ok</html>")
+
+    async def run():
+        session = AsyncHttpSession()
+        try:
+            return await AiohttpHttpClient(session).fetch_html(
+                local_http_server.url("/page")
+            )
+        finally:
+            await session.close()
+
+    assert asyncio.run(run()) == "<html>ok</html>"
+
+
+def test_async_scraper_extracts_links(local_http_server):
+    """Testa a extração assíncrona de links reutilizando as estratégias"""
+    local_http_server.routes["/page"] = (200, LISTING)
+
+    async def run():
+        session = AsyncHttpSession()
+        scraper = AsyncPDFScraper(
+            AiohttpHttpClient(session), AnchorPDFExtractionStrategy("anexo")
+        )
+        try:
+            return await scraper.get_pdf_links(local_http_server.url("/page"))
+        finally:
+            await session.close()
+
+    links = asyncio.run(run())
+
+    assert sorted(links) == [
+        local_http_server.url("/files/anexo_1.pdf"),
+        local_http_server.url("/files/anexo_2.pdf"),
+        local_http_server.url("/files/anexo_missing.pdf"),
+    ]
+
+
+def test_async_file_manager_streams_to_disk(local_http_server, tmp_path):
+    """Testa o download assíncrono gravado por blocos"""
+    local_http_server.routes["/files/doc.pdf"] = (200, b"%PDF" * 1000)
+
+    async def run():
+        session = AsyncHttpSession()
+        try:
+            manager = AsyncFileManager(tmp_path, session, chunk_size=512)
+            await manager.save_file(local_http_server.url("/files/doc.pdf"))
+        finally:
+            await session.close()
+
+    asyncio.run(run())
+
+    assert (tmp_path / "doc.pdf").read_bytes() == b"%PDF" * 1000
+    assert list(tmp_path.iterdir()) == [tmp_path / "doc.pdf"]
+
+
+def test_async_file_manager_uses_cache_and_store(local_http_server, tmp_path):
+    """Testa o GET condicional e o registro no armazenamento de PDFs"""
+    local_http_server.routes["/files/doc.pdf"] = (200, b"%PDF corpo")
+    store = MagicMock()
+    store.restore.return_value = False
+
+    async def run():
+        session = AsyncHttpSession()
+        try:
+            manager = AsyncFileManager(
+                tmp_path,
+                session,
+                cache=HttpValidatorCache(tmp_path / "http"),
+                store=store,
+            )
+            url = local_http_server.url("/files/doc.pdf")
+            await manager.save_file(url)
+            return await manager.save_file(url)
+        finally:
+            await session.close()
+
+    path = asyncio.run(run())
+
+    assert path.read_bytes() == b"%PDF corpo"
+    assert "If-None-Match" in local_http_server.headers[1]
+    store.add.assert_called_once()
+    assert store.restore.call_count == 2
+
+
+def test_async_service_streams_into_archive_sink(local_http_server, tmp_path):
+    """Testa a compactação de cada PDF assim que o download termina"""
+    local_http_server.routes["/page"] = (200, LISTING)
+    local_http_server.routes["/files/anexo_1.pdf"] = (200, b"pdf-1")
+    local_http_server.routes["/files/anexo_2.pdf"] = (200, b"pdf-2")
+    zip_compressor = MagicMock()
+
+    async def run():
+        session = AsyncHttpSession()
+        service = AsyncPDFProcessingService(
+            "output.zip",
+            "pdf",
+            AsyncPDFScraper(
+                AiohttpHttpClient(session), AnchorPDFExtractionStrategy("anexo")
+            ),
+            AsyncFileManager(tmp_path, session),
+            zip_compressor,
+            max_workers=2,
+            http_session=session,
+            archive_sink=ZipArchiveSink(tmp_path, keep_patterns=[]),
+        )
+        await service._run([local_http_server.url("/page")])
+
+    asyncio.run(run())
+
+    zip_compressor.create_zip.assert_not_called()
+    with zipfile.ZipFile(tmp_path / "output.zip") as zipf:
+        assert sorted(zipf.namelist()) == ["anexo_1.pdf", "anexo_2.pdf"]
+    assert sorted(p.name for p in tmp_path.glob("*.pdf")) == []
+
+
+def test_async_factory_warns_about_unsupported_settings(tmp_path):
+    """Testa o aviso sobre configurações sem efeito na pilha assíncrona"""
+    factory = AsyncPDFServiceFactory(tmp_path, "anexo")
+
+    with patch.object(config.http, "download_attempts", 3), patch.object(
+        config.http, "adaptive_concurrency", False
+    ), patch.object(config.scraper, "crawl_depth", 1), patch.object(
+        config.scraper, "streaming", False
+    ), patch(
+        "dataweaver.scraper.modules.factories.logger"
+    ) as mock_logger:
+        factory.create_service("output.zip", "pdf")
+
+    (message,) = mock_logger.warning.call_args.args
+    assert "HTTP_DOWNLOAD_ATTEMPTS" in message
+    assert "CRAWL_DEPTH" in message
+    assert "HTTP_ADAPTIVE_CONCURRENCY" not in message
+
+
+def test_async_service_end_to_end(local_http_server, tmp_path):
+    """Testa o serviço assíncrono completo contra o servidor local"""
+    local_http_server.routes["/page"] = (200, LISTING)
+    local_http_server.routes["/files/anexo_1.pdf"] = (200, b"pdf-1")
+    local_http_server.routes["/files/anexo_2.pdf"] = (200, b"pdf-2")
+
+    factory = AsyncPDFServiceFactory(tmp_path, "anexo", max_workers=2)
+    service = factory.create_service("output.zip", "pdf")
+    service.process(local_http_server.url("/page"))
+
+    assert service.summary.succeeded == [
+        local_http_server.url("/files/anexo_1.pdf"),
+        local_http_server.url("/files/anexo_2.pdf"),
+    ]
+    assert list(service.summary.failed) == [
+        local_http_server.url("/files/anexo_missing.pdf")
+    ]
+    with zipfile.ZipFile(tmp_path / "output.zip") as zipf:
+        assert sorted(zipf.namelist()) == ["anexo_1.pdf", "anexo_2.pdf"]
+    assert service.http_session._session is None
+
+
+def test_async_service_deduplicates_across_pages(local_http_server, tmp_path):
+    """Testa que links repetidos em várias páginas são baixados uma vez"""
+    local_http_server.routes["/page1"] = (200, LISTING)
+    local_http_server.routes["/page2"] = (200, LISTING)
+    local_http_server.routes["/files/anexo_1.pdf"] = (200, b"pdf-1")
+    local_http_server.routes["/files/anexo_2.pdf"] = (200, b"pdf-2")
+
+    factory = AsyncPDFServiceFactory(tmp_path, "anexo", max_workers=4)
+    service = factory.create_service("output.zip", "pdf")
+    service.process_many(
+        [local_http_server.url("/page1"), local_http_server.url("/page2")]
+    )
+
+    assert local_http_server.requests.count("/files/anexo_1.pdf") == 1
+    assert len(service.summary.succeeded) == 2
+
+
+def test_async_service_bounds_concurrency(tmp_path):
+    """Testa que o semáforo limita os downloads simultâneos"""
+    links = [f"http://example.com/anexo_{i}.pdf" for i in range(10)]
+    active = 0
+    peak = 0
+
+    class FakeScraper(AsyncPDFScraperInterface):
+        async def get_pdf_links(self, url):
+            return links
+
+    class FakeFileManager(AsyncFileManagerInterface):
+        async def save_file(self, url):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    service = AsyncPDFProcessingService(
+        "output.zip",
+        "pdf",
+        FakeScraper(),
+        FakeFileManager(),
+        MagicMock(),
+        max_workers=3,
+    )
+    service.process("http://example.com")
+
+    assert peak == 3
+    assert service.summary.succeeded == sorted(links)
+
+
+def test_async_service_critical_error_propagates(tmp_path):
+    """Testa que falhas na extração de links são críticas"""
+
+    class FailingScraper(AsyncPDFScraperInterface):
+        async def get_pdf_links(self, url):
+            raise RuntimeError("Critical error")
+
+    service = AsyncPDFProcessingService(
+        "output.zip", "pdf", FailingScraper(), MagicMock(), MagicMock()
+    )
+
+    with pytest.raises(RuntimeError, match="Critical error"):
+        service.process("http://example.com")
+
+
+def test_async_factory_contract(tmp_path):
+    """Testa que a fábrica assíncrona cumpre o contrato da fábrica abstrata"""
+    factory = AsyncPDFServiceFactory(tmp_path, "anexo")
+
+    assert isinstance(factory, PDFServiceAbstractFactory)
+    assert isinstance(factory.create_http_client(), AsyncHttpClientInterface)
+    assert isinstance(factory.create_scraper(), AsyncPDFScraperInterface)
+    assert isinstance(factory.create_file_manager(), AsyncFileManagerInterface)
+    assert isinstance(
+        factory.create_service("output.zip", "pdf"), PDFProcessingServiceInterface
+    )
+    assert factory.create_file_manager().session is factory.create_http_session()
@@ -0,0 +1,94 @@
+from dataweaver.scraper.modules import (
+    CompressionPolicy,
+    ZipCompressor,
+    ParallelZipCompressor,
+)
+
+import zipfile
+import zlib
+import os
+
+import pytest
+
+
+@pytest.fixture
+def sample_files(tmp_path):
+    """PDF já comprimido (bytes aleatórios) e CSV bem compressível."""
+    (tmp_path / "anexo.pdf").write_bytes(
+        b"%PDF-1.4\n" + zlib.compress(os.urandom(300_000))
+    )
+    (tmp_path / "tabela.csv").write_bytes(b"codigo;descricao;OD\n" * 20_000)
+    return tmp_path
+
+
+def test_policy_stores_incompressible_file(sample_files):
+    decision = CompressionPolicy().decide(sample_files / "anexo.pdf")
+
+    assert decision.stored
+    assert decision.level is None
+    assert decision.ratio >= 0.9
+    assert "já comprimido" in decision.reason
+
+
+def test_policy_deflates_compressible_file(sample_files):
+    decision = CompressionPolicy(level=9).decide(sample_files / "tabela.csv")
+
+    assert decision.method == zipfile.ZIP_DEFLATED
+    assert decision.level == 9
+    assert decision.ratio < 0.5
+
+
+def test_policy_uses_fast_level_for_moderate_gain(tmp_path):
+    """Conteúdo meio aleatório, meio repetido cai na faixa intermediária"""
+    path = tmp_path / "misto.bin"
+    path.write_bytes(b"".join(os.urandom(512) + b"a" * 512 for _ in range(64)))
+
+    decision = CompressionPolicy().decide(path)
+
+    assert decision.method == zipfile.ZIP_DEFLATED
+    assert decision.level == 1
+
+
+def test_policy_threshold_is_configurable(sample_files):
+    policy = CompressionPolicy(store_threshold=2.0, fast_threshold=2.0)
+
+    assert not policy.decide(sample_files / "anexo.pdf").stored
+
+
+def test_policy_empty_file_is_stored(tmp_path):
+    (tmp_path / "vazio.pdf").touch()
+
+    decision = CompressionPolicy().decide(tmp_path / "vazio.pdf")
+
+    assert decision.stored
+    assert decision.reason == "arquivo vazio"
+
+
+def test_policy_samples_blocks_across_large_file(tmp_path):
+    """Arquivos maiores que a amostra são lidos apenas em blocos"""
+    path = tmp_path / "grande.pdf"
+    path.write_bytes(os.urandom(1_000_000))
+    policy = CompressionPolicy(block_size=1024, sample_blocks=4)
+
+    assert len(policy._read_sample(path)) == 4 * 1024
+
+
+@pytest.mark.parametrize(
+    "compressor_cls",
+    [ZipCompressor, lambda folder, policy: ParallelZipCompressor(folder, 2, 6, policy)],
+)
+def test_compressors_apply_and_record_policy(sample_files, compressor_cls):
+    """Testa que os dois compressores aplicam e registram as escolhas"""
+    compressor = compressor_cls(sample_files, CompressionPolicy())
+
+    compressor.create_zip("pdfs.zip", "pdf")
+    compressor.create_zip("csv.zip", "csv")
+
+    with zipfile.ZipFile(sample_files / "pdfs.zip") as archive:
+        assert archive.getinfo("anexo.pdf").compress_type == zipfile.ZIP_STORED
+        assert archive.testzip() is None
+    with zipfile.ZipFile(sample_files / "csv.zip") as archive:
+        info = archive.getinfo("tabela.csv")
+        assert info.compress_type == zipfile.ZIP_DEFLATED
+        assert info.compress_size < info.file_size / 10
+    assert list(compressor.decisions) == ["tabela.csv"]
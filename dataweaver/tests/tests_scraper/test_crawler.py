@@ -0,0 +1,192 @@
+from dataweaver.scraper.modules import (
+    CrawlingPDFScraper,
+    CrawlFrontier,
+    canonicalize_url,
+    RequestsHttpClient,
+    PooledHttpSession,
+    SinglePassPDFLinkExtractor,
+    AnchorPDFExtractionStrategy,
+    ParagraphPDFExtractionStrategy,
+    PDFProcessingService,
+)
+from dataweaver.scraper.modules.crawler import HostLimiter
+from dataweaver.errors import LinkPDFExtractionError
+
+from unittest.mock import Mock, patch
+import threading
+import time
+import pytest
+
+
+def make_scraper(**kwargs) -> CrawlingPDFScraper:
+    extractor = SinglePassPDFLinkExtractor(
+        [AnchorPDFExtractionStrategy("anexo"), ParagraphPDFExtractionStrategy("anexo")]
+    )
+    return CrawlingPDFScraper(
+        RequestsHttpClient(PooledHttpSession()), extractor, **kwargs
+    )
+
+
+# Testes para canonicalize_url
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        ("HTTP://Example.COM/a/", "http://example.com/a"),
+        ("https://example.com:443/a#topo", "https://example.com/a"),
+        ("http://example.com:8080", "http://example.com:8080/"),
+        ("http://example.com/A/B/?p=2", "http://example.com/A/B?p=2"),
+    ],
+)
+def test_canonicalize_url(url, expected):
+    """Testa fragmento, caixa do host, porta padrão e barra final"""
+    assert canonicalize_url(url) == expected
+
+
+def test_canonicalize_url_resolves_relative():
+    """Testa a resolução de links relativos"""
+    assert canonicalize_url("../b/", "http://example.com/a/c") == "http://example.com/b"
+
+
+# Testes para CrawlFrontier
+def test_frontier_deduplicates_and_bounds_depth():
+    """Testa deduplicação canônica e limite de profundidade"""
+    frontier = CrawlFrontier(max_depth=1)
+
+    assert frontier.add("http://example.com/a/")
+    assert not frontier.add("http://EXAMPLE.com/a#x")
+    assert frontier.add("http://example.com/b", depth=1, seed="http://example.com/a")
+    assert not frontier.add("http://example.com/c", depth=2)
+
+    first = frontier.pop()
+    assert (first.url, first.depth, first.seed) == (
+        "http://example.com/a",
+        0,
+        "http://example.com/a",
+    )
+    assert frontier.pop().seed == "http://example.com/a"
+    assert frontier.pop() is None
+
+
+# Testes para HostLimiter
+def test_host_limiter_bounds_concurrency_per_host():
+    """Testa que no máximo ``limit`` requisições por host rodam juntas"""
+    limiter = HostLimiter(2)
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work():
+        with limiter.slot("http://example.com/x"):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+
+
+# Testes para CrawlingPDFScraper
+def test_crawl_multiple_seeds_deduplicates(local_http_server):
+    """Testa a consolidação de várias páginas iniciais sem duplicatas"""
+    local_http_server.routes["/rn/1"] = (
+        200,
+        b'<a href="/files/Anexo_I.pdf">1</a><a href="/files/Anexo_II.pdf#p2">2</a>',
+    )
+    local_http_server.routes["/rn/2"] = (
+        200,
+        b'<a href="/files/Anexo_II.pdf">2</a><a href="/files/Anexo_III.pdf">3</a>',
+    )
+    scraper = make_scraper()
+
+    links = scraper.crawl(
+        [
+            local_http_server.url("/rn/1"),
+            local_http_server.url("/rn/2"),
+            local_http_server.url("/rn/2/"),
+        ]
+    )
+
+    assert sorted(links) == [
+        local_http_server.url(f"/files/Anexo_{n}.pdf") for n in ("I", "II", "III")
+    ]
+    assert sorted(local_http_server.requests) == ["/rn/1", "/rn/2"]
+
+
+def test_crawl_follows_sub_pages_up_to_depth(local_http_server):
+    """Testa que sub-páginas da página inicial são seguidas até max_depth"""
+    local_http_server.routes["/rn"] = (
+        200,
+        b'<a href="/rn?page=2">2</a><a href="/outro">fora</a><a href="/rn/a.pdf">x</a>',
+    )
+    local_http_server.routes["/rn?page=2"] = (
+        200,
+        b'<a href="/files/Anexo_2.pdf">2</a><a href="/rn/sub">sub</a>',
+    )
+    local_http_server.routes["/rn/sub"] = (200, b'<a href="/files/Anexo_3.pdf">3</a>')
+    scraper = make_scraper(max_depth=1)
+
+    links = scraper.get_pdf_links(local_http_server.url("/rn"))
+
+    assert links == [local_http_server.url("/files/Anexo_2.pdf")]
+    assert "/outro" not in local_http_server.requests
+    assert "/rn/sub" not in local_http_server.requests
+
+
+def test_crawl_follow_pattern(local_http_server):
+    """Testa que CRAWL_FOLLOW restringe os links seguidos"""
+    local_http_server.routes["/rn"] = (
+        200,
+        b'<a href="/rn/lista">lista</a><a href="/publicacoes/2">pub</a>',
+    )
+    local_http_server.routes["/publicacoes/2"] = (
+        200,
+        b'<a href="/files/Anexo_9.pdf">9</a>',
+    )
+    scraper = make_scraper(max_depth=2, follow_pattern=r"/publicacoes/\d+")
+
+    links = scraper.get_pdf_links(local_http_server.url("/rn"))
+
+    assert links == [local_http_server.url("/files/Anexo_9.pdf")]
+    assert "/rn/lista" not in local_http_server.requests
+
+
+def test_crawl_tolerates_failed_seed(local_http_server):
+    """Testa que uma página com falha não interrompe as demais"""
+    local_http_server.routes["/rn/ok"] = (200, b'<a href="/Anexo.pdf">1</a>')
+    scraper = make_scraper()
+
+    links = scraper.crawl(
+        [local_http_server.url("/rn/erro"), local_http_server.url("/rn/ok")]
+    )
+
+    assert links == [local_http_server.url("/Anexo.pdf")]
+
+
+def test_crawl_fails_when_all_seeds_fail(local_http_server):
+    """Testa que o crawl falha se nenhuma página inicial for processada"""
+    scraper = make_scraper()
+
+    with pytest.raises(LinkPDFExtractionError):
+        scraper.crawl([local_http_server.url("/erro")])
+
+
+def test_service_process_many_uses_crawl():
+    """Testa que o serviço consolida várias páginas via crawl"""
+    scraper = Mock(spec=CrawlingPDFScraper)
+    scraper.crawl.return_value = ["http://example.com/a.pdf"]
+    file_manager = Mock()
+    service = PDFProcessingService("out.zip", "pdf", scraper, file_manager, Mock())
+
+    with patch.object(service, "zip_compressor"):
+        service.process_many(["http://example.com/1", "http://example.com/2"])
+
+    scraper.crawl.assert_called_once_with(
+        ["http://example.com/1", "http://example.com/2"]
+    )
+    file_manager.save_file.assert_called_once_with("http://example.com/a.pdf")
@@ -96,3 +96,22 @@ def test_service_creation_integration(tmp_path):
     assert isinstance(service.scraper, PDFScraperInterface)
     assert isinstance(service.file_manager, FileManagerInterface)
     assert isinstance(service.zip_compressor, ZipCompressorInterface)
+
+
+def test_create_service_wires_max_workers(tmp_path):
+    """Garante que o número de workers configurado chega ao serviço."""
+    factory = DefaultPDFServiceFactory(tmp_path, "important", max_workers=6)
+    service = factory.create_service("output.zip", "pdf")
+
+    assert service.max_workers == 6
+
+
+def test_http_session_is_shared_between_components(tmp_path):
+    """Garante que cliente HTTP e downloader compartilham a mesma sessão."""
+    factory = DefaultPDFServiceFactory(tmp_path, "test")
+
+    client = factory.create_http_client()
+    file_manager = factory.create_file_manager()
+
+    assert client.session is factory.create_http_session()
+    assert file_manager.downloader.session is client.session
@@ -1,6 +1,17 @@
-from dataweaver.scraper.modules import FileDownloader, FileSaver, FileManager
+from dataweaver.scraper.modules import (
+    FileDownloader,
+    FileSaver,
+    FileManager,
+    PooledHttpSession,
+)
+from dataweaver.scraper.modules.file_manager import SavedFile, PartialDownload
+from dataweaver.utils import PDFStore
+
+import hashlib
+import os
 
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock
 from requests.exceptions import HTTPError
 
@@ -12,12 +23,14 @@ def test_file_downloader_success():
     mock_response.content = b"file content"
     mock_response.raise_for_status.return_value = None
 
-    with patch("requests.get", return_value=mock_response) as mock_get:
-        downloader = FileDownloader()
-        content = downloader.download_file("http://example.com/file.pdf")
+    mock_session = Mock()
+    mock_session.get.return_value = mock_response
+
+    downloader = FileDownloader(mock_session)
+    content = downloader.download_file("http://example.com/file.pdf")
 
-        assert content == b"file content"
-        mock_get.assert_called_once_with("http://example.com/file.pdf", stream=True)
+    assert content == b"file content"
+    mock_session.get.assert_called_once_with("http://example.com/file.pdf", stream=True)
 
 
 def test_file_downloader_http_error():
@@ -25,11 +38,12 @@ def test_file_downloader_http_error():
     mock_response = MagicMock()
     mock_response.raise_for_status.side_effect = HTTPError("404 Not Found")
 
-    with patch("requests.get", return_value=mock_response):
-        downloader = FileDownloader()
+    mock_session = Mock()
+    mock_session.get.return_value = mock_response
+    downloader = FileDownloader(mock_session)
 
-        with pytest.raises(HTTPError):
-            downloader.download_file("http://example.com/missing.pdf")
+    with pytest.raises(HTTPError):
+        downloader.download_file("http://example.com/missing.pdf")
 
 
 # Testes para FileSaver
@@ -54,6 +68,34 @@ def test_file_saver_invalid_filename(tmp_path):
         saver.save_file("/invalid/name", b"content")  # Caminho absoluto
 
 
+def test_file_saver_stream_computes_size_and_hash(tmp_path):
+    """Testa gravação em blocos com tamanho e hash calculados na escrita"""
+    saver = FileSaver(tmp_path)
+
+    saved = saver.save_stream("doc.pdf", iter([b"part1", b"part2"]))
+
+    assert saved.path == tmp_path / "doc.pdf"
+    assert saved.size == 10
+    assert saved.sha256 == hashlib.sha256(b"part1part2").hexdigest()
+    assert saved.path.read_bytes() == b"part1part2"
+
+
+def test_file_saver_stream_failure_keeps_previous_file(tmp_path):
+    """Testa que uma falha no meio do fluxo não trunca o arquivo existente"""
+    (tmp_path / "doc.pdf").write_bytes(b"old")
+    saver = FileSaver(tmp_path)
+
+    def broken_stream():
+        yield b"new"
+        raise ConnectionError("connection reset")
+
+    with pytest.raises(ConnectionError):
+        saver.save_stream("doc.pdf", broken_stream())
+
+    assert (tmp_path / "doc.pdf").read_bytes() == b"old"
+    assert list(tmp_path.iterdir()) == [tmp_path / "doc.pdf"]
+
+
 # Testes para FileManager
 def test_file_manager_default_dependencies(tmp_path):
     """Testa injeção de dependências padrão"""
@@ -77,17 +119,183 @@ def test_file_manager_custom_dependencies(tmp_path):
 
 def test_file_manager_save_file_success(tmp_path):
     """Testa fluxo completo bem-sucedido"""
-    mock_downloader = Mock()
-    mock_downloader.download_file.return_value = b"content"
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.status_code = 200
+    mock_response.headers = {"Content-Length": "7"}
+    mock_response.iter_content.return_value = iter([b"content"])
 
-    mock_saver = Mock()
-    mock_saver.save_file.return_value = tmp_path / "file.pdf"
+    mock_downloader = Mock()
+    mock_downloader.chunk_size = 1024
+    mock_downloader.open_stream.return_value = mock_response
 
     with patch("os.path.basename", return_value="file.pdf"):
-        manager = FileManager(tmp_path, mock_downloader, mock_saver)
+        manager = FileManager(tmp_path, mock_downloader)
         manager.save_file("http://example.com/file.pdf")
 
-        mock_downloader.download_file.assert_called_once_with(
-            "http://example.com/file.pdf"
-        )
-        mock_saver.save_file.assert_called_once_with("file.pdf", b"content")
+    url, partial = mock_downloader.open_stream.call_args.args
+    assert url == "http://example.com/file.pdf"
+    assert partial.path == tmp_path / "file.pdf"
+    saved = mock_downloader.remember.call_args.args[2]
+    assert saved == SavedFile(
+        tmp_path / "file.pdf", 7, hashlib.sha256(b"content").hexdigest()
+    )
+    assert list(tmp_path.iterdir()) == [tmp_path / "file.pdf"]
+
+
+def test_file_manager_skips_not_modified(tmp_path):
+    """Testa que uma resposta 304 mantém a cópia local sem transferência"""
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.status_code = 304
+
+    mock_downloader = Mock()
+    mock_downloader.open_stream.return_value = mock_response
+    mock_saver = Mock()
+
+    manager = FileManager(tmp_path, mock_downloader, mock_saver)
+    manager.save_file("http://example.com/file.pdf")
+
+    mock_saver.save_stream.assert_not_called()
+    mock_downloader.remember.assert_not_called()
+
+
+def test_file_manager_streams_to_disk(tmp_path):
+    """Testa que o download é gravado bloco a bloco no destino final"""
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.status_code = 200
+    mock_response.headers = {}
+    mock_response.iter_content.return_value = iter([b"abc", b"def"])
+
+    mock_session = Mock()
+    mock_session.get.return_value = mock_response
+
+    manager = FileManager(tmp_path, FileDownloader(mock_session, chunk_size=3))
+    manager.save_file("http://example.com/file.pdf")
+
+    mock_session.get.assert_called_once_with(
+        "http://example.com/file.pdf",
+        stream=True,
+        headers={"Accept-Encoding": "identity"},
+    )
+    mock_response.iter_content.assert_called_once_with(chunk_size=3)
+    assert (tmp_path / "file.pdf").read_bytes() == b"abcdef"
+    assert list(tmp_path.iterdir()) == [tmp_path / "file.pdf"]
+
+
+# Testes de retomada (Range)
+def test_file_manager_resumes_interrupted_download(local_http_server, tmp_path):
+    """Testa que a nova tentativa continua o .part com Range"""
+    body = bytes(range(256)) * 40
+    local_http_server.routes["/anexo.pdf"] = (200, body)
+    local_http_server.drop_after["/anexo.pdf"] = 4096
+
+    manager = FileManager(
+        tmp_path, FileDownloader(PooledHttpSession(), chunk_size=1024), max_attempts=2
+    )
+    manager.save_file(local_http_server.url("/anexo.pdf"))
+
+    assert (tmp_path / "anexo.pdf").read_bytes() == body
+    assert "Range" not in local_http_server.headers[0]
+    assert local_http_server.headers[1]["Range"] == "bytes=4096-"
+    assert list(tmp_path.iterdir()) == [tmp_path / "anexo.pdf"]
+
+
+def test_file_manager_keeps_part_for_next_run(local_http_server, tmp_path):
+    """Testa que uma execução interrompida é retomada na execução seguinte"""
+    body = b"x" * 5000
+    local_http_server.routes["/anexo.pdf"] = (200, body)
+    local_http_server.drop_after["/anexo.pdf"] = 1000
+    url = local_http_server.url("/anexo.pdf")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        FileManager(
+            tmp_path, FileDownloader(PooledHttpSession(), chunk_size=500)
+        ).save_file(url)
+
+    partial = PartialDownload(tmp_path / "anexo.pdf", url)
+    assert partial.part_path.stat().st_size == 1000
+    assert not (tmp_path / "anexo.pdf").exists()
+
+    FileManager(tmp_path, FileDownloader(PooledHttpSession())).save_file(url)
+
+    assert (tmp_path / "anexo.pdf").read_bytes() == body
+    assert local_http_server.headers[1]["Range"] == "bytes=1000-"
+    assert not partial.part_path.exists()
+    assert not partial.meta_path.exists()
+
+
+def test_partial_download_is_named_per_url(tmp_path):
+    """Testa que URLs com o mesmo nome de arquivo usam .part diferentes"""
+    first = PartialDownload(tmp_path / "anexo.pdf", "http://site/x/anexo.pdf")
+    second = PartialDownload(tmp_path / "anexo.pdf", "http://site/y/anexo.pdf")
+
+    assert first.part_path != second.part_path
+    assert first.meta_path != second.meta_path
+    assert first.part_path.name.startswith("anexo.pdf.")
+
+
+def test_file_manager_restarts_when_ranges_unsupported(local_http_server, tmp_path):
+    """Testa que sem Accept-Ranges o download recomeça do zero"""
+    body = b"y" * 3000
+    local_http_server.accept_ranges = False
+    local_http_server.routes["/anexo.pdf"] = (200, body)
+    local_http_server.drop_after["/anexo.pdf"] = 500
+
+    manager = FileManager(tmp_path, FileDownloader(PooledHttpSession()), max_attempts=2)
+    manager.save_file(local_http_server.url("/anexo.pdf"))
+
+    assert (tmp_path / "anexo.pdf").read_bytes() == body
+    assert "Range" not in local_http_server.headers[1]
+
+
+def test_file_manager_restarts_when_file_changed(local_http_server, tmp_path):
+    """Testa que um .part de outra versão do arquivo é descartado"""
+    local_http_server.routes["/anexo.pdf"] = (200, b"a" * 3000)
+    local_http_server.drop_after["/anexo.pdf"] = 500
+    url = local_http_server.url("/anexo.pdf")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        FileManager(tmp_path, FileDownloader(PooledHttpSession())).save_file(url)
+
+    local_http_server.routes["/anexo.pdf"] = (200, b"b" * 3000)
+    FileManager(tmp_path, FileDownloader(PooledHttpSession())).save_file(url)
+
+    assert (tmp_path / "anexo.pdf").read_bytes() == b"b" * 3000
+
+
+# Testes do armazenamento por conteúdo
+def test_file_manager_registers_download_in_store(local_http_server, tmp_path):
+    """Testa que o download vira alias de um objeto do armazenamento"""
+    local_http_server.routes["/anexo.pdf"] = (200, b"%PDF-1.4 corpo")
+    store = PDFStore(tmp_path / "store", tmp_path / "pdfs")
+    manager = FileManager(
+        store.folder, FileDownloader(PooledHttpSession()), store=store
+    )
+
+    manager.save_file(local_http_server.url("/anexo.pdf"))
+
+    sha256 = hashlib.sha256(b"%PDF-1.4 corpo").hexdigest()
+    assert store.lookup("anexo.pdf") == sha256
+    assert os.path.samefile(store.folder / "anexo.pdf", store.object_path(sha256))
+
+
+def test_file_manager_restores_from_store_before_download(tmp_path):
+    """Testa que a cópia guardada é restaurada antes do GET condicional"""
+    mock_response = MagicMock()
+    mock_response.__enter__.return_value = mock_response
+    mock_response.status_code = 304
+
+    mock_downloader = Mock()
+    mock_downloader.open_stream.return_value = mock_response
+    mock_store = Mock()
+    mock_store.restore.side_effect = (
+        lambda name: mock_downloader.open_stream.assert_not_called()
+    )
+
+    manager = FileManager(tmp_path, mock_downloader, store=mock_store)
+    manager.save_file("http://example.com/file.pdf")
+
+    mock_store.restore.assert_called_once_with("file.pdf")
+    mock_store.add.assert_not_called()
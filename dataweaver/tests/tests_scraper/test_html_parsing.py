@@ -0,0 +1,95 @@
+from dataweaver.scraper.modules import (
+    HtmlDocumentParser,
+    resolve_html_parser,
+    SinglePassPDFLinkExtractor,
+    AnchorPDFExtractionStrategy,
+    ParagraphPDFExtractionStrategy,
+    DefaultPDFServiceFactory,
+)
+from dataweaver.settings import config
+
+from unittest.mock import Mock, patch
+import dataclasses
+import pytest
+
+HTML = """
+<html><body>
+    <div><a href="/files/doc1.pdf">1</a></div>
+    <p>Texto <a href='doc2.pdf'>2</a> e <span data-href="doc3.pdf">3</span></p>
+    <table><tr><td><a href="doc4.pdf">4</a></td></tr></table>
+    <a href="other.pdf">x</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def extractor():
+    return SinglePassPDFLinkExtractor(
+        [AnchorPDFExtractionStrategy("doc"), ParagraphPDFExtractionStrategy("doc")]
+    )
+
+
+# Testes para resolve_html_parser
+def test_resolve_parser_auto_prefers_lxml():
+    """Testa que "auto" usa lxml quando instalado"""
+    with patch("importlib.util.find_spec", return_value=Mock()):
+        assert resolve_html_parser("auto") == "lxml"
+
+
+def test_resolve_parser_falls_back_without_lxml():
+    """Testa o recuo para html.parser quando o lxml não está instalado"""
+    with patch("importlib.util.find_spec", return_value=None):
+        assert resolve_html_parser("auto") == "html.parser"
+        assert resolve_html_parser("LXML") == "html.parser"
+
+
+def test_resolve_parser_keeps_explicit_choice():
+    """Testa que um backend explícito é respeitado"""
+    assert resolve_html_parser("html.parser") == "html.parser"
+
+
+# Testes para HtmlDocumentParser
+def test_parse_only_keeps_requested_tags(extractor):
+    """Testa que o modo parse-only monta só as tags pedidas e seus descendentes"""
+    soup = HtmlDocumentParser("html.parser", ("a", "p")).parse(HTML)
+
+    assert soup.find("div") is None
+    assert soup.find("table") is None
+    assert soup.find("span")["data-href"] == "doc3.pdf"
+
+
+def test_parse_only_returns_same_links(extractor):
+    """Testa que o modo parse-only não altera os links extraídos"""
+    full = HtmlDocumentParser("html.parser").parse(HTML)
+    restricted = HtmlDocumentParser("html.parser", extractor.tag_names).parse(HTML)
+
+    expected = extractor.extract(full, "http://example.com/")
+
+    assert sorted(extractor.extract(restricted, "http://example.com/")) == sorted(
+        expected
+    )
+    assert len(expected) == 4
+
+
+def test_extractor_tag_names_require_all_strategies(extractor):
+    """Testa que uma estratégia sem tags declaradas desativa o filtro"""
+    assert extractor.tag_names == ("a", "p")
+    assert SinglePassPDFLinkExtractor([Mock()]).tag_names == ()
+
+
+def test_factory_configures_document_parser(tmp_path, extractor):
+    """Testa que a fábrica aplica HTML_PARSER e HTML_PARSE_ONLY"""
+    factory = DefaultPDFServiceFactory(tmp_path, "doc")
+    scraper_config = dataclasses.replace(
+        config.scraper, html_parser="html.parser", parse_only=True
+    )
+
+    with patch.object(config, "scraper", scraper_config):
+        parser = factory.create_scraper().document_parser
+        assert parser.parser == "html.parser"
+        assert parser.tag_names == ("a", "p")
+
+    with patch.object(
+        config, "scraper", dataclasses.replace(scraper_config, parse_only=False)
+    ):
+        assert factory.create_document_parser(extractor).tag_names == ()
@@ -0,0 +1,100 @@
+from dataweaver.scraper.modules import (
+    HttpValidatorCache,
+    PooledHttpSession,
+    RequestsHttpClient,
+    FileDownloader,
+    FileManager,
+)
+
+import hashlib
+
+
+def test_cache_persists_entries_between_instances(tmp_path):
+    """Testa que os validadores sobrevivem entre execuções"""
+    cache = HttpValidatorCache(tmp_path)
+    cache.update("http://example.com/a.pdf", {"ETag": '"abc"'}, 3, "hash")
+
+    entry = HttpValidatorCache(tmp_path).get("http://example.com/a.pdf")
+
+    assert entry.etag == '"abc"'
+    assert entry.size == 3
+    assert entry.sha256 == "hash"
+
+
+def test_cache_ignores_responses_without_validators(tmp_path):
+    """Testa que respostas sem ETag/Last-Modified não são registradas"""
+    cache = HttpValidatorCache(tmp_path)
+    cache.update("http://example.com/a.pdf", {"ETag": '"abc"'}, 3, "hash")
+    cache.update("http://example.com/a.pdf", {}, 3, "hash")
+
+    assert cache.get("http://example.com/a.pdf") is None
+
+
+def test_conditional_headers_require_matching_local_copy(tmp_path):
+    """Testa que os validadores só são enviados com cópia local íntegra"""
+    cache = HttpValidatorCache(tmp_path / "cache")
+    local = tmp_path / "a.pdf"
+    cache.update(
+        "http://example.com/a.pdf",
+        {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        3,
+        "hash",
+    )
+
+    assert cache.conditional_headers("http://example.com/a.pdf", local) == {}
+
+    local.write_bytes(b"truncated-or-changed")
+    assert cache.conditional_headers("http://example.com/a.pdf", local) == {}
+
+    local.write_bytes(b"abc")
+    assert cache.conditional_headers("http://example.com/a.pdf", local) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+
+
+def test_file_manager_skips_unchanged_download(local_http_server, tmp_path):
+    """Testa que a segunda execução recebe 304 e não transfere o PDF"""
+    local_http_server.routes["/anexo.pdf"] = (200, b"%PDF-content")
+    pdfs_dir = tmp_path / "pdfs"
+    pdfs_dir.mkdir()
+    cache = HttpValidatorCache(tmp_path / "cache")
+    url = local_http_server.url("/anexo.pdf")
+
+    for _ in range(2):
+        downloader = FileDownloader(PooledHttpSession(), cache=cache)
+        FileManager(pdfs_dir, downloader).save_file(url)
+
+    assert "If-None-Match" not in local_http_server.headers[0]
+    assert "If-None-Match" in local_http_server.headers[1]
+    assert (pdfs_dir / "anexo.pdf").read_bytes() == b"%PDF-content"
+    assert cache.get(url).sha256 == hashlib.sha256(b"%PDF-content").hexdigest()
+
+
+def test_file_manager_refetches_when_content_changes(local_http_server, tmp_path):
+    """Testa que um arquivo alterado no servidor é baixado novamente"""
+    local_http_server.routes["/anexo.pdf"] = (200, b"v1")
+    cache = HttpValidatorCache(tmp_path / "cache")
+    manager = FileManager(tmp_path, FileDownloader(PooledHttpSession(), cache=cache))
+    url = local_http_server.url("/anexo.pdf")
+
+    manager.save_file(url)
+    local_http_server.routes["/anexo.pdf"] = (200, b"v2")
+    manager.save_file(url)
+
+    assert (tmp_path / "anexo.pdf").read_bytes() == b"v2"
+
+
+def test_http_client_serves_cached_page_on_304(local_http_server, tmp_path):
+    """Testa que a página HTML é servida do cache quando não modificada"""
+    local_http_server.routes["/page"] = (200, "<html>página</html>".encode())
+    client = RequestsHttpClient(
+        PooledHttpSession(), HttpValidatorCache(tmp_path / "cache")
+    )
+
+    first = client.fetch_html(local_http_server.url("/page"))
+    second = client.fetch_html(local_http_server.url("/page"))
+
+    assert first == second
+    assert "If-None-Match" in local_http_server.headers[1]
+    assert len(local_http_server.requests) == 2
@@ -0,0 +1,43 @@
+from dataweaver.scraper.modules import PooledHttpSession
+from dataweaver.settings import config
+
+from dataclasses import replace
+from unittest.mock import patch
+
+
+def test_session_mounts_pooled_adapter():
+    """Testa que o adaptador com pool é montado para http e https"""
+    session = PooledHttpSession(pool_size=7)
+
+    for prefix in ("http://", "https://"):
+        adapter = session.get_adapter(f"{prefix}example.com")
+        assert adapter._pool_connections == 7
+        assert adapter._pool_maxsize == 7
+
+
+def test_session_applies_default_timeout():
+    """Testa que o timeout padrão é aplicado quando omitido"""
+    session = PooledHttpSession(connect_timeout=2, read_timeout=20)
+
+    with patch("requests.Session.request") as mock_request:
+        session.get("http://example.com")
+        session.get("http://example.com", timeout=1)
+
+    assert mock_request.call_args_list[0].kwargs["timeout"] == (2, 20)
+    assert mock_request.call_args_list[1].kwargs["timeout"] == 1
+
+
+def test_session_without_keep_alive_closes_connections():
+    """Testa que keep_alive=False envia Connection: close"""
+    assert PooledHttpSession(keep_alive=False).headers["Connection"] == "close"
+    assert PooledHttpSession().headers["Connection"] == "keep-alive"
+
+
+def test_session_from_config_respects_min_pool_size():
+    """Testa que o pool cobre o número de workers de download"""
+    http_config = replace(config.http, pool_size=4, connect_timeout=1, read_timeout=3)
+
+    session = PooledHttpSession.from_config(http_config, min_pool_size=8)
+
+    assert session.pool_size == 8
+    assert session.timeout == (1, 3)
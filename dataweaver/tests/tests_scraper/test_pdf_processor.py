@@ -3,8 +3,15 @@ from dataweaver.scraper.modules.interfaces import (
     FileManagerInterface,
     ZipCompressorInterface,
 )
-from dataweaver.scraper.modules import PDFProcessingService
+from dataweaver.scraper.modules import (
+    PDFProcessingService,
+    FileManager,
+    ParallelZipCompressor,
+)
+from dataweaver.pipeline import CleanupManager
+from dataweaver.utils import PDFStore
 
+import zipfile
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -134,3 +141,108 @@ def test_process_with_zip_creation_error(mock_components):
     mock_logger.critical.assert_called_once_with(
         "Falha crítica no processamento: Zip creation failed"
     )
+
+
+def test_process_concurrent_downloads_isolate_errors(mock_components):
+    """Testa o modo concorrente com falha isolada e resumo determinístico"""
+    links = [f"http://example.com/pdf{i}.pdf" for i in range(5)]
+    mock_components["scraper"].get_pdf_links.return_value = list(reversed(links))
+
+    def save_file(link):
+        if link.endswith("pdf3.pdf"):
+            raise Exception("Download failed")
+
+    mock_components["file_manager"].save_file.side_effect = save_file
+
+    service = PDFProcessingService(
+        zip_name="output.zip", file_extension="pdf", max_workers=3, **mock_components
+    )
+
+    with patch("dataweaver.scraper.modules.pdf_processor.logger") as mock_logger:
+        service.process("http://example.com")
+
+    assert mock_components["file_manager"].save_file.call_count == 5
+    mock_components["zip_compressor"].create_zip.assert_called_once()
+    mock_logger.error.assert_called_once_with(
+        "Falha no download: http://example.com/pdf3.pdf - Erro: Download failed"
+    )
+    assert service.summary.succeeded == [links[0], links[1], links[2], links[4]]
+    assert service.summary.failed == {links[3]: "Download failed"}
+
+
+def test_process_sequential_by_default(mock_components):
+    """Testa que o serviço mantém o download sequencial por padrão"""
+    mock_components["scraper"].get_pdf_links.return_value = [
+        "http://example.com/pdf1.pdf",
+        "http://example.com/pdf2.pdf",
+    ]
+
+    service = PDFProcessingService(
+        zip_name="output.zip", file_extension="pdf", **mock_components
+    )
+
+    with patch(
+        "dataweaver.scraper.modules.pdf_processor.ThreadPoolExecutor"
+    ) as mock_executor:
+        service.process("http://example.com")
+
+    mock_executor.assert_not_called()
+    assert service.summary.failed == {}
+
+
+def test_zip_only_holds_pdfs_of_the_current_run(local_http_server, tmp_path):
+    """Com o armazenamento de PDFs, PDFs que saíram da página saem do ZIP"""
+    pdfs_dir = tmp_path / "pdfs"
+    for name in ("a", "b", "c"):
+        local_http_server.routes[f"/{name}.pdf"] = (200, f"%PDF-{name}".encode())
+
+    def run(names):
+        store = PDFStore(tmp_path / "store", pdfs_dir)
+        scraper = MagicMock(spec=PDFScraperInterface)
+        scraper.get_pdf_links.return_value = [
+            local_http_server.url(f"/{name}.pdf") for name in names
+        ]
+        service = PDFProcessingService(
+            zip_name="pdfs.zip",
+            file_extension="pdf",
+            scraper=scraper,
+            file_manager=FileManager(pdfs_dir, store=store),
+            zip_compressor=ParallelZipCompressor(pdfs_dir, incremental=True),
+        )
+        service.process("http://example.com")
+
+        cleanup = CleanupManager()
+        cleanup.pdfs_dir, cleanup.store_dir = pdfs_dir, tmp_path / "store"
+        cleanup.store_enabled, cleanup.store_max_bytes = True, 0
+        cleanup.run()
+        with zipfile.ZipFile(pdfs_dir / "pdfs.zip") as archive:
+            return sorted(archive.namelist())
+
+    assert run(["a", "b"]) == ["a.pdf", "b.pdf"]
+    assert run(["b", "c"]) == ["b.pdf", "c.pdf"]
+
+
+def test_concurrent_downloads_with_same_filename(local_http_server, tmp_path):
+    """Testa que URLs com o mesmo nome de arquivo não misturam os corpos"""
+    bodies = {"/x/anexo.pdf": b"x" * 300_000, "/y/anexo.pdf": b"y" * 300_000}
+    for route, body in bodies.items():
+        local_http_server.routes[route] = (200, body)
+
+    for _ in range(5):
+        scraper = MagicMock(spec=PDFScraperInterface)
+        scraper.get_pdf_links.return_value = [
+            local_http_server.url(route) for route in bodies
+        ]
+        service = PDFProcessingService(
+            zip_name="pdfs.zip",
+            file_extension="pdf",
+            scraper=scraper,
+            file_manager=FileManager(tmp_path),
+            zip_compressor=MagicMock(spec=ZipCompressorInterface),
+            max_workers=2,
+        )
+        service.process("http://example.com")
+
+        assert service.summary.failed == {}
+        assert (tmp_path / "anexo.pdf").read_bytes() in bodies.values()
+        assert list(tmp_path.iterdir()) == [tmp_path / "anexo.pdf"]
@@ -3,7 +3,9 @@ from dataweaver.scraper.modules import (
     AnchorPDFExtractionStrategy,
     ParagraphPDFExtractionStrategy,
     PDFLinkExtractor,
+    SinglePassPDFLinkExtractor,
     RequestsPDFScraper,
+    PooledHttpSession,
 )
 
 from unittest.mock import Mock, patch, MagicMock
@@ -18,12 +20,20 @@ def test_http_client_success():
     mock_response.text = "<html>content</html>"
     mock_response.raise_for_status.return_value = None
 
-    with patch("requests.get", return_value=mock_response) as mock_get:
-        client = RequestsHttpClient()
-        result = client.fetch_html("http://example.com")
+    mock_session = Mock()
+    mock_session.get.return_value = mock_response
 
-        assert result == "<html>content</html>"
-        mock_get.assert_called_once_with("http://example.com", timeout=10)
+    client = RequestsHttpClient(mock_session)
+    result = client.fetch_html("http://example.com")
+
+    assert result == "<html>content</html>"
+    mock_session.get.assert_called_once_with("http://example.com")
+
+
+def test_http_client_default_session():
+    """Testa que o cliente cria uma sessão com pool quando nenhuma é injetada"""
+    client = RequestsHttpClient()
+    assert isinstance(client.session, PooledHttpSession)
 
 
 # Testes para AnchorPDFExtractionStrategy
@@ -112,6 +122,58 @@ def test_link_extractor_combines_strategies():
     mock_strategy2.extract.assert_called_once()
 
 
+def test_single_pass_extractor_matches_per_strategy_extractor():
+    """Testa que a varredura única retorna os mesmos links das estratégias isoladas"""
+    html = """
+    <html>
+        <a href="/files/doc1.pdf">1</a>
+        <a href="/files/DOC2.PDF?a=1&b=2">2</a>
+        <a href="/files/other.pdf">3</a>
+        <p>Texto <a href='doc3.pdf'>3</a> e <span data-href="doc4.pdf">4</span>
+            <p>Aninhado <a href="doc5.pdf">5</a></p>
+        </p>
+        <p>Sem links</p>
+        <div><a href="doc6.pdf">6</a></div>
+    </html>
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    strategies = [
+        AnchorPDFExtractionStrategy("doc"),
+        ParagraphPDFExtractionStrategy("doc"),
+    ]
+
+    expected = PDFLinkExtractor(strategies).extract(soup, "http://example.com/")
+    links = SinglePassPDFLinkExtractor(strategies).extract(soup, "http://example.com/")
+
+    assert sorted(links) == sorted(expected)
+    assert "http://example.com/doc4.pdf" in links
+    assert "http://example.com/doc5.pdf" in links
+
+
+def test_single_pass_extractor_traverses_once_and_runs_fallback():
+    """Testa que as tags são buscadas uma vez e estratégias sem hooks usam extract"""
+    soup = BeautifulSoup('<p><a href="doc.pdf">x</a></p>', "html.parser")
+    fallback = Mock()
+    fallback.extract.return_value = {"http://example.com/extra.pdf"}
+    extractor = SinglePassPDFLinkExtractor(
+        [
+            AnchorPDFExtractionStrategy("doc"),
+            ParagraphPDFExtractionStrategy("doc"),
+            fallback,
+        ]
+    )
+
+    with patch.object(soup, "find_all", wraps=soup.find_all) as find_all:
+        links = extractor.extract(soup, "http://example.com/")
+
+    find_all.assert_called_once_with(["a", "p"])
+    fallback.extract.assert_called_once_with(soup, "http://example.com/")
+    assert sorted(links) == [
+        "http://example.com/doc.pdf",
+        "http://example.com/extra.pdf",
+    ]
+
+
 # Testes para RequestsPDFScraper
 def test_pdf_scraper_success_flow():
     """Testa fluxo completo do scraper"""
@@ -0,0 +1,206 @@
+from dataweaver.scraper.modules import (
+    PooledHttpSession,
+    AsyncHttpSession,
+    RetryPolicy,
+    AdaptiveConcurrencyLimiter,
+)
+from dataweaver.scraper.modules.rate_control import parse_retry_after
+
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+import threading
+import asyncio
+import io
+import requests
+import pytest
+
+
+# Testes para parse_retry_after
+def test_parse_retry_after_seconds_and_date():
+    """Testa os dois formatos de Retry-After"""
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert parse_retry_after("12") == 12
+    assert 25 < parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+    assert parse_retry_after("amanhã") is None
+    assert parse_retry_after(None) is None
+
+
+# Testes para RetryPolicy
+def test_retry_policy_full_jitter_bounds():
+    """Testa que o backoff fica entre 0 e base * 2**n (limitado a backoff_max)"""
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+    with patch("random.uniform", side_effect=lambda a, b: b) as uniform:
+        assert policy.delay(0) == 1
+        assert policy.delay(2) == 4
+        assert policy.delay(10) == 5
+    assert uniform.call_args.args[0] == 0
+
+
+def test_retry_policy_prefers_retry_after():
+    """Testa que o Retry-After do servidor tem precedência (com teto)"""
+    policy = RetryPolicy(backoff_max=10)
+
+    assert policy.delay(0, "3") == 3
+    assert policy.delay(0, "120") == 10
+
+
+def test_retry_policy_only_idempotent_methods():
+    """Testa que apenas métodos idempotentes são repetidos"""
+    policy = RetryPolicy(max_retries=2)
+
+    assert policy.should_retry("get", 1)
+    assert not policy.should_retry("GET", 2)
+    assert not policy.should_retry("POST", 0)
+
+
+# Testes para AdaptiveConcurrencyLimiter
+def test_limiter_multiplicative_decrease_with_cooldown():
+    """Testa a redução multiplicativa, espaçada pelo cooldown"""
+    limiter = AdaptiveConcurrencyLimiter(maximum=8, cooldown=60)
+
+    limiter.on_overload("HTTP 503")
+    limiter.on_overload("HTTP 503")  # Mesma rajada: ignorado
+
+    assert limiter.limit == 4
+
+
+def test_limiter_additive_increase():
+    """Testa que uma janela de respostas rápidas libera uma vaga"""
+    limiter = AdaptiveConcurrencyLimiter(maximum=8, initial=4)
+
+    for _ in range(4):
+        limiter.on_success(0.1)
+
+    assert limiter.limit == 5
+
+
+def test_limiter_latency_target_triggers_decrease():
+    """Testa que latência acima do alvo reduz o limite"""
+    limiter = AdaptiveConcurrencyLimiter(maximum=8, latency_target=1.0)
+
+    limiter.on_success(2.5)
+
+    assert limiter.limit == 4
+
+
+def test_limiter_blocks_above_limit():
+    """Testa que o slot bloqueia enquanto o limite está ocupado"""
+    limiter = AdaptiveConcurrencyLimiter(maximum=1)
+    entered = threading.Event()
+
+    def worker():
+        with limiter.slot():
+            entered.set()
+
+    with limiter.slot():
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not entered.wait(timeout=0.05)
+    assert entered.wait(timeout=1)
+    thread.join()
+
+
+# Integração com as sessões HTTP
+def test_session_retries_throttled_responses(local_http_server):
+    """Testa novas tentativas em 429/503 respeitando o Retry-After"""
+    local_http_server.routes["/anexo.pdf"] = (200, b"pdf")
+    local_http_server.fail_next["/anexo.pdf"] = [
+        (429, {"Retry-After": "2"}),
+        (503, {}),
+    ]
+    sleep = Mock()
+    limiter = AdaptiveConcurrencyLimiter(maximum=4, cooldown=0)
+    session = PooledHttpSession(
+        retry_policy=RetryPolicy(max_retries=3, sleep=sleep), limiter=limiter
+    )
+
+    response = session.get(local_http_server.url("/anexo.pdf"))
+
+    assert response.status_code == 200
+    assert response.content == b"pdf"
+    assert len(local_http_server.requests) == 3
+    assert sleep.call_args_list[0].args == (2,)
+    assert limiter.limit == 2  # 4 -> 2 -> 1 nas falhas, +1 após o sucesso
+
+
+def _streamed_response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+def test_session_limits_concurrent_streamed_bodies():
+    """Testa que a vaga só é liberada ao consumir ou fechar o corpo em stream"""
+    limiter = AdaptiveConcurrencyLimiter(maximum=2)
+    session = PooledHttpSession(limiter=limiter)
+    third_started = threading.Event()
+
+    def third_download():
+        with session.get("http://example.com/c.pdf", stream=True):
+            third_started.set()
+
+    with patch(
+        "requests.Session.request",
+        side_effect=lambda *args, **kwargs: _streamed_response(b"pdf"),
+    ):
+        first = session.get("http://example.com/a.pdf", stream=True)
+        second = session.get("http://example.com/b.pdf", stream=True)
+        assert limiter.active == 2  # Cabeçalhos recebidos, corpos pendentes
+
+        thread = threading.Thread(target=third_download)
+        thread.start()
+        assert not third_started.wait(timeout=0.05)
+
+        assert b"".join(first.iter_content(2)) == b"pdf"
+        assert third_started.wait(timeout=1)
+        thread.join()
+
+        second.close()
+        second.close()  # Fechar de novo não libera outra vaga
+        assert limiter.active == 0
+
+
+def test_session_returns_last_response_when_retries_exhausted(local_http_server):
+    """Testa que, esgotadas as tentativas, a última resposta é retornada"""
+    local_http_server.fail_next["/x"] = [(503, {})] * 3
+    session = PooledHttpSession(retry_policy=RetryPolicy(max_retries=1, sleep=Mock()))
+
+    response = session.get(local_http_server.url("/x"))
+
+    assert response.status_code == 503
+    assert len(local_http_server.requests) == 2
+
+
+def test_session_retries_connection_errors():
+    """Testa novas tentativas em falhas de conexão"""
+    session = PooledHttpSession(retry_policy=RetryPolicy(max_retries=2, sleep=Mock()))
+    ok = Mock(status_code=200)
+
+    with patch(
+        "requests.Session.request",
+        side_effect=[requests.ConnectionError("reset"), ok],
+    ) as request:
+        assert session.get("http://example.com") is ok
+
+    assert request.call_count == 2
+
+
+def test_async_session_retries_throttled_responses(local_http_server):
+    """Testa novas tentativas na sessão assíncrona"""
+    local_http_server.routes["/p"] = (200, b"ok")
+    local_http_server.fail_next["/p"] = [(503, {"Retry-After": "0"})]
+
+    async def fetch():
+        session = AsyncHttpSession(retry_policy=RetryPolicy(max_retries=2))
+        try:
+            async with session.get(local_http_server.url("/p")) as response:
+                return response.status, await response.read()
+        finally:
+            await session.close()
+
+    assert asyncio.run(fetch()) == (200, b"ok")
+    assert len(local_http_server.requests) == 2
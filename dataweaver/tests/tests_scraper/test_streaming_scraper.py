@@ -0,0 +1,128 @@
+from dataweaver.scraper.modules import (
+    StreamingPDFLinkParser,
+    StreamingPDFScraper,
+    SinglePassPDFLinkExtractor,
+    AnchorPDFExtractionStrategy,
+    ParagraphPDFExtractionStrategy,
+    PDFProcessingService,
+    PooledHttpSession,
+    DefaultPDFServiceFactory,
+)
+from dataweaver.scraper.modules.interfaces import StreamingPDFScraperInterface
+from dataweaver.errors import LinkPDFExtractionError
+from dataweaver.settings import config
+
+from unittest.mock import Mock, patch
+from bs4 import BeautifulSoup
+import dataclasses
+import threading
+import pytest
+
+HTML = """
+<html><body>
+    <a href="/files/doc1.pdf">1</a>
+    <a href="/files/DOC2.PDF?a=1&amp;b=2">2</a>
+    <a href="/files/other.pdf">x</a>
+    <p class="lista">Texto <a href='doc3.pdf'>3</a> e <span data-href="doc4.pdf">4</span>
+        <p>Aninhado <a href="doc5.pdf">5</a> href=doc6.pdf</p>
+        <!-- href="doc7.pdf" -->
+    </p>
+    <div><a href="doc1.pdf">repetido</a></div>
+</body></html>
+"""
+
+
+def test_streaming_parser_matches_tree_extractor():
+    """Testa que o parser incremental emite os mesmos links da árvore completa"""
+    extractor = SinglePassPDFLinkExtractor(
+        [AnchorPDFExtractionStrategy("doc"), ParagraphPDFExtractionStrategy("doc")]
+    )
+    expected = extractor.extract(
+        BeautifulSoup(HTML, "html.parser"), "http://example.com/"
+    )
+
+    parser = StreamingPDFLinkParser("doc", "http://example.com/")
+    links = []
+    for char in HTML:  # Pior caso: um caractere por bloco
+        parser.feed(char)
+        links.extend(parser.pop_links())
+    parser.close()
+    links.extend(parser.pop_links())
+
+    assert sorted(links) == sorted(expected)
+    assert len(links) == len(set(links))
+
+
+def test_streaming_scraper_fetches_page_in_chunks(local_http_server):
+    """Testa a leitura da página em blocos a partir de um servidor HTTP"""
+    local_http_server.routes["/lista"] = (200, HTML.encode("utf-8"))
+    scraper = StreamingPDFScraper("doc", PooledHttpSession(), chunk_size=16)
+
+    links = scraper.get_pdf_links(local_http_server.url("/lista"))
+
+    assert local_http_server.url("/files/doc1.pdf") in links
+    assert local_http_server.url("/doc7.pdf") in links
+    assert len(links) == len(set(links))
+
+
+def test_streaming_scraper_wraps_errors(local_http_server):
+    """Testa que falhas HTTP viram LinkPDFExtractionError"""
+    scraper = StreamingPDFScraper("doc", PooledHttpSession())
+
+    with pytest.raises(LinkPDFExtractionError):
+        list(scraper.iter_pdf_links(local_http_server.url("/inexistente")))
+
+
+def test_service_starts_downloads_before_page_ends(tmp_path):
+    """Testa que o primeiro download começa antes de a página terminar"""
+    first_download = threading.Event()
+
+    def iter_links(url):
+        yield "http://example.com/a.pdf"
+        # A página só "termina" depois que o download do primeiro link começou
+        assert first_download.wait(timeout=5)
+        yield "http://example.com/b.pdf"
+        yield "http://example.com/a.pdf"
+
+    scraper = Mock(spec=StreamingPDFScraperInterface)
+    scraper.iter_pdf_links.side_effect = iter_links
+    file_manager = Mock()
+    file_manager.save_file.side_effect = lambda link: first_download.set()
+
+    service = PDFProcessingService(
+        "out.zip", "pdf", scraper, file_manager, Mock(), max_workers=2
+    )
+    with patch.object(service, "zip_compressor"):
+        service.process("http://example.com")
+
+    assert service.summary.succeeded == [
+        "http://example.com/a.pdf",
+        "http://example.com/b.pdf",
+    ]
+    assert file_manager.save_file.call_count == 2
+
+
+def test_factory_creates_streaming_scraper(tmp_path):
+    """Testa que SCRAPER_STREAMING seleciona o scraper incremental"""
+    factory = DefaultPDFServiceFactory(tmp_path, "doc")
+    scraper_config = dataclasses.replace(config.scraper, streaming=True)
+
+    with patch.object(config, "scraper", scraper_config):
+        scraper = factory.create_scraper()
+
+    assert isinstance(scraper, StreamingPDFScraper)
+    assert scraper.session is factory.create_http_session()
+
+
+def test_factory_warns_when_streaming_ignores_crawl(tmp_path):
+    """Testa o aviso quando CRAWL_DEPTH é combinado com SCRAPER_STREAMING"""
+    factory = DefaultPDFServiceFactory(tmp_path, "doc")
+    scraper_config = dataclasses.replace(config.scraper, streaming=True, crawl_depth=2)
+
+    with patch.object(config, "scraper", scraper_config), patch(
+        "dataweaver.scraper.modules.factories.logger"
+    ) as mock_logger:
+        factory.create_scraper()
+
+    (message,) = mock_logger.warning.call_args.args
+    assert "CRAWL_DEPTH" in message
@@ -1,10 +1,21 @@
 from dataweaver.scraper.modules import (
     ZipCompressor,
+    ParallelZipCompressor,
     ValidationZipCompressor,
+    LoggingZipCompressor,
+    RawZipWriter,
+    ZipMember,
+    deflate_file,
 )
+from dataweaver.scraper.modules.zip_writer import compress_file, dos_date_time
+
+import zipfile
+import zlib
+import io
+import os
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 
 # Testes para ZipCompressor
@@ -45,3 +56,182 @@ def test_validation_decorator_failure():
         decorator.create_zip("invalid", "pdf")
 
     mock_compressor.create_zip.assert_not_called()
+
+
+# Testes para ParallelZipCompressor
+def write_sample_files(folder, count=6):
+    contents = {}
+    for i in range(count):
+        data = (f"linha {i};" * 5000).encode() + os.urandom(1000)
+        (folder / f"file{i}.pdf").write_bytes(data)
+        contents[f"file{i}.pdf"] = data
+    (folder / "ignore.txt").write_text("fora do zip")
+    return contents
+
+
+def test_parallel_zip_compressor_creates_standard_zip(tmp_path):
+    """Testa que o ZIP gerado em paralelo é lido pelo zipfile"""
+    contents = write_sample_files(tmp_path)
+
+    ParallelZipCompressor(tmp_path, max_workers=3).create_zip("saida.zip", "pdf")
+
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.testzip() is None
+        assert sorted(archive.namelist()) == sorted(contents)
+        for info in archive.infolist():
+            assert info.compress_type == zipfile.ZIP_DEFLATED
+            assert info.compress_size < info.file_size
+            assert archive.read(info) == contents[info.filename]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_parallel_zip_compressor_matches_sequential(tmp_path):
+    """Testa que os dois modos produzem o mesmo conteúdo"""
+    write_sample_files(tmp_path)
+
+    ZipCompressor(tmp_path).create_zip("seq.zip", "pdf")
+    ParallelZipCompressor(tmp_path, max_workers=2).create_zip("par.zip", "pdf")
+
+    with zipfile.ZipFile(tmp_path / "seq.zip") as seq, zipfile.ZipFile(
+        tmp_path / "par.zip"
+    ) as par:
+        assert {i.filename: i.CRC for i in seq.infolist()} == {
+            i.filename: i.CRC for i in par.infolist()
+        }
+
+
+def test_parallel_zip_compressor_composes_with_decorators(tmp_path):
+    """Testa que os decorators continuam compondo com o modo paralelo"""
+    write_sample_files(tmp_path, count=2)
+    compressor = ValidationZipCompressor(
+        LoggingZipCompressor(ParallelZipCompressor(tmp_path))
+    )
+
+    compressor.create_zip("saida.zip", "pdf")
+
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert len(archive.namelist()) == 2
+
+
+def test_parallel_zip_compressor_failure_keeps_previous_zip(tmp_path):
+    """Testa que uma falha não substitui o ZIP anterior"""
+    write_sample_files(tmp_path, count=2)
+    (tmp_path / "saida.zip").write_bytes(b"anterior")
+    compressor = ParallelZipCompressor(tmp_path)
+
+    with patch(
+        "dataweaver.scraper.modules.zip_compressor.compress_file",
+        side_effect=OSError("disco"),
+    ):
+        with pytest.raises(OSError):
+            compressor.create_zip("saida.zip", "pdf")
+
+    assert (tmp_path / "saida.zip").read_bytes() == b"anterior"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+# Testes para RawZipWriter
+def test_raw_zip_writer_stored_and_unicode_members(tmp_path):
+    """Testa membros STORED e nomes não-ASCII"""
+    data = b"conteudo sem compressao"
+    member = ZipMember(
+        arcname="relatório.csv",
+        method=zipfile.ZIP_STORED,
+        crc=zlib.crc32(data),
+        file_size=len(data),
+        compress_size=len(data),
+        date_time=(2024, 5, 17, 10, 30, 12),
+    )
+    with open(tmp_path / "saida.zip", "wb") as output:
+        with RawZipWriter(output) as writer:
+            writer.write_member(member, io.BytesIO(data))
+
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        info = archive.getinfo("relatório.csv")
+        assert info.date_time == (2024, 5, 17, 10, 30, 12)
+        assert archive.read(info) == data
+
+
+def test_raw_zip_writer_rejects_duplicates(tmp_path):
+    source = tmp_path / "a.pdf"
+    source.write_bytes(b"abc")
+    member, data = deflate_file(source, "a.pdf")
+    writer = RawZipWriter(io.BytesIO())
+    with data:
+        writer.write_member(member, data)
+
+    with pytest.raises(ValueError, match="duplicado"):
+        writer.write_member(member, io.BytesIO())
+
+
+# Testes do modo incremental
+def test_incremental_zip_reuses_unchanged_members(tmp_path):
+    """Testa que só arquivos novos ou alterados são recomprimidos"""
+    contents = write_sample_files(tmp_path, count=3)
+    compressor = ParallelZipCompressor(tmp_path, max_workers=2, incremental=True)
+    compressor.create_zip("saida.zip", "pdf")
+    assert compressor.reused == []
+
+    (tmp_path / "file1.pdf").write_bytes(b"alterado" * 100)
+    (tmp_path / "file3.pdf").write_bytes(b"novo" * 100)
+    (tmp_path / "file2.pdf").unlink()
+    contents.update({"file1.pdf": b"alterado" * 100, "file3.pdf": b"novo" * 100})
+    del contents["file2.pdf"]
+
+    with patch(
+        "dataweaver.scraper.modules.zip_compressor.compress_file",
+        wraps=compress_file,
+    ) as mock_compress:
+        compressor.create_zip("saida.zip", "pdf")
+
+    assert compressor.reused == ["file0.pdf"]
+    assert sorted(call.args[1] for call in mock_compress.call_args_list) == [
+        "file1.pdf",
+        "file3.pdf",
+    ]
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.testzip() is None
+        assert {name: archive.read(name) for name in archive.namelist()} == contents
+
+
+def test_incremental_zip_checks_crc_when_only_mtime_changed(tmp_path):
+    """Testa que um arquivo apenas tocado é reaproveitado após conferir o CRC"""
+    write_sample_files(tmp_path, count=1)
+    compressor = ParallelZipCompressor(tmp_path, incremental=True)
+    compressor.create_zip("saida.zip", "pdf")
+    path = tmp_path / "file0.pdf"
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 3600))
+
+    compressor.create_zip("saida.zip", "pdf")
+
+    assert compressor.reused == ["file0.pdf"]
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.getinfo("file0.pdf").date_time == dos_date_time(
+            path.stat().st_mtime
+        )
+
+
+def test_incremental_zip_ignores_invalid_archive(tmp_path):
+    write_sample_files(tmp_path, count=2)
+    (tmp_path / "saida.zip").write_bytes(b"nao e um zip")
+    compressor = ParallelZipCompressor(tmp_path, incremental=True)
+
+    compressor.create_zip("saida.zip", "pdf")
+
+    assert compressor.reused == []
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert len(archive.namelist()) == 2
+
+
+def test_incremental_zip_reuses_members_written_by_zipfile(tmp_path):
+    """Testa a cópia bruta de membros de um ZIP gerado pelo modo sequencial"""
+    contents = write_sample_files(tmp_path, count=2)
+    ZipCompressor(tmp_path).create_zip("saida.zip", "pdf")
+    compressor = ParallelZipCompressor(tmp_path, incremental=True)
+
+    compressor.create_zip("saida.zip", "pdf")
+
+    assert sorted(compressor.reused) == ["file0.pdf", "file1.pdf"]
+    with zipfile.ZipFile(tmp_path / "saida.zip") as archive:
+        assert archive.testzip() is None
+        assert archive.read("file1.pdf") == contents["file1.pdf"]
@@ -1,4 +1,4 @@
-from dataweaver.utils import get_env_variable
+from dataweaver.utils import get_env_variable, get_env_flag, get_env_list
 
 import os
 from unittest.mock import patch
@@ -44,3 +44,36 @@ def test_get_env_variable_with_empty_default():
     with patch.dict(os.environ, {}, clear=True):
         result = get_env_variable("MISSING_VAR", "")
         assert result == ""
+
+
+def test_get_env_flag_parses_true_values():
+    """Testa valores reconhecidos como verdadeiros"""
+    for value in ("1", "true", "TRUE", "yes", "sim", "on"):
+        with patch.dict(os.environ, {"FLAG_VAR": value}):
+            assert get_env_flag("FLAG_VAR", False) is True
+
+
+def test_get_env_flag_parses_false_values():
+    """Testa que outros valores definidos são falsos"""
+    for value in ("0", "false", "no", "off"):
+        with patch.dict(os.environ, {"FLAG_VAR": value}):
+            assert get_env_flag("FLAG_VAR", True) is False
+
+
+def test_get_env_flag_returns_default_when_not_set():
+    """Testa o valor padrão quando a variável não está definida"""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_env_flag("MISSING_FLAG", True) is True
+        assert get_env_flag("MISSING_FLAG", False) is False
+
+
+def test_get_env_list_splits_items():
+    """Testa a separação por vírgulas, espaços e quebras de linha"""
+    with patch.dict(os.environ, {"LIST_VAR": "a, b\nc,,d"}):
+        assert get_env_list("LIST_VAR", []) == ["a", "b", "c", "d"]
+
+
+def test_get_env_list_returns_default_when_not_set():
+    """Testa a lista padrão quando a variável não está definida"""
+    with patch.dict(os.environ, {}, clear=True):
+        assert get_env_list("MISSING_LIST", ["x"]) == ["x"]
@@ -0,0 +1,120 @@
+from dataweaver.utils.interfaces import PDFStoreInterface
+from dataweaver.utils import PDFStore
+from dataweaver.utils.pdf_store import file_sha256
+
+import os
+
+
+def make_store(tmp_path, max_bytes=0):
+    return PDFStore(tmp_path / "store", tmp_path / "pdfs", max_bytes)
+
+
+def write_pdf(store, name, content):
+    path = store.folder / name
+    path.write_bytes(content)
+    return path
+
+
+def test_pdfstore_implements_interface():
+    assert issubclass(PDFStore, PDFStoreInterface)
+
+
+def test_add_deduplicates_identical_content(tmp_path):
+    """Arquivos idênticos com nomes diferentes ocupam espaço uma única vez"""
+    store = make_store(tmp_path)
+    first = write_pdf(store, "anexo_i.pdf", b"%PDF-mesmo")
+    second = write_pdf(store, "anexo_i_v2.pdf", b"%PDF-mesmo")
+
+    sha_first = store.add(first)
+    sha_second = store.add(second)
+
+    assert sha_first == sha_second == file_sha256(first)
+    assert os.path.samefile(first, second)
+    assert store.total_size == len(b"%PDF-mesmo")
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    """O despejo remove os objetos menos usados e seus aliases"""
+    store = make_store(tmp_path, max_bytes=10)
+    old = write_pdf(store, "antigo.pdf", b"a" * 6)
+    new = write_pdf(store, "novo.pdf", b"b" * 6)
+    old_sha = store.add(old)
+    store.add(new)
+    store.touch("novo.pdf")
+
+    removed = store.evict()
+
+    assert removed == [old_sha]
+    assert not old.exists()
+    assert new.exists()
+    assert store.total_size == 6
+    assert store.lookup("antigo.pdf") is None
+
+
+def test_evict_without_budget_keeps_everything(tmp_path):
+    store = make_store(tmp_path)
+    path = write_pdf(store, "anexo.pdf", b"conteudo")
+    store.add(path)
+
+    assert store.evict() == []
+    assert path.exists()
+
+
+def test_restore_recreates_deleted_alias(tmp_path):
+    """Um alias apagado da pasta de trabalho é recriado a partir do objeto"""
+    store = make_store(tmp_path)
+    path = write_pdf(store, "anexo.pdf", b"conteudo")
+    store.add(path)
+    path.unlink()
+
+    assert store.restore("anexo.pdf") is True
+    assert path.read_bytes() == b"conteudo"
+    assert store.restore("desconhecido.pdf") is False
+
+
+def test_clear_folder_keeps_objects(tmp_path):
+    """A pasta de trabalho é esvaziada, mas o conteúdo continua restaurável"""
+    store = make_store(tmp_path)
+    path = write_pdf(store, "anexo.pdf", b"conteudo")
+    sha256 = store.add(path)
+
+    assert store.clear_folder() == 1
+    assert not path.exists()
+    assert store.object_path(sha256).exists()
+    assert store.restore("anexo.pdf") is True
+
+
+def test_index_survives_reopening(tmp_path):
+    store = make_store(tmp_path)
+    sha256 = store.add(write_pdf(store, "anexo.pdf", b"conteudo"))
+
+    reopened = make_store(tmp_path)
+
+    assert reopened.lookup("anexo.pdf") == sha256
+    assert reopened.total_size == len(b"conteudo")
+
+
+def test_sync_adopts_untracked_and_changed_files(tmp_path):
+    store = make_store(tmp_path)
+    tracked = write_pdf(store, "anexo.pdf", b"v1")
+    store.add(tracked)
+    write_pdf(store, "solto.pdf", b"solto")
+    tracked.unlink()
+    write_pdf(store, "anexo.pdf", b"v2")
+
+    assert store.sync() == 2
+    assert store.sync() == 0
+    assert store.lookup("anexo.pdf") == file_sha256(tracked)
+
+
+def test_evict_drops_replaced_content(tmp_path):
+    """Conteúdo substituído por uma nova versão é removido sem afetar o alias"""
+    store = make_store(tmp_path)
+    path = write_pdf(store, "anexo.pdf", b"v1")
+    old_sha = store.add(path)
+    path.unlink()
+    write_pdf(store, "anexo.pdf", b"v2")
+    store.add(path)
+
+    assert store.evict() == [old_sha]
+    assert path.read_bytes() == b"v2"
@@ -1,5 +1,14 @@
 from .directory_exists import ensure_directory_exists
-from .get_env import get_env_variable
+from .get_env import get_env_variable, get_env_flag, get_env_list
 from .remove_pdfs import PDFRemove
+from .pdf_store import PDFStore, file_sha256
 
-__all__ = ["ensure_directory_exists", "get_env_variable", "PDFRemove"]
+__all__ = [
+    "ensure_directory_exists",
+    "get_env_variable",
+    "get_env_flag",
+    "get_env_list",
+    "PDFRemove",
+    "PDFStore",
+    "file_sha256",
+]
@@ -23,3 +23,45 @@ def get_env_variable(var_name: str, default: str) -> str:
         return default
 
     return value.strip()
+
+
+def get_env_flag(var_name: str, default: bool) -> bool:
+    """
+    Obtém uma variável de ambiente booleana.
+
+    Valores como "1", "true", "yes", "sim" e "on" (sem diferenciar maiúsculas) são
+    considerados verdadeiros; qualquer outro valor definido é falso.
+
+    Parâmetros:
+        var_name (str): Nome da variável de ambiente.
+        default (bool): Valor utilizado caso a variável não esteja definida ou esteja vazia.
+
+    Retorno:
+        bool: Valor interpretado da variável de ambiente.
+    """
+    value = get_env_variable(var_name, "")
+
+    if not value:
+        return default
+
+    return value.lower() in ("1", "true", "yes", "sim", "on")
+
+
+def get_env_list(var_name: str, default: list[str]) -> list[str]:
+    """
+    Obtém uma lista a partir de uma variável de ambiente.
+
+    Os itens podem ser separados por vírgulas, espaços ou quebras de linha;
+    itens vazios são descartados.
+
+    Parâmetros:
+        var_name (str): Nome da variável de ambiente.
+        default (list[str]): Lista utilizada caso a variável não esteja definida ou esteja vazia.
+
+    Retorno:
+        list[str]: Itens da variável de ambiente ou a lista padrão fornecida.
+    """
+    value = get_env_variable(var_name, "")
+    items = [item for item in value.replace(",", " ").split() if item]
+
+    return items or list(default)
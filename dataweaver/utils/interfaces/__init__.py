@@ -1,3 +1,3 @@
-from .base import PDFRemoveInterface
+from .base import PDFRemoveInterface, PDFStoreInterface
 
-__all__ = ["PDFRemoveInterface"]
+__all__ = ["PDFRemoveInterface", "PDFStoreInterface"]
@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class PDFRemoveInterface(ABC):
@@ -8,3 +12,22 @@ class PDFRemoveInterface(ABC):
     def remove_pdfs(self) -> None:
         """Remove todos os PDFs baixados durante o processamento."""
         pass
+
+
+class PDFStoreInterface(ABC):
+    """Interface para armazenamento local de PDFs entre execuções."""
+
+    @abstractmethod
+    def add(self, path: "Path", sha256: "str | None" = None) -> str:
+        """Registra um arquivo baixado e retorna o hash do seu conteúdo."""
+        pass
+
+    @abstractmethod
+    def restore(self, filename: str) -> bool:
+        """Disponibiliza novamente um arquivo guardado na pasta de trabalho."""
+        pass
+
+    @abstractmethod
+    def evict(self, max_bytes: "int | None" = None) -> list[str]:
+        """Remove os arquivos menos usados até caber no orçamento de espaço."""
+        pass
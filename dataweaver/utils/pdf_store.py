@@ -0,0 +1,253 @@
+from .interfaces import PDFStoreInterface
+from .directory_exists import ensure_directory_exists
+
+from typing import TYPE_CHECKING
+import threading
+import tempfile
+import hashlib
+import shutil
+import json
+import time
+import os
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Tamanho dos blocos lidos ao calcular o hash de arquivos já existentes
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: "Path") -> str:
+    """Calcula o SHA-256 de um arquivo lendo-o em blocos."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PDFStore(PDFStoreInterface):
+    """Armazenamento de PDFs endereçado por conteúdo (SHA-256) com despejo LRU.
+
+    Cada conteúdo é guardado uma única vez em ``root/objects/<sha[:2]>/<sha>``;
+    os nomes de arquivo na pasta de trabalho são aliases (hard links) para o
+    objeto, de modo que arquivos idênticos publicados com nomes diferentes
+    ocupam espaço uma única vez. Em sistemas sem suporte a hard links o
+    conteúdo é copiado.
+
+    Em vez de apagar todos os PDFs ao fim da execução, ``evict`` remove os
+    objetos menos usados recentemente até caber em ``max_bytes``; os demais
+    continuam disponíveis para a próxima execução. ``clear_folder`` esvazia a
+    pasta de trabalho sem apagar os objetos.
+
+    SOLID:
+        Single Responsibility Principle - foca apenas no armazenamento local
+    """
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, root: "Path", folder: "Path", max_bytes: int = 0) -> None:
+        """Inicializa o armazenamento.
+
+        Args:
+            root: Diretório dos objetos e do índice
+            folder: Pasta de trabalho onde os aliases ficam visíveis (PDFs)
+            max_bytes: Orçamento de espaço para ``evict`` (0 = sem limite)
+        """
+        self.root = root
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.objects_dir = root / "objects"
+        self.index_path = root / self.INDEX_NAME
+        self._lock = threading.RLock()
+
+        ensure_directory_exists(self.objects_dir)
+        ensure_directory_exists(self.folder)
+        self._objects, self._aliases = self._load()
+
+    @property
+    def total_size(self) -> int:
+        """Espaço ocupado pelos objetos (bytes, sem contar aliases)."""
+        with self._lock:
+            return sum(entry["size"] for entry in self._objects.values())
+
+    def object_path(self, sha256: str) -> "Path":
+        """Caminho do objeto com o hash informado."""
+        return self.objects_dir / sha256[:2] / sha256
+
+    def lookup(self, filename: str) -> "str | None":
+        """Retorna o hash associado ao nome de arquivo, se houver."""
+        with self._lock:
+            return self._aliases.get(filename)
+
+    def add(self, path: "Path", sha256: "str | None" = None) -> str:
+        """Registra um arquivo da pasta de trabalho no armazenamento.
+
+        Se o conteúdo já existir, o arquivo é substituído por um alias do
+        objeto existente; caso contrário, passa a ser o próprio objeto.
+
+        Args:
+            path: Arquivo dentro de ``folder``
+            sha256: (Opcional) Hash já calculado durante o download
+
+        Returns:
+            Hash SHA-256 do conteúdo
+        """
+        sha256 = sha256 or file_sha256(path)
+        blob = self.object_path(sha256)
+        with self._lock:
+            if blob.exists():
+                self._link(blob, path)
+            else:
+                ensure_directory_exists(blob.parent)
+                self._link(path, blob)
+            self._aliases[path.name] = sha256
+            self._objects[sha256] = {
+                "size": blob.stat().st_size,
+                "last_access": time.time(),
+            }
+            self._save()
+        return sha256
+
+    def touch(self, filename: str) -> bool:
+        """Marca o conteúdo associado ao nome como usado agora."""
+        with self._lock:
+            sha256 = self._aliases.get(filename)
+            if sha256 is None or sha256 not in self._objects:
+                return False
+            self._objects[sha256]["last_access"] = time.time()
+            self._save()
+            return True
+
+    def restore(self, filename: str) -> bool:
+        """Recria na pasta de trabalho um alias removido, a partir do objeto.
+
+        Returns:
+            True se o arquivo está disponível na pasta de trabalho
+        """
+        target = self.folder / filename
+        with self._lock:
+            sha256 = self._aliases.get(filename)
+            if sha256 is None or not self.object_path(sha256).exists():
+                return False
+            if not target.exists():
+                self._link(self.object_path(sha256), target)
+            self.touch(filename)
+            return True
+
+    def sync(self) -> int:
+        """Registra PDFs da pasta de trabalho ainda não controlados.
+
+        Returns:
+            Número de arquivos registrados
+        """
+        added = 0
+        for path in sorted(self.folder.glob("*.pdf")):
+            sha256 = self.lookup(path.name)
+            if sha256 in self._objects and self._holds(path, sha256):
+                continue
+            self.add(path)
+            added += 1
+        return added
+
+    def clear_folder(self) -> int:
+        """Remove os aliases da pasta de trabalho, mantendo os objetos guardados.
+
+        A pasta de trabalho fica apenas com os arquivos da execução corrente:
+        na próxima, ``restore`` recria somente os PDFs ainda publicados, e
+        arquivos antigos ou de outras páginas não vão parar no ZIP.
+
+        Returns:
+            Número de arquivos removidos da pasta de trabalho
+        """
+        removed = 0
+        with self._lock:
+            for filename, sha256 in self._aliases.items():
+                alias = self.folder / filename
+                if sha256 in self._objects and self._holds(alias, sha256):
+                    alias.unlink()
+                    removed += 1
+        return removed
+
+    def evict(self, max_bytes: "int | None" = None) -> list[str]:
+        """Remove objetos sem alias e, depois, os menos usados até caber no orçamento.
+
+        Os aliases de um objeto removido também são apagados da pasta de trabalho.
+
+        Args:
+            max_bytes: (Opcional) Orçamento; padrão ``self.max_bytes`` (0 = sem limite)
+
+        Returns:
+            Hashes dos objetos removidos
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        removed = []
+        with self._lock:
+            referenced = set(self._aliases.values())
+            for sha256 in [s for s in self._objects if s not in referenced]:
+                self._remove_object(sha256)
+                removed.append(sha256)
+
+            by_age = sorted(
+                self._objects, key=lambda s: self._objects[s]["last_access"]
+            )
+            for sha256 in by_age:
+                if not budget or self.total_size <= budget:
+                    break
+                self._remove_object(sha256)
+                removed.append(sha256)
+
+            self._save()
+        return removed
+
+    def _remove_object(self, sha256: str) -> None:
+        for filename in [n for n, s in self._aliases.items() if s == sha256]:
+            alias = self.folder / filename
+            if self._holds(alias, sha256):
+                alias.unlink()
+            del self._aliases[filename]
+        self.object_path(sha256).unlink(missing_ok=True)
+        self._objects.pop(sha256, None)
+
+    def _holds(self, path: "Path", sha256: str) -> bool:
+        """Indica se o arquivo é um alias do objeto (mesmo inode ou mesmo conteúdo)."""
+        if not path.is_file():
+            return False
+        try:
+            if os.path.samefile(path, self.object_path(sha256)):
+                return True
+        except OSError:
+            pass
+        return file_sha256(path) == sha256
+
+    @staticmethod
+    def _link(source: "Path", target: "Path") -> None:
+        """Cria ``target`` apontando para ``source`` (hard link ou cópia), atomicamente."""
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+        os.close(fd)
+        os.unlink(tmp_name)
+        try:
+            try:
+                os.link(source, tmp_name)
+            except OSError:
+                shutil.copy2(source, tmp_name)
+            os.replace(tmp_name, target)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def _load(self) -> "tuple[dict[str, dict], dict[str, str]]":
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+            return dict(raw["objects"]), dict(raw["aliases"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return {}, {}
+
+    def _save(self) -> None:
+        """Grava o índice de forma atômica (temporário + rename)."""
+        data = {"objects": self._objects, "aliases": self._aliases}
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=2)
+        os.replace(tmp_name, self.index_path)